@@ -1,8 +1,47 @@
 # Import dependencies
 from .functions.orchestration import WorkflowScrapper
+from datetime import datetime, timedelta, timezone
 
-# List of repos to monitor
-REPOS = ["golf-ui-streamlit", "fantasy-premier-league", "play-cricket", "strava-ui-streamlit"]
+# Owner whose repositories are discovered and monitored
+OWNER = "powellrhys"
+
+# Repository discovery filters - archived repos and repos without a push in the last year are skipped
+DISCOVERY = {
+    "owner_type": "users",
+    "include": ["*"],
+    "exclude": [],
+    "pushed_since": datetime.now(timezone.utc) - timedelta(days=365)
+}
+
+# Number of concurrent workers used to collect repository and workflow data
+MAX_WORKERS = 8
+
+# Maximum number of runs collected per workflow
+MAX_RUNS = 1000
+
+# Only collect runs newer than the stored history of each workflow
+INCREMENTAL = True
+
+# Send conditional requests and skip workflows whose runs are unchanged since the last scrape
+USE_ETAG_CACHE = True
+
+# Collector used to fetch workflow runs - "rest" or "graphql"
+COLLECTOR = "rest"
+
+# Content encoding of uploaded blobs - "gzip", "zstd" or None for plain JSON
+BLOB_ENCODING = "gzip"
+
+# Also write a typed Parquet copy of every run history for the frontend (requires pyarrow)
+COLUMNAR = True
+
+# Store run histories as monthly partitions - "json", "parquet" or None for one blob per workflow
+PARTITION_FORMAT = None
+
+# Maintain daily and weekly rollups of every workflow and repository for trend charts
+ROLLUPS = True
 
 # Execute Workflow Scrapper Flow
-WorkflowScrapper(REPOS=REPOS).run()
+WorkflowScrapper(owner=OWNER, discovery=DISCOVERY, max_workers=MAX_WORKERS, max_runs=MAX_RUNS,
+                 incremental=INCREMENTAL, use_etag_cache=USE_ETAG_CACHE, collector=COLLECTOR,
+                 blob_encoding=BLOB_ENCODING, columnar=COLUMNAR, partition_format=PARTITION_FORMAT,
+                 rollups=ROLLUPS).run()
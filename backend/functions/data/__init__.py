@@ -1,4 +1,6 @@
 # Import dependencies
-from .github_client import GitHubClient
+from .github_client import GitHubClient, NotModified
+from .graphql_client import GraphQLGitHubClient
+from .rate_limiter import RateLimiter
 
-__all__ = ["GitHubClient"]
+__all__ = ["GitHubClient", "GraphQLGitHubClient", "NotModified", "RateLimiter"]
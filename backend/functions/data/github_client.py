@@ -1,29 +1,391 @@
 # Import dependencies
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+from requests.adapters import HTTPAdapter
 from ..logging import configure_logging
+from .rate_limiter import RateLimiter
+from urllib3.util.retry import Retry
+from typing import Iterator, Optional
 from datetime import datetime
-from typing import Optional
+from shared.functions.run_schema import to_utc_datetime
+from shared.models import WorkflowRun
+from fnmatch import fnmatch
+import pandas as pd
+import numpy as np
 import requests
 
+class NotModified(Exception):
+    """
+    Raised when a conditional GitHub API request returns 304 Not Modified, signalling
+    that the requested resource is unchanged since its validators were cached.
+    """
+    pass
+
 class GitHubClient:
     """
     A client for interacting with GitHub repositories using the GitHub REST API.
     Provides methods to list workflows, collect workflow metadata, calculate run durations,
     and aggregate workflow data for reporting or analysis.
     """
-    def __init__(self, GITHUB_TOKEN: str) -> None:
+    def __init__(
+        self,
+        GITHUB_TOKEN: str,
+        owner: str = "powellrhys",
+        session: Optional[requests.Session] = None,
+        pool_maxsize: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        per_page: int = 100,
+        etag_cache: Optional[dict] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_rate_limit_retries: int = 3
+    ) -> None:
         """
         Initialize the GitHubClient with a personal access token.
 
-        Args: GITHUB_TOKEN (str): GitHub personal access token used for authentication.
+        Args:
+            GITHUB_TOKEN (str): GitHub personal access token used for authentication.
+            owner (str): The user or organization owning the monitored repositories.
+            session (Optional[requests.Session]): An existing session to reuse. If None, a pooled
+                session is created with `create_session`.
+            pool_maxsize (int): Maximum number of keep-alive connections held per host.
+            max_retries (int): Number of retries for transient 5xx responses and connection errors.
+            backoff_factor (float): Base factor for exponential backoff between retries.
+            per_page (int): Number of items requested per page from paginated endpoints (max 100).
+            etag_cache (Optional[dict]): Mapping of cache keys to cached `ETag`/`Last-Modified`
+                validators. If set, workflow run requests are sent as conditional requests and
+                the cache is updated in place. If None, conditional requests are disabled.
+            rate_limiter (Optional[RateLimiter]): Scheduler every request goes through. If None, a
+                new RateLimiter is created. Share one instance between clients using the same token.
+            max_rate_limit_retries (int): Number of times a rate limited request is retried once the
+                limit lifts.
         """
         self.logger = configure_logging()
-        self.base_url = "https://api.github.com/repos/powellrhys"
+        self.owner = owner
+        self.base_url = f"https://api.github.com/repos/{owner}"
         self.HEADERS = {"Authorization": f"token {GITHUB_TOKEN}"}
+        self.per_page = per_page
+        self.etag_cache = etag_cache
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.session = session or self.create_session(pool_maxsize=pool_maxsize, max_retries=max_retries,
+                                                      backoff_factor=backoff_factor)
+
+    @staticmethod
+    def create_session(pool_maxsize: int = 10, max_retries: int = 3, backoff_factor: float = 0.5) -> requests.Session:
+        """
+        Create a keep-alive HTTP session with a connection pool and retry policy.
+
+        Transient server errors (500, 502, 503, 504) and connection resets are retried
+        with exponential backoff and random jitter, so concurrent workers do not retry
+        in lockstep.
+
+        Args:
+            pool_maxsize (int): Maximum number of keep-alive connections held per host.
+            max_retries (int): Number of retries for transient failures.
+            backoff_factor (float): Base factor for exponential backoff between retries.
+
+        Returns: requests.Session: A session with the pooled, retrying adapter mounted.
+        """
+        # Define retry policy for idempotent GET requests
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            backoff_jitter=backoff_factor,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["GET"],
+            raise_on_status=False
+        )
+
+        # Mount pooled adapter for https traffic
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize,
+                                              max_retries=retry))
+
+        return session
+
+    def paginate(
+        self,
+        url: str,
+        key: str,
+        params: Optional[dict] = None,
+        max_items: Optional[int] = None,
+        cache_key: Optional[str] = None
+    ) -> Iterator[list]:
+        """
+        Iterate over a paginated GitHub API collection one page at a time.
+
+        Requests `per_page` items per page and follows the `next` relation of the
+        `Link` header until the collection (or `max_items`) is exhausted. Only one
+        page is held in memory at a time.
+
+        Args:
+            url (str): The collection endpoint url.
+            key (str): The response key holding the page items (e.g. "workflow_runs").
+            params (Optional[dict]): Additional query parameters for the first request.
+            max_items (Optional[int]): Maximum number of items to yield. If None, all pages are read.
+            cache_key (Optional[str]): Key of the cached validators for the first page. If set and
+                the ETag cache is enabled, the first page is requested conditionally.
+
+        Yields: list: The items of each page.
+
+        Raises: NotModified: If the first page is unchanged since its validators were cached.
+        """
+        # Define first page query parameters
+        per_page = self.per_page if max_items is None else max(1, min(self.per_page, max_items))
+        params = {"per_page": per_page, **(params or {})}
+
+        # Send cached validators with the first page request only
+        headers = self.conditional_headers(cache_key=cache_key)
+
+        n_items = 0
+        while url:
+
+            # Execute page request
+            resp = self.request(url=url, headers=headers, params=params)
+            resp.raise_for_status()
+
+            # Short-circuit unchanged collections, otherwise cache the first page validators
+            if headers is not self.HEADERS:
+                if resp.status_code == 304:
+                    raise NotModified(url)
+                self.store_validators(cache_key=cache_key, resp=resp)
+                headers = self.HEADERS
+
+            # Collect page items, trimmed to the requested depth
+            page = resp.json().get(key, [])
+            if max_items is not None:
+                page = page[:max_items - n_items]
+            if not page:
+                return
+
+            n_items += len(page)
+            yield page
+
+            # Stop once the requested depth is reached
+            if max_items is not None and n_items >= max_items:
+                return
+
+            # Follow next page link, which already carries the query parameters
+            url = resp.links.get("next", {}).get("url")
+            params = None
+
+    def request(
+        self,
+        url: str,
+        headers: dict,
+        params: Optional[dict] = None,
+        payload: Optional[dict] = None
+    ) -> requests.Response:
+        """
+        Execute a request through the rate limiter.
+
+        A GET request is sent, or a POST request with a JSON body if a payload is given.
+        Requests rejected by a primary or secondary rate limit are retried once the
+        limit lifts, up to `max_rate_limit_retries` times.
+
+        Args:
+            url (str): The request url.
+            headers (dict): The request headers.
+            params (Optional[dict]): Query parameters.
+            payload (Optional[dict]): JSON body of a POST request.
+
+        Returns: requests.Response: The API response.
+        """
+        for attempt in range(self.max_rate_limit_retries + 1):
+
+            # Wait for a token against the quota of the request, execute request and update the live quota
+            self.rate_limiter.acquire(resource="graphql" if payload is not None else "core")
+            if payload is None:
+                resp = self.session.get(url, headers=headers, params=params, timeout=30)
+            else:
+                resp = self.session.post(url, headers=headers, json=payload, timeout=30)
+            self.rate_limiter.update(resp=resp)
+
+            # Return responses that were not rate limited
+            if not self.rate_limiter.is_rate_limited(resp=resp):
+                return resp
+            self.logger.warning(f"Rate limited by GitHub (attempt {attempt + 1}): {url}")
+
+        return resp
+
+    def conditional_headers(self, cache_key: Optional[str]) -> dict:
+        """
+        Build request headers carrying the cached validators for a cache key.
+
+        Args: cache_key (Optional[str]): Key of the cached validators.
+
+        Returns: dict: Request headers, or `HEADERS` itself if conditional requests are not used.
+        """
+        # Skip conditional requests if the cache is disabled or no key is given
+        if self.etag_cache is None or cache_key is None:
+            return self.HEADERS
+
+        # Add any cached validators to the authentication headers
+        cached = self.etag_cache.get(cache_key) or {}
+        headers = dict(self.HEADERS)
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        return headers
+
+    def store_validators(self, cache_key: str, resp: requests.Response) -> None:
+        """
+        Cache the `ETag` and `Last-Modified` validators of a response.
+
+        Args:
+            cache_key (str): Key under which the validators are cached.
+            resp (requests.Response): The response to collect validators from.
+        """
+        self.etag_cache[cache_key] = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified")
+        }
+
+    def forget_validators(self, repo: str, workflow: dict) -> None:
+        """
+        Drop the cached validators of a workflow's runs, e.g. after its data failed to be processed,
+        so the next scrape requests the runs unconditionally.
+
+        Args:
+            repo (str): The name of the GitHub repository.
+            workflow (dict): A workflow object obtained from the GitHub API.
+        """
+        if self.etag_cache is not None:
+            self.etag_cache.pop(self.workflow_runs_cache_key(repo=repo, workflow=workflow), None)
+
+    def workflow_runs_cache_key(self, repo: str, workflow: dict) -> str:
+        """
+        Build the validator cache key of a workflow's runs.
+
+        The workflow state is part of the key so that enabling or disabling a workflow
+        is picked up even when no new runs were recorded.
+
+        Args:
+            repo (str): The name of the GitHub repository.
+            workflow (dict): A workflow object obtained from the GitHub API.
+
+        Returns: str: The cache key.
+        """
+        return f"{self.base_url}/{repo}/actions/workflows/{workflow['id']}/runs#{workflow.get('state')}"
+
+    def discover_repositories(
+        self,
+        owner_type: str = "users",
+        include: Optional[list] = None,
+        exclude: Optional[list] = None,
+        pushed_since: Optional[datetime] = None,
+        max_workers: int = 8
+    ) -> list:
+        """
+        Discover the repositories of the owner through the paginated repository listing endpoint.
+
+        The first page is requested to learn the page count from the `last` relation of the
+        `Link` header; the remaining pages are then requested concurrently. Archived and
+        disabled repositories, and repositories not pushed to since `pushed_since`, are skipped
+        without any further request.
+
+        Args:
+            owner_type (str): "users" for a user account or "orgs" for an organization.
+            include (Optional[list]): Glob patterns a repository name must match. If None, all names match.
+            exclude (Optional[list]): Glob patterns of repository names to skip.
+            pushed_since (Optional[datetime]): Skip repositories without a push since this (timezone aware) time.
+            max_workers (int): Number of worker threads used to request the remaining pages.
+
+        Returns: list: The sorted names of the discovered repositories.
+        """
+        # Define repository listing url and parameters
+        repos_url = f"https://api.github.com/{owner_type}/{self.owner}/repos"
+        params = {"per_page": self.per_page, "type": "owner" if owner_type == "users" else "all"}
+
+        # Request the first page and derive the page count
+        resp = self.request(url=repos_url, headers=self.HEADERS, params=params)
+        resp.raise_for_status()
+        repos = resp.json()
+        last_url = resp.links.get("last", {}).get("url")
+        n_pages = int(parse_qs(urlparse(last_url).query)["page"][0]) if last_url else 1
+
+        # Request the remaining pages concurrently
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="discovery") as executor:
+            pages = executor.map(lambda page: self.request_json(url=repos_url, params={**params, "page": page}),
+                                 range(2, n_pages + 1))
+            for page in pages:
+                repos.extend(page)
+
+        return sorted(
+            repo["name"] for repo in repos
+            if self.is_monitored_repository(repo=repo, include=include, exclude=exclude, pushed_since=pushed_since)
+        )
+
+    def request_json(self, url: str, params: Optional[dict] = None) -> list:
+        """
+        Execute a GET request and return its decoded JSON body.
+
+        Args:
+            url (str): The request url.
+            params (Optional[dict]): Query parameters.
+
+        Returns: list: The decoded response body.
+        """
+        resp = self.request(url=url, headers=self.HEADERS, params=params)
+        resp.raise_for_status()
+        return resp.json()
+
+    @staticmethod
+    def is_monitored_repository(
+        repo: dict,
+        include: Optional[list] = None,
+        exclude: Optional[list] = None,
+        pushed_since: Optional[datetime] = None
+    ) -> bool:
+        """
+        Determine whether a discovered repository should be monitored.
+
+        Args:
+            repo (dict): A repository object from the GitHub API.
+            include (Optional[list]): Glob patterns a repository name must match. If None, all names match.
+            exclude (Optional[list]): Glob patterns of repository names to skip.
+            pushed_since (Optional[datetime]): Skip repositories without a push since this (timezone aware) time.
+
+        Returns: bool: True if the repository should be monitored.
+        """
+        # Skip repositories which cannot run workflows
+        if repo.get("archived") or repo.get("disabled"):
+            return False
+
+        # Skip repositories without recent pushes
+        pushed_at = repo.get("pushed_at")
+        if pushed_since and (not pushed_at or datetime.fromisoformat(pushed_at.replace("Z", "+00:00")) < pushed_since):
+            return False
+
+        # Apply include and exclude name filters
+        name = repo["name"]
+        return any(fnmatch(name, pattern) for pattern in include or ["*"]) \
+            and not any(fnmatch(name, pattern) for pattern in exclude or [])
+
+    def workflows_cache_key(self, repo: str) -> str:
+        """
+        Build the validator cache key of a repository's workflow listing.
+
+        Args: repo (str): The name of the GitHub repository.
+
+        Returns: str: The cache key.
+        """
+        return f"{self.base_url}/{repo}/actions/workflows"
 
     def list_repository_workflows(self, repo: str) -> list:
         """
         Retrieve a list of workflows configured in the specified repository.
 
+        If the ETag cache is enabled, the listing is requested conditionally and cached
+        with its validators, so an unchanged listing is served from the cache on a 304
+        response.
+
         Args: repo (str): The name of the GitHub repository.
 
         Returns: list: A list of workflow objects from the GitHub API response.
@@ -31,33 +393,67 @@ class GitHubClient:
 
         # Define request url
         workflows_url = f"{self.base_url}/{repo}/actions/workflows"
+        cache_key = self.workflows_cache_key(repo=repo)
 
-        # Execute request
-        workflows_resp = requests.get(workflows_url, headers=self.HEADERS, timeout=30)
-        workflows_resp.raise_for_status()
+        # Drop validators cached without their listing, so the listing is requested unconditionally
+        if self.etag_cache is not None and "workflows" not in self.etag_cache.get(cache_key, {}):
+            self.etag_cache.pop(cache_key, None)
 
-        # Collect workflow data
-        return workflows_resp.json().get("workflows", [])
+        # Collect workflow data across all pages, or reuse the cached listing if unchanged
+        try:
+            workflows = [wf for page in self.paginate(url=workflows_url, key="workflows", cache_key=cache_key)
+                         for wf in page]
+        except NotModified:
+            return self.etag_cache[cache_key]["workflows"]
 
-    def collect_workflow_metadata(self, repo: str, workflow: dict) -> dict:
+        # Cache the listing with the validators of its first page
+        if self.etag_cache is not None:
+            self.etag_cache[cache_key]["workflows"] = workflows
+
+        return workflows
+
+    def iter_workflow_run_pages(
+        self,
+        repo: str,
+        workflow: dict,
+        max_runs: Optional[int] = None,
+        created_since: Optional[str] = None
+    ) -> Iterator[list]:
         """
-        Collect metadata for all runs of a given workflow in a repository.
+        Iterate over the runs of a given workflow one page at a time, newest first.
 
         Args:
             repo (str): The name of the GitHub repository.
             workflow (dict): A workflow object obtained from the GitHub API.
+            max_runs (Optional[int]): Maximum history depth to collect. If None, all runs are collected.
+            created_since (Optional[str]): ISO 8601 timestamp. If set, only runs created at or after
+                this time are requested using the `created>=` filter.
+
+        Yields: list: A page of workflow run objects from the GitHub API.
 
-        Returns: dict: A dictionary containing metadata for each workflow run.
+        Raises: NotModified: If conditional requests are enabled and the runs are unchanged.
         """
-        # Define runs endpoint url
+        # Define runs endpoint url and optional creation date filter
         runs_url = f"{self.base_url}/{repo}/actions/workflows/{workflow['id']}/runs"
+        params = {"created": f">={created_since}"} if created_since else None
+
+        # Stream workflow runs page by page
+        yield from self.paginate(url=runs_url, key="workflow_runs", params=params, max_items=max_runs,
+                                 cache_key=self.workflow_runs_cache_key(repo=repo, workflow=workflow))
+
+    def collect_workflow_metadata(self, repo: str, workflow: dict, max_runs: Optional[int] = None) -> list:
+        """
+        Collect metadata for all runs of a given workflow in a repository.
 
-        # Execute workflows runs request
-        runs_resp = requests.get(runs_url, headers=self.HEADERS)
-        runs_resp.raise_for_status()
+        Args:
+            repo (str): The name of the GitHub repository.
+            workflow (dict): A workflow object obtained from the GitHub API.
+            max_runs (Optional[int]): Maximum history depth to collect. If None, all runs are collected.
 
-        # Collect workflow runs data
-        return runs_resp.json().get("workflow_runs", [])
+        Returns: list: A list containing metadata for each workflow run.
+        """
+        return [run for page in self.iter_workflow_run_pages(repo=repo, workflow=workflow, max_runs=max_runs)
+                for run in page]
 
     def workflow_duration(self, run: dict) -> Optional[int]:
         """
@@ -82,31 +478,66 @@ class GitHubClient:
 
         return duration_seconds
 
+    def workflow_durations(self, workflow_runs: list) -> list:
+        """
+        Calculate the durations of many workflow runs in seconds in a single vectorized pass.
+
+        The start and end timestamps of every run are parsed as whole columns with
+        `to_utc_datetime`, which reads GitHub's "Z" timestamps natively with numpy, and
+        subtracted in one step. Runs whose timestamps are missing or invalid fall back to
+        `workflow_duration`, so they are resolved and logged exactly as on the per-run path.
+
+        Args: workflow_runs (list): A list of workflow run objects from the GitHub API.
+
+        Returns: list: Duration of each workflow run in seconds, or None if unavailable.
+        """
+        if not workflow_runs:
+            return []
+
+        # Parse start and end timestamps as whole columns
+        start_times = to_utc_datetime(timestamps=pd.Series(
+            [run.get("run_started_at") or run.get("created_at") for run in workflow_runs], dtype=object
+        ), errors="coerce")
+        end_times = to_utc_datetime(timestamps=pd.Series(
+            [run.get("updated_at") for run in workflow_runs], dtype=object
+        ), errors="coerce")
+        durations = (end_times - start_times).dt.total_seconds().to_numpy()
+
+        # Resolve and log unparsed runs on the per-run path
+        results = durations.tolist()
+        for i in np.flatnonzero(np.isnan(durations)):
+            results[i] = self.workflow_duration(run=workflow_runs[i])
+
+        return results
+
     def aggregate_workflow_data(self, repo: str, wf_name: str, workflow_runs: list, state: str) -> list:
         """
-        Aggregate workflow run data into a simplified list of dictionaries.
+        Aggregate workflow run data into a simplified list of run records.
 
         Args:
             repo (str): The name of the GitHub repository.
             wf_name (str): The name of the workflow.
             workflow_runs (list): A list of workflow run objects.
 
-        Returns: list: A list of dictionaries containing summarized workflow run data.
+        Returns: list: A list of WorkflowRun records containing summarized workflow run data.
         """
+        # Calculate durations of all runs in bulk
+        durations = self.workflow_durations(workflow_runs=workflow_runs)
+
         # Iterate through each run and simplify output
         all_runs = []
-        for run in workflow_runs:
-            all_runs.append({
-                "repo": repo,
-                "workflow_name": wf_name,
-                "active_status": state,
-                "status": run.get("status"),
-                "conclusion": run.get("conclusion"),
-                "created_at": run.get("created_at"),
-                "updated_at": run.get("updated_at"),
-                "run_number": run.get("run_number"),
-                "html_url": run.get("html_url"),
-                "duration_seconds": self.workflow_duration(run=run)
-            })
+        for run, duration_seconds in zip(workflow_runs, durations):
+            all_runs.append(WorkflowRun(
+                repo=repo,
+                workflow_name=wf_name,
+                active_status=state,
+                status=run.get("status"),
+                conclusion=run.get("conclusion"),
+                created_at=run.get("created_at"),
+                updated_at=run.get("updated_at"),
+                run_number=run.get("run_number"),
+                html_url=run.get("html_url"),
+                duration_seconds=duration_seconds
+            ))
 
         return all_runs
@@ -0,0 +1,204 @@
+# Import dependencies
+from typing import Iterator, Optional
+from .github_client import GitHubClient
+import requests
+
+# Fields collected for every workflow run
+WORKFLOW_RUN_FIELDS = """
+fragment RunFields on WorkflowRun {
+  runNumber
+  createdAt
+  updatedAt
+  url
+  checkSuite { status conclusion }
+}
+"""
+
+class GraphQLGitHubClient(GitHubClient):
+    """
+    A GitHubClient that collects workflow runs through the GitHub GraphQL API.
+
+    Workflows are still listed through the REST API (one request per repository), but
+    the runs of all workflows of a repository are then fetched in batched GraphQL queries
+    using the workflows' node ids, instead of one REST request per workflow. Batches do
+    not span repositories, as each repository is listed when it is scraped. Further pages
+    are requested lazily with cursor pagination. Runs are normalised into the shape of
+    REST run objects, so `aggregate_workflow_data` produces the same records for either client.
+    """
+    def __init__(self, *args, batch_size: int = 20, **kwargs) -> None:
+        """
+        Initialize the GraphQLGitHubClient.
+
+        Args:
+            *args: Positional arguments passed to `GitHubClient`.
+            batch_size (int): Maximum number of workflows fetched in a single GraphQL query.
+            **kwargs: Keyword arguments passed to `GitHubClient`.
+        """
+        super().__init__(*args, **kwargs)
+        self.graphql_url = "https://api.github.com/graphql"
+        self.batch_size = batch_size
+        self.prefetched: dict = {}
+
+    def graphql(self, query: str, variables: dict) -> dict:
+        """
+        Execute a GraphQL query.
+
+        Args:
+            query (str): The GraphQL query document.
+            variables (dict): The query variables.
+
+        Returns: dict: The `data` object of the response.
+
+        Raises: requests.exceptions.HTTPError: If the request fails or the response contains errors.
+        """
+        resp = self.request(url=self.graphql_url, headers=self.HEADERS,
+                            payload={"query": query, "variables": variables})
+        resp.raise_for_status()
+
+        # GraphQL reports query errors with a 200 status code
+        body = resp.json()
+        if body.get("errors"):
+            raise requests.exceptions.HTTPError(f"GraphQL query failed: {body['errors']}", response=resp)
+
+        return body["data"]
+
+    def query_workflow_runs(self, cursors: list, first: int) -> dict:
+        """
+        Fetch a page of runs for many workflows in a single GraphQL query.
+
+        Args:
+            cursors (list): Tuples of workflow node id and the cursor to continue after (None for the first page).
+            first (int): Number of runs requested per workflow.
+
+        Returns: dict: The runs connection (`nodes` and `pageInfo`) of each workflow, keyed by node id.
+        """
+        # Build one aliased node lookup per workflow, each with its own cursor
+        declarations, selections, variables = ["$first: Int!"], [], {"first": first}
+        for i, (node_id, after) in enumerate(cursors):
+            declarations += [f"$id{i}: ID!", f"$after{i}: String"]
+            selections.append(
+                f"w{i}: node(id: $id{i}) {{ ... on Workflow {{ "
+                f"runs(first: $first, after: $after{i}, orderBy: {{field: CREATED_AT, direction: DESC}}) {{ "
+                f"pageInfo {{ hasNextPage endCursor }} nodes {{ ...RunFields }} }} }} }}"
+            )
+            variables.update({f"id{i}": node_id, f"after{i}": after})
+
+        query = f"query({', '.join(declarations)}) {{\n" + "\n".join(selections) + "\n}\n" + WORKFLOW_RUN_FIELDS
+        data = self.graphql(query=query, variables=variables)
+
+        return {node_id: (data.get(f"w{i}") or {}).get("runs") or {"nodes": [], "pageInfo": {}}
+                for i, (node_id, _) in enumerate(cursors)}
+
+    def prefetch_workflow_runs(self, repo: str, workflows: list) -> None:
+        """
+        Fetch the first page of runs for the workflows of a repository, in batches of
+        `batch_size` workflows per query.
+
+        First pages prefetched by an earlier listing of the repository are replaced, so
+        pages that were never used are not served later.
+
+        Args:
+            repo (str): The name of the GitHub repository.
+            workflows (list): Workflow objects of the repository obtained from the GitHub API.
+        """
+        node_ids = [wf["node_id"] for wf in workflows]
+        prefetched = {}
+        for i in range(0, len(node_ids), self.batch_size):
+            batch = [(node_id, None) for node_id in node_ids[i:i + self.batch_size]]
+            prefetched.update(self.query_workflow_runs(cursors=batch, first=self.per_page))
+
+        self.prefetched[repo] = prefetched
+
+    def list_repository_workflows(self, repo: str) -> list:
+        """
+        Retrieve the workflows of a repository and prefetch the first page of runs of
+        all of them in batched GraphQL queries.
+
+        Args: repo (str): The name of the GitHub repository.
+
+        Returns: list: A list of workflow objects from the GitHub API response.
+        """
+        workflows = super().list_repository_workflows(repo=repo)
+        self.prefetch_workflow_runs(repo=repo, workflows=workflows)
+
+        return workflows
+
+    def iter_workflow_run_pages(
+        self,
+        repo: str,
+        workflow: dict,
+        max_runs: Optional[int] = None,
+        created_since: Optional[str] = None
+    ) -> Iterator[list]:
+        """
+        Iterate over the runs of a given workflow one page at a time, newest first.
+
+        The first page is served, once, from the prefetched batch of the repository when
+        available. Runs created
+        before `created_since` are dropped client side, as the GraphQL connection has no
+        creation date filter.
+
+        Args:
+            repo (str): The name of the GitHub repository.
+            workflow (dict): A workflow object obtained from the GitHub API.
+            max_runs (Optional[int]): Maximum history depth to collect. If None, all runs are collected.
+            created_since (Optional[str]): ISO 8601 timestamp. If set, only runs created at or after
+                this time are yielded.
+
+        Yields: list: A page of workflow run objects, normalised to the REST API shape.
+        """
+        # Take the prefetched first page, forgetting the repository once all its pages are used
+        node_id = workflow["node_id"]
+        prefetched = self.prefetched.get(repo, {})
+        connection = prefetched.pop(node_id, None)
+        if not prefetched:
+            self.prefetched.pop(repo, None)
+        if connection is None:
+            connection = self.query_workflow_runs(cursors=[(node_id, None)], first=self.per_page)[node_id]
+
+        n_runs = 0
+        while True:
+
+            # Normalise runs and apply the creation date and depth limits
+            page = [self.normalise_workflow_run(node=node) for node in connection.get("nodes") or []]
+            n_page = len(page)
+            if created_since:
+                page = [run for run in page if run["created_at"] >= created_since]
+            if max_runs is not None:
+                page = page[:max_runs - n_runs]
+            if not page:
+                return
+
+            n_runs += len(page)
+            yield page
+
+            # Stop at the last page, the depth limit or the creation date cutoff
+            page_info = connection.get("pageInfo") or {}
+            if not page_info.get("hasNextPage") or len(page) < n_page:
+                return
+
+            connection = self.query_workflow_runs(cursors=[(node_id, page_info["endCursor"])],
+                                                  first=self.per_page)[node_id]
+
+    @staticmethod
+    def normalise_workflow_run(node: dict) -> dict:
+        """
+        Normalise a GraphQL workflow run into the shape of a REST API workflow run object.
+
+        GraphQL does not expose `run_started_at`, so it is set to `createdAt`; durations
+        therefore match the REST client for every run except re-run attempts.
+
+        Args: node (dict): A `WorkflowRun` node from the GraphQL API.
+
+        Returns: dict: The run with the REST API field names and lower case status values.
+        """
+        check_suite = node.get("checkSuite") or {}
+        return {
+            "status": (check_suite.get("status") or "").lower() or None,
+            "conclusion": (check_suite.get("conclusion") or "").lower() or None,
+            "created_at": node.get("createdAt"),
+            "updated_at": node.get("updatedAt"),
+            "run_started_at": node.get("createdAt"),
+            "run_number": node.get("runNumber"),
+            "html_url": node.get("url")
+        }
@@ -0,0 +1,243 @@
+# Import dependencies
+from dataclasses import dataclass
+from typing import Dict, Optional
+import threading
+import requests
+import time
+
+# Rate limit resource of responses without an `X-RateLimit-Resource` header
+DEFAULT_RESOURCE = "core"
+
+# Seconds waited after a secondary rate limit response without `Retry-After`, as advised by GitHub
+SECONDARY_LIMIT_BACKOFF = 60
+
+@dataclass(slots=True)
+class QuotaWindow:
+    """
+    The live primary quota of one GitHub rate limit resource (e.g. "core" or "graphql").
+
+    Attributes:
+        limit (Optional[int]): The quota of the window.
+        remaining (Optional[int]): The lowest remaining quota observed in the window.
+        reset_at (Optional[int]): Epoch seconds at which the window resets.
+        window_start (Optional[int]): Remaining quota when the window was first observed.
+        banked (int): Quota used in earlier windows.
+        rate (Optional[float]): Paced request rate, or None if requests are not paced.
+        blocked_until (float): Epoch seconds until which requests against the resource are paused.
+    """
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset_at: Optional[int] = None
+    window_start: Optional[int] = None
+    banked: int = 0
+    rate: Optional[float] = None
+    blocked_until: float = 0.0
+
+    def used(self) -> int:
+        """
+        Calculate the quota used since the resource was first observed.
+
+        Returns: int: Number of requests counted against the quota.
+        """
+        if self.window_start is None or self.remaining is None:
+            return self.banked
+        return self.banked + self.window_start - self.remaining
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket used to schedule GitHub API requests against the live rate limit.
+
+    Every request takes a token before it is sent. Tokens refill at `max_rate` per second,
+    which keeps concurrent workers below GitHub's secondary rate limits. The primary quota
+    (from the `X-RateLimit-*` response headers) is tracked per `X-RateLimit-Resource`, so the
+    REST and GraphQL quotas do not overwrite each other. Once the remaining quota of a resource
+    drops below `pace_below` of its limit, the refill rate is lowered so the remaining budget
+    lasts until the quota resets, and requests against an exhausted resource are paused until
+    it resets. Secondary rate limit responses pause all workers for `Retry-After`, or 60
+    seconds if GitHub gives no delay. Request and quota usage are recorded for reporting.
+    """
+    def __init__(
+        self,
+        max_rate: float = 10.0,
+        burst: int = 10,
+        pace_below: float = 0.2,
+        reserve: int = 50,
+        max_wait: float = 900.0
+    ) -> None:
+        """
+        Initialize the RateLimiter.
+
+        Args:
+            max_rate (float): Maximum sustained number of requests per second.
+            burst (int): Maximum number of requests that may be sent back to back.
+            pace_below (float): Fraction of the quota below which requests are paced to last until the reset.
+            reserve (int): Number of requests of the quota left untouched for other clients of the token.
+            max_wait (float): Maximum number of seconds slept in a single wait.
+        """
+        self.max_rate = max_rate
+        self.capacity = burst
+        self.pace_below = pace_below
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self.lock = threading.Lock()
+
+        # Token bucket state, and the pause applied to every resource by secondary rate limits
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.blocked_until = 0.0
+
+        # Live quota per rate limit resource and usage statistics
+        self.quotas: Dict[str, QuotaWindow] = {}
+        self.requests = 0
+        self.throttled = 0
+        self.waited_seconds = 0.0
+
+    @property
+    def rate(self) -> float:
+        """
+        The refill rate of the token bucket, paced to the most constrained resource.
+
+        Returns: float: Requests per second.
+        """
+        return min([self.max_rate] + [quota.rate for quota in self.quotas.values() if quota.rate is not None])
+
+    def acquire(self, resource: Optional[str] = None) -> None:
+        """
+        Block until a request may be sent, then consume a token.
+
+        Args: resource (Optional[str]): The rate limit resource the request counts against, if known.
+        """
+        while True:
+            with self.lock:
+                now = time.time()
+                quota = self.quotas.get(resource or DEFAULT_RESOURCE)
+                wait = max(self.blocked_until, quota.blocked_until if quota is not None else 0.0) - now
+
+                # Refill the bucket and take a token if the limiter is not paused
+                if wait <= 0:
+                    rate = self.rate
+                    monotonic_now = time.monotonic()
+                    self.tokens = min(self.capacity, self.tokens + (monotonic_now - self.last_refill) * rate)
+                    self.last_refill = monotonic_now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        self.requests += 1
+                        return
+                    wait = (1 - self.tokens) / rate if rate > 0 else self.max_wait
+
+                wait = min(wait, self.max_wait)
+                self.waited_seconds += wait
+
+            # Sleep outside the lock so other workers can update the limiter
+            time.sleep(wait)
+
+    def update(self, resp: requests.Response) -> None:
+        """
+        Update the live quota and pacing from the rate limit headers of a response.
+
+        Args: resp (requests.Response): A GitHub API response.
+        """
+        limit = self.header_int(resp=resp, name="X-RateLimit-Limit")
+        remaining = self.header_int(resp=resp, name="X-RateLimit-Remaining")
+        reset_at = self.header_int(resp=resp, name="X-RateLimit-Reset")
+        retry_after = self.header_int(resp=resp, name="Retry-After")
+
+        with self.lock:
+            now = time.time()
+
+            # Pause all workers for secondary rate limits, for at least a minute if GitHub gives no delay
+            if self.is_rate_limited(resp=resp):
+                self.throttled += 1
+                if retry_after is None and remaining != 0:
+                    retry_after = SECONDARY_LIMIT_BACKOFF
+            if retry_after is not None:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+
+            # Skip responses without primary quota headers
+            if remaining is None or reset_at is None:
+                return
+
+            # Start a new window, banking quota used in the previous one, when the quota resets
+            quota = self.quotas.setdefault(resp.headers.get("X-RateLimit-Resource") or DEFAULT_RESOURCE, QuotaWindow())
+            if reset_at != quota.reset_at:
+                quota.banked = quota.used()
+                quota.window_start, quota.remaining = remaining + 1, remaining
+
+            # Record live quota, keeping the lowest remaining value of out-of-order responses
+            quota.limit, quota.reset_at = limit, reset_at
+            quota.remaining = min(quota.remaining, remaining)
+
+            # Pause requests against the resource until the reset once the usable budget is spent
+            usable = quota.remaining - self.reserve
+            if usable <= 0:
+                quota.blocked_until = max(quota.blocked_until, reset_at + 1)
+                return
+
+            # Spread the remaining budget over the reset window when the quota runs low
+            if limit and quota.remaining < limit * self.pace_below:
+                quota.rate = min(self.max_rate, usable / max(1, reset_at - now))
+            else:
+                quota.rate = None
+
+    def is_rate_limited(self, resp: requests.Response) -> bool:
+        """
+        Determine whether a response was rejected by a primary or secondary rate limit.
+
+        Args: resp (requests.Response): A GitHub API response.
+
+        Returns: bool: True if the request should be retried once the limit lifts.
+        """
+        if resp.status_code == 429:
+            return True
+        if resp.status_code != 403:
+            return False
+        return self.header_int(resp=resp, name="Retry-After") is not None \
+            or self.header_int(resp=resp, name="X-RateLimit-Remaining") == 0 \
+            or self.is_secondary_limit(resp=resp)
+
+    @staticmethod
+    def is_secondary_limit(resp: requests.Response) -> bool:
+        """
+        Determine whether a response body reports a secondary rate limit.
+
+        Args: resp (requests.Response): A GitHub API response.
+
+        Returns: bool: True if GitHub reports that a secondary rate limit was exceeded.
+        """
+        text = getattr(resp, "text", None)
+        return isinstance(text, str) and "secondary rate limit" in text.lower()
+
+    def summary(self) -> dict:
+        """
+        Summarise the requests sent and quota used since the limiter was created.
+
+        Returns: dict: Request count, quota used across resources, the lowest remaining quota and the
+            remaining quota of every resource, throttled responses and seconds waited.
+        """
+        with self.lock:
+            remaining = {resource: quota.remaining for resource, quota in self.quotas.items()}
+            return {
+                "requests": self.requests,
+                "quota_used": sum(quota.used() for quota in self.quotas.values()),
+                "quota_remaining": min(remaining.values(), default=None),
+                "resources": remaining,
+                "throttled": self.throttled,
+                "waited_seconds": round(self.waited_seconds, 1)
+            }
+
+    @staticmethod
+    def header_int(resp: requests.Response, name: str) -> Optional[int]:
+        """
+        Read an integer response header.
+
+        Args:
+            resp (requests.Response): A GitHub API response.
+            name (str): The header name.
+
+        Returns: Optional[int]: The header value, or None if missing or not an integer.
+        """
+        try:
+            return int(resp.headers[name])
+        except (KeyError, TypeError, ValueError):
+            return None
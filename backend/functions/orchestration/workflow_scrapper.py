@@ -1,25 +1,103 @@
 # Import dependencies
-from shared import BlobClient, Variables
+from concurrent.futures import ThreadPoolExecutor, Executor, CancelledError
+from azure.core.exceptions import ResourceNotFoundError
+from shared import BlobClient, Variables, WorkflowRun, MANIFEST_FILENAME, build_manifest_entry, \
+    check_columnar, columnar_blob_name, PartitionedRunStore, RollupStore
+from shared.functions.blob_encoding import check_encoding
 from ..logging import configure_logging
-from ..data import GitHubClient
+from typing import Optional, Union
+from ..data import GitHubClient, GraphQLGitHubClient, NotModified
+from datetime import datetime, timedelta
+import threading
 import requests
 import json
 
+# Blob holding the cached GitHub API validators between scrapes
+ETAG_CACHE_FILENAME = "cache/etags.json"
+
+# Maximum lifetime of a GitHub Actions workflow run, after which GitHub cancels it
+MAX_RUN_DAYS = 35
+
 class WorkflowScrapper(BlobClient):
     """
     A utility class for collecting and storing GitHub Actions workflow data
     across multiple repositories. Uses the GitHubClient to fetch workflow
     details, run metadata, and durations, and saves the results to JSON files.
+    A compact manifest holding the latest run of every workflow is maintained
+    alongside them, so readers need not download every run history. Blobs whose
+    content is unchanged since the last scrape are not uploaded again. Daily and
+    weekly rollups of every workflow and repository can be maintained from the new
+    runs of each scrape.
     """
-    def __init__(self, REPOS: list) -> None:
+    def __init__(
+        self,
+        REPOS: Optional[list] = None,
+        owner: str = "powellrhys",
+        discovery: Optional[dict] = None,
+        max_workers: int = 1,
+        max_runs: Optional[int] = None,
+        incremental: bool = False,
+        use_etag_cache: bool = False,
+        collector: str = "rest",
+        blob_encoding: Optional[str] = None,
+        columnar: bool = False,
+        partition_format: Optional[str] = None,
+        rollups: bool = False
+    ) -> None:
         """
         Initialize the WorkflowScrapper with a list of repositories to process.
 
-        Args: REPOS (list): A list of repository names to collect workflow data from.
+        Args:
+            REPOS (Optional[list]): A list of repository names to collect workflow data from. If None,
+                the repositories of `owner` are discovered at the start of each run.
+            owner (str): The user or organization owning the repositories.
+            discovery (Optional[dict]): Keyword arguments passed to `GitHubClient.discover_repositories`
+                (e.g. owner_type, include, exclude, pushed_since) when repositories are discovered.
+            max_workers (int): Number of worker threads used to fan out repositories and
+                workflows. A value of 1 (the default) processes everything sequentially.
+            max_runs (Optional[int]): Maximum run history depth collected per workflow. If None,
+                the complete run history is collected.
+            incremental (bool): If True, only runs newer than the stored history are requested
+                and merged into the existing workflow blob.
+            use_etag_cache (bool): If True, workflow listings and runs are requested conditionally
+                using validators persisted in the `project-monitoring` container, unchanged listings
+                are served from that cache and workflows whose runs are unchanged are skipped entirely.
+            collector (str): "rest" to collect runs with one REST request per workflow, or "graphql"
+                to collect the runs of all workflows of a repository in batched GraphQL queries.
+            blob_encoding (Optional[str]): Compress uploaded blobs with "gzip" or "zstd". Stored blobs
+                are decoded transparently whatever their encoding.
+            columnar (bool): If True, a typed Parquet copy of every exported run history is also
+                written to the `columnar` directory, for fast DataFrame loading by the frontend.
+            partition_format (Optional[str]): If "json" or "parquet", run histories are stored as monthly
+                partitions in the `runs` directory instead of one blob per workflow, so a scrape only
+                rewrites the partitions holding new runs. The `columnar` copy is not written in this mode.
+            rollups (bool): If True, daily and weekly rollups of run counts, success and failure rates
+                and duration percentiles are updated from the new runs of every workflow and repository,
+                in the `rollups` directory.
         """
         self.logger = configure_logging()
         self.REPOS = REPOS
+        self.owner = owner
+        self.discovery = discovery or {}
+        self.max_workers = max_workers
+        self.max_runs = max_runs
+        self.incremental = incremental
+        self.use_etag_cache = use_etag_cache
+        self.collector = collector
         self.vars = Variables()
+        self.pool_maxsize = max(10, 2 * max_workers)
+        check_encoding(encoding=blob_encoding)
+        self.encoding = blob_encoding
+        if columnar:
+            check_columnar()
+        self.columnar = columnar
+        self.run_store = PartitionedRunStore(client=self, partition_format=partition_format) \
+            if partition_format else None
+        self.rollup_store = RollupStore(client=self) if rollups else None
+        self.rollup_repos: set = set()
+        self.manifest: Optional[dict] = None
+        self.manifest_changed = False
+        self.manifest_lock = threading.RLock()
 
     def run(self) -> None:
         """
@@ -27,50 +105,539 @@ class WorkflowScrapper(BlobClient):
 
         Iterates through each repository, fetches workflow and run data using the
         GitHubClient, and writes the aggregated results to JSON files. Handles API
-        and data processing errors gracefully, logging progress and issues.
+        and data processing errors gracefully, logging progress and issues. When
+        `max_workers` is greater than 1, repositories and their workflows are
+        processed concurrently on thread pools; blob output is identical to the
+        sequential path as every workflow is written to its own blob.
         """
         # Iterate through each repo and collect workflow data
         self.logger.info("Running Workflow Scrapping flow \n")
-        for repo_i, repo in enumerate(iterable=self.REPOS, start=1):
 
-            try:
-                # Log progress message
-                self.logger.info(f"{repo_i}/{len(self.REPOS)} - Collecting workflow data for repo: {repo}... \n")
+        # Reset the manifest, which is loaded on first update, the rollup rebuilds and the upload counts
+        self.manifest, self.manifest_changed = None, False
+        self.rollup_repos = set()
+        self.reset_upload_stats()
 
-                # Define GithubClient class
-                client = GitHubClient(GITHUB_TOKEN=self.vars.GITHUB_TOKEN)
-                workflows = client.list_repository_workflows(repo=repo)
+        # Load cached validators from the previous scrape
+        etag_cache = self.read_stored_blob(input_filename=ETAG_CACHE_FILENAME, default={}) \
+            if self.use_etag_cache else None
 
-                # Log status of collected data
-                self.logger.info(f"{len(workflows)} workflows identified within {repo}: "
-                                 f"{[wf['name'] for wf in workflows]} \n")
+        # Define a single GithubClient so the pooled session is shared by every repo and worker
+        client_class = GraphQLGitHubClient if self.collector == "graphql" else GitHubClient
+        client = client_class(GITHUB_TOKEN=self.vars.GITHUB_TOKEN, owner=self.owner,
+                              pool_maxsize=self.pool_maxsize, etag_cache=etag_cache)
 
-                # Iterate through each workflow and log status message
-                for wf_i, wf in enumerate(iterable=workflows, start=1):
-                    self.logger.info(f"{wf_i}/{len(workflows)} - Collecting workflow run data for {wf['name']}...")
+        # Discover repositories if none are configured
+        repos = self.REPOS
+        if repos is None:
+            repos = client.discover_repositories(max_workers=self.max_workers, **self.discovery)
+            self.logger.info(f"{len(repos)} repositories discovered for {self.owner}: {repos} \n")
 
-                    try:
-                        wf_state = wf.get("state")
-                        wf_runs = client.collect_workflow_metadata(repo=repo, workflow=wf)
-                        self.logger.info(f"{len(wf_runs)} workflow runs recorded for {wf['name']}. Last run recorded "
-                                         f"at {wf_runs[0]['run_started_at']} | Status: {wf_runs[0]['conclusion']} \n")
+        self.scrape_repositories(client=client, repos=repos)
 
-                        wf_runs = client.aggregate_workflow_data(repo=repo, wf_name=wf["name"],
-                                                                 workflow_runs=wf_runs, state=wf_state)
+        # Report GitHub API usage of the scrape
+        usage = client.rate_limiter.summary()
+        self.logger.info(f"GitHub API usage: {usage['requests']} requests, {usage['quota_used']} quota used, "
+                         f"{usage['quota_remaining']} remaining, {usage['throttled']} throttled, "
+                         f"{usage['waited_seconds']}s waited \n")
 
-                        # Export data to blob storage
-                        self.export_dict_to_blob(data=wf_runs, container="project-monitoring",
-                                                 output_filename=f"workflows/{repo}_{wf['name']}.json")
+        # Publish the latest run manifest in a single upload
+        if self.manifest_changed:
+            self.export_dict_to_blob(data=self.manifest, container="project-monitoring",
+                                     output_filename=MANIFEST_FILENAME)
 
-                    except requests.exceptions.RequestException as e:
-                        self.logger.exception(f"Error fetching data for {wf['name']}: {e}")
-                        break
+        # Persist validators for the next scrape
+        if etag_cache is not None:
+            self.export_dict_to_blob(data=etag_cache, container="project-monitoring",
+                                     output_filename=ETAG_CACHE_FILENAME)
+
+        # Report blob uploads of the scrape
+        uploads = self.upload_summary()
+        self.logger.info(f"Blob uploads: {uploads['uploaded']} uploaded ({uploads['bytes_uploaded']} bytes), "
+                         f"{uploads['skipped']} unchanged and skipped ({uploads['bytes_saved']} bytes saved) \n")
+
+    def scrape_repositories(self, client: GitHubClient, repos: list) -> None:
+        """
+        Collect and export workflow data for every repository.
+
+        Args:
+            client (GitHubClient): Shared client used to query the GitHub API.
+            repos (list): The names of the repositories to process.
+        """
+        # Process repositories one after another
+        if self.max_workers <= 1:
+            for repo_i, repo in enumerate(iterable=repos, start=1):
+                self.scrape_repository(client=client, repo_i=repo_i, n_repos=len(repos), repo=repo)
+            return
+
+        # Fan out repositories and workflows across separate pools to avoid nested pool deadlocks
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="repo") as repo_executor, \
+                ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="workflow") as wf_executor:
+            futures = [
+                repo_executor.submit(self.scrape_repository, client=client, repo_i=repo_i, n_repos=len(repos),
+                                     repo=repo, executor=wf_executor)
+                for repo_i, repo in enumerate(iterable=repos, start=1)
+            ]
+
+            # Wait for all repositories to complete
+            for future in futures:
+                future.result()
+
+    def scrape_repository(
+        self,
+        client: GitHubClient,
+        repo_i: int,
+        n_repos: int,
+        repo: str,
+        executor: Optional[Executor] = None
+    ) -> None:
+        """
+        Collect and export workflow data for a single repository.
+
+        Errors are isolated to the repository: a failed request is logged and the
+        remaining repositories are unaffected.
+
+        Args:
+            client (GitHubClient): Shared client used to query the GitHub API.
+            repo_i (int): 1-based position of the repository, used for progress logging.
+            n_repos (int): Total number of repositories.
+            repo (str): The name of the GitHub repository.
+            executor (Optional[Executor]): Executor used to process workflows concurrently.
+                If None, workflows are processed sequentially.
+        """
+        try:
+            # Log progress message
+            self.logger.info(f"{repo_i}/{n_repos} - Collecting workflow data for repo: {repo}... \n")
 
-                    except json.JSONDecodeError as e:
-                        self.logger.exception(f"Failed to parse workflow run data - {e}")
+            # Collect repository workflows
+            workflows = client.list_repository_workflows(repo=repo)
+
+            # Log status of collected data
+            self.logger.info(f"{len(workflows)} workflows identified within {repo}: "
+                             f"{[wf['name'] for wf in workflows]} \n")
+
+            # Iterate through each workflow, stopping at the first failure
+            if executor is None:
+                for wf_i, wf in enumerate(iterable=workflows, start=1):
+                    if not self.scrape_workflow(client=client, repo=repo, wf=wf, wf_i=wf_i, n_workflows=len(workflows)):
                         break
 
-                self.logger.info(f"Updated workflow data for {repo} \n")
+            # Submit each workflow to the executor, cancelling queued workflows after a failure
+            else:
+                self.wait_for_workflows(futures=[
+                    executor.submit(self.scrape_workflow, client=client, repo=repo, wf=wf, wf_i=wf_i,
+                                    n_workflows=len(workflows))
+                    for wf_i, wf in enumerate(iterable=workflows, start=1)
+                ])
+
+            self.logger.info(f"Updated workflow data for {repo} \n")
+
+        except requests.exceptions.RequestException as e:
+            self.logger.exception(f"Error fetching data for {repo}: {e} \n")
+
+        # Rebuild the repository rollup from its workflow rollups, even if a workflow failed
+        finally:
+            if repo in self.rollup_repos:
+                self.rollup_store.rebuild_repo_rollup(repo=repo)
+
+    @staticmethod
+    def wait_for_workflows(futures: list) -> None:
+        """
+        Wait for the workflows of a repository, cancelling those still queued after the first failure.
+
+        Cancelled workflows are skipped rather than waited on, so a failure never aborts the scrape.
+
+        Args: futures (list): Futures of `scrape_workflow` calls, in submission order.
+        """
+        for future in futures:
+            try:
+                succeeded = future.result()
+            except CancelledError:
+                continue
+            if not succeeded:
+                for pending in futures:
+                    pending.cancel()
+
+    def scrape_workflow(self, client: GitHubClient, repo: str, wf: dict, wf_i: int, n_workflows: int) -> bool:
+        """
+        Collect, aggregate and export run data for a single workflow.
+
+        Args:
+            client (GitHubClient): Client used to query the GitHub API.
+            repo (str): The name of the GitHub repository.
+            wf (dict): A workflow object obtained from the GitHub API.
+            wf_i (int): 1-based position of the workflow, used for progress logging.
+            n_workflows (int): Total number of workflows in the repository.
+
+        Returns: bool: True if the workflow was exported successfully, False otherwise.
+        """
+        self.logger.info(f"{wf_i}/{n_workflows} - Collecting workflow run data for {wf['name']}...")
+
+        try:
+            # Read stored history, its high-water mark and its incomplete runs in incremental mode
+            output_filename = f"workflows/{repo}_{wf['name']}.json"
+            existing_runs = self.read_stored_runs(output_filename=output_filename, repo=repo, wf=wf) \
+                if self.incremental else []
+            high_water_mark = max(existing_runs, key=lambda run: run.run_number or 0, default=None)
+            incomplete_runs = self.find_incomplete_runs(runs=existing_runs, high_water_mark=high_water_mark)
+
+            wf_runs, latest_run = self.collect_workflow_runs(client=client, repo=repo, wf=wf,
+                                                             high_water_mark=high_water_mark,
+                                                             incomplete_runs=incomplete_runs)
+
+            # Skip workflows that have never run, or have no runs newer than the stored history
+            if latest_run is None:
+                message = f"No workflow runs recorded for {wf['name']} \n"
+                if existing_runs:
+                    self.logger.info(message)
+                else:
+                    self.logger.warning(message)
+                return True
+
+            self.logger.info(f"{len(wf_runs)} workflow runs recorded for {wf['name']}. Last run recorded "
+                             f"at {latest_run['run_started_at']} | Status: {latest_run['conclusion']} \n")
+
+            # Merge new runs into the stored history, skipping the upload if nothing changed
+            merged_runs = self.merge_workflow_runs(new_runs=wf_runs, existing_runs=existing_runs)
+            if self.incremental and merged_runs == existing_runs:
+                self.logger.info(f"No new workflow runs for {wf['name']}, skipping upload \n")
+                self.update_manifest(output_filename=output_filename, repo=repo, wf=wf, runs=merged_runs,
+                                     replace=False, run_count=self.count_stored_runs(output_filename=output_filename,
+                                                                                     repo=repo, wf=wf))
+                return True
+
+            # Export data to blob storage and record it in the manifest. Partitions merge the collected runs themselves
+            self.export_workflow_runs(output_filename=output_filename, repo=repo, wf=wf,
+                                      runs=wf_runs if self.run_store is not None else merged_runs)
+
+        except NotModified:
+            self.logger.info(f"Workflow runs for {wf['name']} unchanged since last scrape, skipping \n")
+            if not self.has_manifest_entry(output_filename=output_filename):
+                self.update_manifest(output_filename=output_filename, repo=repo, wf=wf,
+                                     runs=self.read_workflow_history(output_filename=output_filename, repo=repo, wf=wf))
+            return True
+
+        except requests.exceptions.RequestException as e:
+            self.logger.exception(f"Error fetching data for {wf['name']}: {e}")
+            client.forget_validators(repo=repo, workflow=wf)
+            return False
+
+        except json.JSONDecodeError as e:
+            self.logger.exception(f"Failed to parse workflow run data - {e}")
+            client.forget_validators(repo=repo, workflow=wf)
+            return False
+
+        return True
+
+    def export_workflow_runs(self, output_filename: str, repo: str, wf: dict, runs: list) -> None:
+        """
+        Export the run history of a workflow and record it in the manifest.
+
+        Partitioned histories only rewrite the monthly partitions holding the given
+        runs. Otherwise the workflow blob is rewritten, along with its columnar copy.
+
+        Args:
+            output_filename (str): The workflow blob name.
+            repo (str): The name of the GitHub repository.
+            wf (dict): A workflow object obtained from the GitHub API.
+            runs (list): WorkflowRun records to store, newest first.
+        """
+        # Merge runs into their monthly partitions
+        if self.run_store is not None:
+            result = self.run_store.write_runs(repo=repo, workflow=wf["name"], runs=runs)
+            self.logger.info(f"{len(result['written'])} partitions updated for {wf['name']} \n")
+            self.update_manifest(output_filename=output_filename, repo=repo, wf=wf, runs=runs,
+                                 properties=result["properties"],
+                                 run_count=self.count_stored_runs(output_filename=output_filename, repo=repo, wf=wf,
+                                                                  added=result["added"]))
+            self.update_rollups(repo=repo, wf=wf, runs=runs)
+            return
+
+        properties = self.export_dict_to_blob(data=runs, container="project-monitoring",
+                                              output_filename=output_filename)
+        self.update_manifest(output_filename=output_filename, repo=repo, wf=wf, runs=runs, properties=properties)
+
+        # Export a columnar copy of the history
+        if self.columnar:
+            self.export_runs_to_parquet(runs=runs, container="project-monitoring",
+                                        output_filename=columnar_blob_name(repo=repo, workflow_name=wf["name"]))
+
+        self.update_rollups(repo=repo, wf=wf, runs=runs)
+
+    def update_rollups(self, repo: str, wf: dict, runs: list) -> None:
+        """
+        Count the new runs of a workflow in its rollup, and mark the repository rollup for a rebuild.
+
+        A workflow without a rollup is counted from its complete history, which partitioned
+        histories read from storage as `runs` only holds the new runs.
+
+        Args:
+            repo (str): The name of the GitHub repository.
+            wf (dict): A workflow object obtained from the GitHub API.
+            runs (list): WorkflowRun records just stored, newest first.
+        """
+        if self.rollup_store is None:
+            return
+
+        read_history = (lambda: self.run_store.read_runs(repo=repo, workflow=wf["name"])) \
+            if self.run_store is not None else None
+        delta = self.rollup_store.update_workflow_rollup(repo=repo, workflow=wf["name"], runs=runs,
+                                                         read_history=read_history)
+        if any(delta.values()):
+            with self.manifest_lock:
+                self.rollup_repos.add(repo)
+
+    @staticmethod
+    def run_lifetime_start(created_at: str) -> datetime:
+        """
+        Find the earliest creation time of a run that may still be incomplete when a given run is created.
+
+        Args: created_at (str): ISO 8601 creation timestamp of the given run.
+
+        Returns: datetime: The timestamp `MAX_RUN_DAYS` earlier.
+        """
+        return datetime.fromisoformat(created_at.replace("Z", "+00:00")) - timedelta(days=MAX_RUN_DAYS)
+
+    @staticmethod
+    def find_incomplete_runs(runs: list, high_water_mark: Optional[WorkflowRun]) -> list:
+        """
+        Find the stored runs that had not completed when they were collected.
+
+        Runs created more than `MAX_RUN_DAYS` before the high-water mark are ignored, as
+        GitHub has ended them since; one still stored as incomplete was deleted.
+
+        Args:
+            runs (list): Stored WorkflowRun records.
+            high_water_mark (Optional[WorkflowRun]): The newest stored run record of the workflow.
+
+        Returns: list: The incomplete WorkflowRun records.
+        """
+        if high_water_mark is None or not high_water_mark.created_at:
+            return []
+
+        # Keep incomplete runs created within the lifetime of a run before the high-water mark
+        cutoff = WorkflowScrapper.run_lifetime_start(created_at=high_water_mark.created_at)
+        incomplete_runs = [run for run in runs if run.status not in (None, "completed") and run.created_at]
+        return [run for run in incomplete_runs
+                if datetime.fromisoformat(run.created_at.replace("Z", "+00:00")) >= cutoff]
+
+    def collect_workflow_runs(
+        self,
+        client: GitHubClient,
+        repo: str,
+        wf: dict,
+        high_water_mark: Optional[WorkflowRun] = None,
+        incomplete_runs: Optional[list] = None
+    ) -> tuple:
+        """
+        Collect and aggregate the runs of a workflow page by page, newest first.
+
+        When a high-water mark is given, only runs created at or after it are
+        requested, and pagination stops as soon as a page reaches older, already
+        stored runs. The high-water mark run itself is re-collected so that a run
+        which was still in progress at the previous scrape gets its final status.
+        Older stored runs that were still incomplete are re-collected too, by
+        requesting runs from the earliest of them.
+
+        Args:
+            client (GitHubClient): Client used to query the GitHub API.
+            repo (str): The name of the GitHub repository.
+            wf (dict): A workflow object obtained from the GitHub API.
+            high_water_mark (Optional[WorkflowRun]): The newest stored run record of the workflow.
+            incomplete_runs (Optional[list]): Stored WorkflowRun records that had not completed.
+
+        Returns:
+            tuple: A list of WorkflowRun records and the latest raw run object
+                (None if no runs were collected).
+        """
+        # Define high-water mark filters, reaching back to the earliest incomplete run
+        incomplete_run_numbers = {run.run_number for run in incomplete_runs or []}
+        created_since = min(run.created_at for run in incomplete_runs) if incomplete_runs \
+            else high_water_mark.created_at if high_water_mark else None
+        min_run_number = (high_water_mark.run_number or 0) if high_water_mark else None
+        oldest_run_number = min(incomplete_run_numbers | {min_run_number}) if min_run_number is not None else None
+
+        def is_collected(run_number: int) -> bool:
+            return run_number >= min_run_number or run_number in incomplete_run_numbers
+
+        # Aggregate runs page by page so only one page of raw API data is held at a time
+        wf_runs, latest_run = [], None
+        for page in client.iter_workflow_run_pages(repo=repo, workflow=wf, max_runs=self.max_runs,
+                                                   created_since=created_since):
+
+            # Drop runs older than the high-water mark, except incomplete ones
+            reached_known_runs = False
+            if min_run_number is not None:
+                reached_known_runs = any((run.get("run_number") or 0) < oldest_run_number for run in page)
+                page = [run for run in page if is_collected(run_number=run.get("run_number") or 0)]
+
+            if page:
+                latest_run = latest_run or page[0]
+                wf_runs.extend(client.aggregate_workflow_data(repo=repo, wf_name=wf["name"],
+                                                              workflow_runs=page, state=wf.get("state")))
+
+            # Stop paginating once stored runs are reached
+            if reached_known_runs:
+                break
+
+        return wf_runs, latest_run
+
+    def load_manifest(self) -> dict:
+        """
+        Retrieve the latest run manifest, reading the stored manifest on first use.
+
+        Returns: dict: Manifest entries keyed by workflow blob name.
+        """
+        with self.manifest_lock:
+            if self.manifest is None:
+                self.manifest = self.read_stored_blob(input_filename=MANIFEST_FILENAME, default={})
+            return self.manifest
+
+    def has_manifest_entry(self, output_filename: str) -> bool:
+        """
+        Determine whether the manifest holds an entry for a workflow blob.
+
+        Args: output_filename (str): The workflow blob name.
+
+        Returns: bool: True if the workflow is recorded in the manifest.
+        """
+        return output_filename in self.load_manifest()
+
+    def update_manifest(
+        self,
+        output_filename: str,
+        repo: str,
+        wf: dict,
+        runs: list,
+        properties: Optional[dict] = None,
+        replace: bool = True,
+        run_count: Optional[int] = None
+    ) -> None:
+        """
+        Record the latest run of a workflow in the manifest.
+
+        Args:
+            output_filename (str): The workflow blob name.
+            repo (str): The name of the GitHub repository.
+            wf (dict): A workflow object obtained from the GitHub API.
+            runs (list): The stored run records of the workflow, newest first.
+            properties (Optional[dict]): Properties of the uploaded workflow blob.
+            replace (bool): If False, an existing entry of the workflow is kept.
+            run_count (Optional[int]): Total number of stored runs, if `runs` is not the complete history.
+        """
+        if not runs:
+            return
+
+        entry = build_manifest_entry(repo=repo, workflow_name=wf["name"], active_status=wf.get("state"),
+                                     runs=runs, properties=properties, run_count=run_count)
+        with self.manifest_lock:
+            manifest = self.load_manifest()
+            if replace or output_filename not in manifest:
+                manifest[output_filename] = entry
+                self.manifest_changed = True
+
+    def read_stored_runs(self, output_filename: str, repo: str, wf: dict) -> list:
+        """
+        Read the stored run records needed to find the high-water mark and the incomplete runs of a workflow.
+
+        The workflow blob is decoded straight into typed records. Partitioned histories
+        only read the runs created up to `MAX_RUN_DAYS` before their newest stored run.
+
+        Args:
+            output_filename (str): The workflow blob name.
+            repo (str): The name of the GitHub repository.
+            wf (dict): A workflow object obtained from the GitHub API.
+
+        Returns: list: WorkflowRun records, newest first. Empty if nothing is stored.
+        """
+        if self.run_store is not None:
+            newest = self.run_store.read_runs(repo=repo, workflow=wf["name"], limit=1)
+            if not newest or not newest[0].get("created_at"):
+                return [WorkflowRun.from_dict(run) for run in newest]
+
+            since = self.run_lifetime_start(created_at=newest[0]["created_at"]).isoformat()
+            return [WorkflowRun.from_dict(run) for run in self.run_store.read_runs(repo=repo, workflow=wf["name"],
+                                                                                   since=since)]
+
+        try:
+            return self.read_blob_to_runs(container="project-monitoring", input_filename=output_filename)
+        except ResourceNotFoundError:
+            return []
+
+    def read_workflow_history(self, output_filename: str, repo: str, wf: dict) -> list:
+        """
+        Read the stored run history of a workflow, from its partitions or its workflow blob.
+
+        Args:
+            output_filename (str): The workflow blob name.
+            repo (str): The name of the GitHub repository.
+            wf (dict): A workflow object obtained from the GitHub API.
+
+        Returns: list: Run dictionaries, newest first. Empty if nothing is stored.
+        """
+        if self.run_store is None:
+            return self.read_stored_blob(input_filename=output_filename, default=[])
+
+        return self.run_store.read_runs(repo=repo, workflow=wf["name"])
+
+    def count_stored_runs(self, output_filename: str, repo: str, wf: dict, added: int = 0) -> Optional[int]:
+        """
+        Count the stored runs of a partitioned workflow history.
+
+        The count recorded in the manifest is carried forward, so partitions are only
+        read in full when the workflow has no manifest entry yet.
+
+        Args:
+            output_filename (str): The workflow blob name.
+            repo (str): The name of the GitHub repository.
+            wf (dict): A workflow object obtained from the GitHub API.
+            added (int): Number of runs stored since the manifest entry was recorded.
+
+        Returns: Optional[int]: The number of stored runs, or None if histories are not partitioned.
+        """
+        if self.run_store is None:
+            return None
+
+        entry = self.load_manifest().get(output_filename)
+        if entry is not None and entry.get("run_count") is not None:
+            return entry["run_count"] + added
+
+        return len(self.run_store.read_runs(repo=repo, workflow=wf["name"]))
+
+    def read_stored_blob(self, input_filename: str, default: Union[list, dict]) -> Union[list, dict]:
+        """
+        Read a JSON blob from the `project-monitoring` container, falling back to a default.
+
+        Args:
+            input_filename (str): The blob name.
+            default (Union[list, dict]): Value returned if the blob does not exist.
+
+        Returns: Union[list, dict]: The stored blob content, or the default if the blob does not exist.
+        """
+        try:
+            return self.read_blob_to_dict(container="project-monitoring", input_filename=input_filename)
+        except ResourceNotFoundError:
+            return default
+
+    @staticmethod
+    def merge_workflow_runs(new_runs: list, existing_runs: list) -> list:
+        """
+        Merge newly collected run records into an existing run history.
+
+        Records are deduplicated on `run_number`, with newly collected records
+        replacing stored ones in place. Runs not stored before are placed first so
+        the history stays ordered newest first.
+
+        Args:
+            new_runs (list): Newly collected WorkflowRun records, newest first.
+            existing_runs (list): Stored WorkflowRun records, newest first.
+
+        Returns: list: The merged run history.
+        """
+        if not existing_runs:
+            return new_runs
 
-            except requests.exceptions.RequestException as e:
-                self.logger.exception(f"Error fetching data for {repo}: {e} \n")
+        new_runs_by_number = {run.run_number: run for run in new_runs}
+        existing_run_numbers = {run.run_number for run in existing_runs}
+        return [run for run in new_runs if run.run_number not in existing_run_numbers] + \
+            [new_runs_by_number.get(run.run_number, run) for run in existing_runs]
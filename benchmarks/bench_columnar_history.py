@@ -0,0 +1,49 @@
+# Import dependencies
+from benchmarks.bench_workflow_durations import generate_workflow_runs
+from shared.functions.columnar import runs_to_parquet, parquet_to_dataframe
+from backend.functions.data import GitHubClient
+from unittest.mock import MagicMock
+import pandas as pd
+import time
+import json
+
+def run_benchmark(sizes: tuple = (10_000, 100_000)) -> None:
+    """
+    Compare loading a run history into a DataFrame from JSON and from Parquet, and print
+    timings, speedup and stored sizes.
+
+    Args: sizes (tuple): Numbers of runs to benchmark.
+    """
+    client = GitHubClient(GITHUB_TOKEN="benchmark", session=MagicMock())
+    client.logger = MagicMock()
+
+    for n_runs in sizes:
+        runs = generate_workflow_runs(n_runs=n_runs)
+        for run in runs:
+            run.update({"status": "completed", "conclusion": "success",
+                        "html_url": f"https://github.com/powellrhys/repo/actions/runs/{run['run_number']}"})
+        records = client.aggregate_workflow_data(repo="repo", wf_name="build", workflow_runs=runs, state="active")
+
+        # Stored representations
+        json_content = json.dumps([record.to_dict() for record in records]).encode()
+        parquet_content = runs_to_parquet(runs=records)
+
+        # Time the JSON path used by the analysis page
+        start = time.perf_counter()
+        df = pd.DataFrame(json.loads(json_content))
+        df["created_at"] = pd.to_datetime(df["created_at"], utc=True, format="ISO8601")
+        df["updated_at"] = pd.to_datetime(df["updated_at"], utc=True, format="ISO8601")
+        json_seconds = time.perf_counter() - start
+
+        # Time the columnar path
+        start = time.perf_counter()
+        parquet_to_dataframe(content=parquet_content)
+        parquet_seconds = time.perf_counter() - start
+
+        print(f"{n_runs:>7} runs | JSON: {json_seconds * 1000:8.1f} ms ({len(json_content) / 2 ** 20:5.1f} MiB) | "
+              f"Parquet: {parquet_seconds * 1000:8.1f} ms ({len(parquet_content) / 2 ** 20:5.1f} MiB) | "
+              f"speedup: {json_seconds / parquet_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
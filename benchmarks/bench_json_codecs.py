@@ -0,0 +1,56 @@
+# Import dependencies
+from benchmarks.bench_workflow_durations import generate_workflow_runs
+from shared.functions.json_codec import JSON_CODECS, check_codec, encode_json, decode_json, decode_runs
+from backend.functions.data import GitHubClient
+from unittest.mock import MagicMock
+import time
+
+def run_benchmark(sizes: tuple = (1_000, 10_000, 100_000)) -> None:
+    """
+    Compare encoding, decoding and typed decoding of run histories with every installed
+    JSON codec, and print timings and sizes.
+
+    Args: sizes (tuple): Numbers of runs to benchmark.
+    """
+    client = GitHubClient(GITHUB_TOKEN="benchmark", session=MagicMock())
+    client.logger = MagicMock()
+
+    # Skip codecs whose package is not installed
+    codecs = []
+    for codec in JSON_CODECS:
+        try:
+            check_codec(codec=codec)
+            codecs.append(codec)
+        except ValueError:
+            print(f"{codec} not installed, skipping")
+
+    for n_runs in sizes:
+        runs = generate_workflow_runs(n_runs=n_runs)
+        for run in runs:
+            run.update({"status": "completed", "conclusion": "success",
+                        "html_url": f"https://github.com/powellrhys/repo/actions/runs/{run['run_number']}"})
+        records = client.aggregate_workflow_data(repo="repo", wf_name="build", workflow_runs=runs, state="active")
+
+        for codec in codecs:
+            # Time serializing the records, as on the scraper upload path
+            start = time.perf_counter()
+            content = encode_json(data=records, codec=codec, default=lambda obj: obj.to_dict())
+            encode_seconds = time.perf_counter() - start
+
+            # Time decoding to dictionaries, as on the frontend read path
+            start = time.perf_counter()
+            decode_json(content=content, codec=codec)
+            decode_seconds = time.perf_counter() - start
+
+            # Time decoding straight into typed records, as on the incremental scrape path
+            start = time.perf_counter()
+            decode_runs(content=content, codec=codec)
+            typed_seconds = time.perf_counter() - start
+
+            print(f"{n_runs:>7} runs | {codec:<7} | encode: {encode_seconds * 1000:8.1f} ms | "
+                  f"decode: {decode_seconds * 1000:8.1f} ms | typed decode: {typed_seconds * 1000:8.1f} ms | "
+                  f"{len(content) / 2 ** 20:5.1f} MiB")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,119 @@
+# Import dependencies
+from frontend.functions.data_functions import transform_workflow_overview_df
+from datetime import datetime, timedelta, timezone
+import pandas as pd
+import random
+import time
+
+# States of the generated workflows, padded and in mixed case as the GitHub API may return them
+STATES = ["active", " Active ", "ACTIVE", "inactive", "Disabled_manually "]
+
+def transform_workflow_overview_df_rowwise(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    The previous, row-wise `transform_workflow_overview_df`, copied unchanged as the parity
+    and timing reference. It raises on missing durations.
+
+    Args: df (pd.DataFrame): A DataFrame containing workflow run data.
+
+    Returns: pd.DataFrame: A transformed and sorted DataFrame ready for display.
+    """
+    # Convert seconds → minutes:seconds and append url prefix to repo column
+    df["duration"] = df["duration_seconds"].apply(lambda x: f"{int(x // 60)}m {int(x % 60)}s")
+    df["repo"] = "https://github.com/powellrhys/" + df["repo"]
+
+    # Ensure updated_at is a datetime
+    df["updated_at"] = pd.to_datetime(df["updated_at"], utc=True)
+
+    # Today's date (UTC to match GitHub timestamps)
+    today = datetime.now(timezone.utc)
+
+    # Calculate days since last update
+    df["days_since_last_run"] = (today - df["updated_at"]).dt.days
+
+    # Create status flag column
+    df["status_flag"] = df["active_status"] \
+        .apply(lambda d: "🟢 Active" if d.strip().lower() == "active" else "🔴 Inactive")
+
+    # Filter data columns
+    df = df[
+        ["repo", "workflow_name", "updated_at", "status", "html_url", "duration", "days_since_last_run", "status_flag"]
+    ]
+
+    # Sort data by repo and last days since last run
+    df = df.sort_values(by=["repo", "days_since_last_run"], ascending=[True, False])
+
+    return df
+
+
+def check_parity(df: pd.DataFrame, vectorized: pd.DataFrame) -> None:
+    """
+    Check the vectorized table against the row-wise reference. The reference raises on
+    missing durations, so it is run with them set to zero, and the vectorized table is
+    expected to leave them empty instead.
+
+    Args:
+        df (pd.DataFrame): The workflow runs both transforms were given.
+        vectorized (pd.DataFrame): The table built by `transform_workflow_overview_df`.
+    """
+    missing = df["duration_seconds"].isna()
+    if missing.any():
+        try:
+            transform_workflow_overview_df_rowwise(df=df.copy())
+            raise AssertionError("The row-wise transform accepted a missing duration")
+        except ValueError:
+            pass
+
+    expected = transform_workflow_overview_df_rowwise(df=df.fillna({"duration_seconds": 0}))
+    expected.loc[missing[missing].index, "duration"] = None
+
+    pd.testing.assert_frame_equal(expected, vectorized, check_dtype=False)
+
+
+def generate_overview_df(n_rows: int) -> pd.DataFrame:
+    """
+    Generate a latest workflow runs DataFrame with realistic timestamps and durations,
+    padded and mixed-case states, and some missing durations.
+
+    Args: n_rows (int): Number of workflows to generate.
+
+    Returns: pd.DataFrame: The workflow runs.
+    """
+    now = datetime.now(timezone.utc)
+    return pd.DataFrame([{
+        "repo": f"repo{i % 50}",
+        "workflow_name": f"workflow{i}",
+        "updated_at": (now - timedelta(minutes=random.randint(0, 200_000))).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "status": "success",
+        "html_url": f"https://github.com/powellrhys/repo{i % 50}/actions/runs/{i}",
+        "duration_seconds": random.randint(0, 5_000) if i % 7 else float("nan"),
+        "active_status": STATES[i % len(STATES)]
+    } for i in range(n_rows)])
+
+
+def run_benchmark(sizes: tuple = (1_000, 10_000, 100_000)) -> None:
+    """
+    Compare the row-wise and vectorized overview transforms, checking they produce the
+    same table, and print timings and speedup.
+
+    Args: sizes (tuple): Numbers of workflows to benchmark.
+    """
+    for n_rows in sizes:
+        df = generate_overview_df(n_rows=n_rows)
+
+        # Time row-wise path, on durations it can format
+        start = time.perf_counter()
+        transform_workflow_overview_df_rowwise(df=df.fillna({"duration_seconds": 0}))
+        rowwise_seconds = time.perf_counter() - start
+
+        # Time vectorized path
+        start = time.perf_counter()
+        vectorized = transform_workflow_overview_df(df=df.copy())
+        vectorized_seconds = time.perf_counter() - start
+
+        check_parity(df=df, vectorized=vectorized)
+        print(f"{n_rows:>7} rows | row-wise: {rowwise_seconds * 1000:8.1f} ms | "
+              f"vectorized: {vectorized_seconds * 1000:8.1f} ms | speedup: {rowwise_seconds / vectorized_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,67 @@
+# Import dependencies
+from benchmarks.bench_workflow_durations import generate_workflow_runs
+from shared.functions.run_schema import build_runs_dataframe
+import pandas as pd
+import time
+
+def generate_multi_repo_runs(n_runs: int, n_repos: int = 40, n_workflows: int = 5) -> list:
+    """
+    Generate stored run dictionaries spread over many repositories and workflows.
+
+    Args:
+        n_runs (int): Number of runs to generate.
+        n_repos (int): Number of repositories.
+        n_workflows (int): Number of workflows per repository.
+
+    Returns: list: Run dictionaries in the stored JSON layout.
+    """
+    runs = []
+    for i, run in enumerate(generate_workflow_runs(n_runs=n_runs)):
+        repo = f"repository-{i % n_repos}"
+        runs.append({
+            "repo": repo,
+            "workflow_name": f"workflow-{i // n_repos % n_workflows}",
+            "active_status": "active" if i % 7 else "disabled_manually",
+            "status": "completed",
+            "conclusion": "success" if i % 5 else "failure",
+            "created_at": run["created_at"],
+            "updated_at": run["updated_at"],
+            "run_number": run["run_number"],
+            "html_url": f"https://github.com/powellrhys/{repo}/actions/runs/{run['run_number']}",
+            "duration_seconds": float(i % 900)
+        })
+
+    return runs
+
+
+def run_benchmark(sizes: tuple = (10_000, 100_000, 1_000_000)) -> None:
+    """
+    Compare the memory footprint and build time of untyped run DataFrames, with timestamps
+    converted ad hoc, against DataFrames built with the run schema, and print the savings.
+
+    Args: sizes (tuple): Numbers of runs to benchmark.
+    """
+    for n_runs in sizes:
+        runs = generate_multi_repo_runs(n_runs=n_runs)
+
+        # Build untyped DataFrame, parsing timestamps ad hoc as the frontend previously did
+        start = time.perf_counter()
+        untyped = pd.DataFrame(data=runs)
+        for column in ("created_at", "updated_at"):
+            untyped[column] = pd.to_datetime(untyped[column], utc=True, format="ISO8601")
+        untyped_seconds = time.perf_counter() - start
+
+        # Build typed DataFrame
+        start = time.perf_counter()
+        typed = build_runs_dataframe(runs=runs)
+        typed_seconds = time.perf_counter() - start
+
+        untyped_bytes = untyped.memory_usage(deep=True).sum()
+        typed_bytes = typed.memory_usage(deep=True).sum()
+        print(f"{n_runs:>8} runs | untyped: {untyped_bytes / 2 ** 20:7.1f} MiB, {untyped_seconds * 1000:7.1f} ms | "
+              f"schema: {typed_bytes / 2 ** 20:7.1f} MiB, {typed_seconds * 1000:7.1f} ms | "
+              f"saving: {1 - typed_bytes / untyped_bytes:.0%}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,115 @@
+# Import dependencies
+from benchmarks.bench_workflow_durations import generate_workflow_runs
+from shared.functions.json_codec import encode_json, decode_runs
+from backend.functions.data import GitHubClient
+from unittest.mock import MagicMock
+from shared import BlobClient
+import tracemalloc
+import json
+
+def measure(build: callable) -> tuple:
+    """
+    Measure the memory retained by the result of a callable, and the peak memory allocated
+    while it ran.
+
+    Args: build (callable): A callable returning the objects to measure.
+
+    Returns: tuple: The built objects, the number of bytes retained by them and the peak number of bytes
+        allocated while building them.
+    """
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    result = build()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, retained, peak
+
+
+def aggregate_run_dicts(client: GitHubClient, repo: str, wf_name: str, workflow_runs: list, state: str) -> list:
+    """
+    The previous, dictionary based `aggregate_workflow_data`, kept as the memory reference.
+
+    Args:
+        client (GitHubClient): Client used to compute run durations.
+        repo (str): The name of the GitHub repository.
+        wf_name (str): The name of the workflow.
+        workflow_runs (list): A list of workflow run objects.
+        state (str): The state of the workflow.
+
+    Returns: list: A list of dictionaries containing summarized workflow run data.
+    """
+    durations = client.workflow_durations(workflow_runs=workflow_runs)
+    return [{
+        "repo": repo,
+        "workflow_name": wf_name,
+        "active_status": state,
+        "status": run.get("status"),
+        "conclusion": run.get("conclusion"),
+        "created_at": run.get("created_at"),
+        "updated_at": run.get("updated_at"),
+        "run_number": run.get("run_number"),
+        "html_url": run.get("html_url"),
+        "duration_seconds": duration_seconds
+    } for run, duration_seconds in zip(workflow_runs, durations)]
+
+
+def report(label: str, n_runs: int, dict_stats: tuple, record_stats: tuple) -> None:
+    """
+    Print the retained and peak memory of the dict and WorkflowRun paths.
+
+    Args:
+        label (str): The measured path.
+        n_runs (int): Number of runs.
+        dict_stats (tuple): Retained and peak bytes of the dict path.
+        record_stats (tuple): Retained and peak bytes of the WorkflowRun path.
+    """
+    mib = 2 ** 20
+    print(f"{n_runs:>7} runs | {label:<16} | retained: dicts {dict_stats[0] / mib:6.1f} MiB, "
+          f"WorkflowRun {record_stats[0] / mib:6.1f} MiB ({1 - record_stats[0] / dict_stats[0]:.0%} saved) | "
+          f"peak: dicts {dict_stats[1] / mib:6.1f} MiB, WorkflowRun {record_stats[1] / mib:6.1f} MiB "
+          f"({1 - record_stats[1] / dict_stats[1]:.0%} saved)")
+
+
+def run_benchmark(sizes: tuple = (10_000, 100_000)) -> None:
+    """
+    Compare the memory footprint of dict run records and WorkflowRun records, when a scrape
+    aggregates API data and exports it as JSON, and when stored JSON is reloaded, and print
+    the retained and peak memory of each path.
+
+    Args: sizes (tuple): Numbers of runs to benchmark.
+    """
+    client = GitHubClient(GITHUB_TOKEN="benchmark", session=MagicMock())
+    client.logger = MagicMock()
+
+    for n_runs in sizes:
+        runs = generate_workflow_runs(n_runs=n_runs)
+        for run in runs:
+            run.update({"status": "completed", "conclusion": "success",
+                        "html_url": f"https://github.com/powellrhys/repo/actions/runs/{run['run_number']}"})
+
+        # Measure aggregating API data and serialising it for export
+        _, *dict_stats = measure(lambda: encode_json(data=aggregate_run_dicts(
+            client=client, repo="repo", wf_name="build", workflow_runs=runs, state="active"
+        )))
+        _, *record_stats = measure(lambda: encode_json(data=client.aggregate_workflow_data(
+            repo="repo", wf_name="build", workflow_runs=runs, state="active"
+        ), default=BlobClient.json_default))
+        report(label="scrape to export", n_runs=n_runs, dict_stats=dict_stats, record_stats=record_stats)
+
+        # Stored JSON, as read back by the incremental scrape
+        records = client.aggregate_workflow_data(repo="repo", wf_name="build", workflow_runs=runs, state="active")
+        stored = json.dumps([record.to_dict() for record in records]).encode()
+
+        # Measure reloaded dict records against records decoded as the scraper does
+        _, *dict_stats = measure(lambda: json.loads(stored))
+        _, *record_stats = measure(lambda: decode_runs(content=stored))
+        report(label="reload", n_runs=n_runs, dict_stats=dict_stats, record_stats=record_stats)
+
+        # Measure records converted from dicts, as without msgspec
+        _, *record_stats = measure(lambda: decode_runs(content=stored, codec="json"))
+        report(label="reload (json)", n_runs=n_runs, dict_stats=dict_stats, record_stats=record_stats)
+
+
+if __name__ == "__main__":
+    run_benchmark()
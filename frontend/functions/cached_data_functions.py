@@ -0,0 +1,140 @@
+# Import dependencies
+from .data_functions import create_blob_client, create_repo_workflow_map, collect_latest_workflow_runs, \
+    load_workflow_runs, load_rollup_trend
+from shared import PartitionedRunStore, RollupStore, columnar_blob_name
+from typing import Optional
+import streamlit as st
+import pandas as pd
+import hashlib
+
+# Maximum number of results kept per cached function
+MAX_CACHE_ENTRIES = 64
+
+# Prefixes of the blobs listing the workflows and holding their latest runs
+WORKFLOW_PREFIXES = ("workflows", "runs/", "manifests/")
+
+def blob_version(prefixes: tuple) -> str:
+    """
+    Fingerprint the blobs under a set of prefixes from their ETags.
+
+    The container listing is served from the snapshot shared by the process, so a
+    version probe costs at most one listing request, and none on quick reruns. The
+    fingerprint changes as soon as a scrape writes any of the blobs.
+
+    Args: prefixes (tuple): Blob name prefixes, or exact blob names.
+
+    Returns: str: A SHA-256 hex digest of the names and ETags of the matching blobs.
+    """
+    listing = create_blob_client().list_blob_properties(container_name="project-monitoring", directory_path="")
+    etags = sorted(f"{blob['name']}:{blob['etag']}" for blob in listing if blob["name"].startswith(prefixes))
+
+    return hashlib.sha256("\n".join(etags).encode()).hexdigest()
+
+
+@st.cache_data(max_entries=MAX_CACHE_ENTRIES, show_spinner=False)
+def cached_repo_workflow_map(version: str) -> dict:
+    """
+    Cache `create_repo_workflow_map` per version of the stored workflow blobs.
+
+    Args: version (str): Fingerprint of the workflow blobs, used only as the cache key.
+
+    Returns: dict: A dictionary mapping each repository name to a list of its workflows.
+    """
+    return create_repo_workflow_map()
+
+
+@st.cache_data(max_entries=MAX_CACHE_ENTRIES, show_spinner=False)
+def cached_latest_workflow_runs(version: str) -> pd.DataFrame:
+    """
+    Cache `collect_latest_workflow_runs` per version of the stored workflow blobs.
+
+    Args: version (str): Fingerprint of the workflow blobs, used only as the cache key.
+
+    Returns: pd.DataFrame: A DataFrame containing the most recent workflow run per file.
+    """
+    return collect_latest_workflow_runs()
+
+
+@st.cache_data(max_entries=MAX_CACHE_ENTRIES, show_spinner=False)
+def cached_workflow_runs(repo: str, workflow: str, limit: Optional[int], version: str) -> Optional[pd.DataFrame]:
+    """
+    Cache `load_workflow_runs` per workflow and version of its stored run history.
+
+    Args:
+        repo (str): The name of the GitHub repository.
+        workflow (str): The name of the workflow.
+        limit (Optional[int]): Maximum number of most recent runs to load.
+        version (str): Fingerprint of the run history blobs of the workflow, used only as the cache key.
+
+    Returns: Optional[pd.DataFrame]: The run history, newest first, or None if it could not be read.
+    """
+    return load_workflow_runs(repo=repo, workflow=workflow, limit=limit)
+
+
+@st.cache_data(max_entries=MAX_CACHE_ENTRIES, show_spinner=False)
+def cached_rollup_trend(repo: str, workflow: Optional[str], granularity: str, version: str) -> Optional[pd.DataFrame]:
+    """
+    Cache `load_rollup_trend` per rollup, granularity and version of the rollup blob.
+
+    Args:
+        repo (str): The name of the GitHub repository.
+        workflow (Optional[str]): The name of the workflow, or None for the repository rollup.
+        granularity (str): "daily" or "weekly".
+        version (str): Fingerprint of the rollup blob, used only as the cache key.
+
+    Returns: Optional[pd.DataFrame]: One row per period, oldest first, or None if no rollup has been written.
+    """
+    return load_rollup_trend(repo=repo, workflow=workflow, granularity=granularity)
+
+
+def get_repo_workflow_map() -> dict:
+    """
+    Retrieve the repository to workflow mapping, cached until a workflow blob changes.
+
+    Returns: dict: A dictionary mapping each repository name to a list of its workflows.
+    """
+    return cached_repo_workflow_map(version=blob_version(prefixes=WORKFLOW_PREFIXES))
+
+
+def get_latest_workflow_runs() -> pd.DataFrame:
+    """
+    Retrieve the latest run of every workflow, cached until a workflow blob changes.
+
+    Returns: pd.DataFrame: A DataFrame containing the most recent workflow run per file.
+    """
+    return cached_latest_workflow_runs(version=blob_version(prefixes=WORKFLOW_PREFIXES))
+
+
+def get_workflow_runs(repo: str, workflow: str, limit: Optional[int] = None) -> Optional[pd.DataFrame]:
+    """
+    Retrieve the run history of a workflow, cached until one of its blobs changes.
+
+    Args:
+        repo (str): The name of the GitHub repository.
+        workflow (str): The name of the workflow.
+        limit (Optional[int]): Maximum number of most recent runs to load. If None, the full history is loaded.
+
+    Returns: Optional[pd.DataFrame]: The run history, newest first, or None if it could not be read.
+    """
+    prefixes = (PartitionedRunStore.partition_prefix(repo=repo, workflow=workflow),
+                f"workflows/{repo}_{workflow}.json", columnar_blob_name(repo=repo, workflow_name=workflow))
+
+    return cached_workflow_runs(repo=repo, workflow=workflow, limit=limit, version=blob_version(prefixes=prefixes))
+
+
+def get_rollup_trend(repo: str, workflow: Optional[str] = None, granularity: str = "daily") -> Optional[pd.DataFrame]:
+    """
+    Retrieve the rollup of a workflow or repository, cached until the rollup blob changes.
+
+    Args:
+        repo (str): The name of the GitHub repository.
+        workflow (Optional[str]): The name of the workflow. If None, the repository rollup is retrieved.
+        granularity (str): "daily" or "weekly".
+
+    Returns: Optional[pd.DataFrame]: One row per period, oldest first, or None if no rollup has been written.
+    """
+    name = RollupStore.repo_rollup_name(repo=repo) if workflow is None \
+        else RollupStore.workflow_rollup_name(repo=repo, workflow=workflow)
+
+    return cached_rollup_trend(repo=repo, workflow=workflow, granularity=granularity,
+                               version=blob_version(prefixes=(name,)))
@@ -1,74 +1,212 @@
 # Import dependencies
+from azure.core.exceptions import ResourceNotFoundError
+from shared import AbstractBlobClient, BlobClient, CachedBlobClient, PartitionedRunStore, RollupStore, WorkflowIndex, \
+    MANIFEST_FILENAME, apply_run_schema, build_runs_dataframe, columnar_blob_name, to_utc_datetime
+from typing import List, Optional
 from datetime import datetime, timezone
-from shared import BlobClient
 import pandas as pd
+import numpy as np
+import logging
+
+# Prefix turning repository names into GitHub links
+REPO_URL_PREFIX = "https://github.com/powellrhys/"
+
+# Logger reporting blobs the frontend could not read
+logger = logging.getLogger(__name__)
+
+def create_blob_client() -> AbstractBlobClient:
+    """
+    Create the blob client used by the frontend, reading through the local disk cache
+    and the blob listing snapshots shared by every session of the process.
+
+    Returns:
+        AbstractBlobClient: A caching blob client wrapping the frontend BlobClient.
+    """
+    return CachedBlobClient(client=BlobClient(source="frontend"))
 
 def collect_project_workflows() -> list:
     """
     Retrieve a list of all workflow JSON files stored in the local data directory.
 
+    Workflows stored only as monthly partitions are listed under the same
+    '<repo>_<workflow>.json' naming convention.
+
     Returns:
         list: A list of filenames representing saved workflow data.
     """
-    return [file.split("/")[-1] for file in BlobClient(source="frontend")
-            .list_blob_filenames(container_name="project-monitoring", directory_path="workflows")]
+    blob_client = create_blob_client()
+    files = [file.split("/")[-1] for file in
+             blob_client.list_blob_filenames(container_name="project-monitoring", directory_path="workflows")]
 
-def create_repo_workflow_map() -> dict:
+    # Add workflows with partitioned run histories
+    partitioned = [f"{repo}_{workflow}.json" for repo, workflow in
+                   PartitionedRunStore(client=blob_client).list_workflows()]
+
+    return files + [file for file in partitioned if file not in files]
+
+def create_workflow_index() -> WorkflowIndex:
     """
-    Create a mapping between repositories and their corresponding workflows.
+    Build an index of the stored workflows, their blobs and latest runs.
 
-    Scans the data directory for workflow JSON files and groups them by repository
-    name, based on the file naming convention 'workflows_<repo>_<workflow>.json'.
+    The index is built in one pass from the latest run manifest, which records the
+    repository and workflow name of every workflow, and the names of the stored
+    workflow and partition blobs, which add workflows the manifest does not hold yet.
 
     Returns:
-        dict: A dictionary mapping each repository name to a list of its workflows.
+        WorkflowIndex: The index of stored workflows.
     """
-    # Collect files
-    files = collect_project_workflows()
+    blob_client = create_blob_client()
+
+    # Read the manifest, if the scraper has written one
+    try:
+        manifest = blob_client.read_blob_to_dict(container="project-monitoring", input_filename=MANIFEST_FILENAME)
+    except ResourceNotFoundError:
+        manifest = {}
+
+    # List flat and partitioned workflow histories
+    blob_names = blob_client.list_blob_filenames(container_name="project-monitoring", directory_path="workflows") \
+        + blob_client.list_blob_filenames(container_name="project-monitoring", directory_path="runs/")
 
-    # Collect list of unique projects
-    projects = list(set([file.split("_")[0] for file in files]))
+    return WorkflowIndex.build(manifest=manifest, blob_names=blob_names)
 
-    return {
-        project: [
-            wf.replace(f"{project}_", "").replace(".json", "")
-            for wf in files if project in wf
-        ]
-        for project in projects
-    }
+def create_repo_workflow_map() -> dict:
+    """
+    Create a mapping between repositories and their corresponding workflows.
+
+    Returns:
+        dict: A dictionary mapping each repository name to a list of its workflows, both in name order.
+    """
+    return create_workflow_index().to_map()
 
 def collect_latest_workflow_runs() -> pd.DataFrame:
     """
     Collect the most recent workflow run from each workflow JSON file.
 
-    Reads workflow data files from the data directory, extracts the latest recorded
-    run from each, and compiles the results into a pandas DataFrame.
+    Reads the latest run of every workflow from the manifest maintained by the
+    scraper in a single request. If no manifest exists yet, all workflow data files
+    are read concurrently instead, skipping files that hold no runs. Files that cannot
+    be read are logged with their error and listed in the `skipped_workflows` attribute
+    of the DataFrame, so the page can report them. The DataFrame is built with the typed
+    workflow run schema.
 
     Returns:
         pd.DataFrame: A DataFrame containing the most recent workflow run per file.
     """
+    blob_client = create_blob_client()
+
+    # Read latest runs from the manifest
+    try:
+        manifest = blob_client.read_blob_to_dict(container="project-monitoring", input_filename=MANIFEST_FILENAME)
+        return build_runs_dataframe(runs=[entry["latest_run"] for entry in manifest.values()
+                                          if entry.get("latest_run")])
+    except ResourceNotFoundError:
+        pass
+
     # List files
-    files = BlobClient(source="frontend") \
-        .list_blob_filenames(container_name="project-monitoring", directory_path="workflows")
+    files = blob_client.list_blob_filenames(container_name="project-monitoring", directory_path="workflows")
 
-    # Load all files and store latest workflow runs
-    workflows = []
-    for file in files:
-        data = BlobClient(source="frontend") \
-            .read_blob_to_dict(container="project-monitoring", input_filename=f"{file}")
+    # Load all files concurrently
+    results = blob_client.read_blobs_to_dicts(container="project-monitoring", input_filenames=files)
 
-        # Grab last run and append to workflows list
-        last_run = data[0]
-        workflows.append(last_run)
+    # Grab last run of each readable file, reporting files that could not be read
+    workflows, skipped = [], []
+    for filename, data in zip(files, results):
+        if isinstance(data, Exception):
+            logger.warning(f"Unable to read workflow runs from {filename}: {data!r}")
+            skipped.append(filename)
+        elif isinstance(data, list) and data:
+            workflows.append(data[0])
 
-    return pd.DataFrame(workflows)
+    df = build_runs_dataframe(runs=workflows)
+    df.attrs["skipped_workflows"] = skipped
+
+    return df
+
+def load_workflow_runs(
+    repo: str,
+    workflow: str,
+    columns: Optional[List[str]] = None,
+    limit: Optional[int] = None
+) -> Optional[pd.DataFrame]:
+    """
+    Load the run history of a workflow into a DataFrame.
+
+    Reads the monthly partitions written by the scraper, newest first, fetching only
+    as many partitions as needed for `limit` runs. Workflows that are not partitioned
+    are read from the typed columnar (Parquet) copy, with only the requested columns.
+    If no columnar copy exists, or pyarrow is unavailable, the JSON history is read
+    instead. Every source is returned with the typed workflow run schema.
+
+    Args:
+        repo (str): The name of the GitHub repository.
+        workflow (str): The name of the workflow.
+        columns (Optional[List[str]]): Columns to load. If None, all columns are loaded.
+        limit (Optional[int]): Maximum number of most recent runs to load. If None, the full history is loaded.
+
+    Returns:
+        Optional[pd.DataFrame]: The run history, newest first, or None if it could not be read.
+    """
+    blob_client = create_blob_client()
+
+    # Read the most recent partitions
+    try:
+        df = PartitionedRunStore(client=blob_client).read_dataframe(repo=repo, workflow=workflow, limit=limit,
+                                                                    columns=columns)
+        if df is not None:
+            return df
+    except ImportError:
+        pass
+
+    # Read the columnar copy with column projection
+    try:
+        df = blob_client.read_blob_to_dataframe(container="project-monitoring",
+                                                input_filename=columnar_blob_name(repo=repo, workflow_name=workflow),
+                                                columns=columns)
+        return apply_run_schema(df=df.iloc[:limit].copy())
+    except (ResourceNotFoundError, ImportError):
+        pass
+
+    # Fall back to the JSON history
+    data, = blob_client.read_blobs_to_dicts(container="project-monitoring",
+                                            input_filenames=[f"workflows/{repo}_{workflow}.json"])
+    if isinstance(data, Exception) or not data:
+        return None
+
+    return build_runs_dataframe(runs=data[:limit], columns=columns)
+
+def load_rollup_trend(repo: str, workflow: Optional[str] = None, granularity: str = "daily") -> Optional[pd.DataFrame]:
+    """
+    Load the daily or weekly rollup of a workflow or repository written by the scraper.
+
+    A rollup covers the full stored history in a single small blob, so long-range trends
+    are charted without reading any run history.
+
+    Args:
+        repo (str): The name of the GitHub repository.
+        workflow (Optional[str]): The name of the workflow. If None, the repository rollup is loaded.
+        granularity (str): "daily" or "weekly".
+
+    Returns:
+        Optional[pd.DataFrame]: One row per period, oldest first, with run counts, success and failure
+            rates and p50/p90/p99 durations, or None if no rollup has been written.
+    """
+    trend = RollupStore(client=create_blob_client()).read_trend(repo=repo, workflow=workflow, granularity=granularity)
+    if not trend:
+        return None
+
+    df = pd.DataFrame(data=trend)
+    df["period"] = pd.to_datetime(df["period"], utc=True)
+
+    return df
 
 def transform_workflow_overview_df(df: pd.DataFrame) -> pd.DataFrame:
     """
     Transform workflow run data for presentation in the workflow overview dashboard.
 
     Enhances the input DataFrame by formatting durations, calculating days since the
-    last run, flagging inactive workflows, and sorting for readability.
+    last run, flagging inactive workflows, and sorting for readability. Every column is
+    derived with vectorized operations; missing durations are left empty and missing
+    states are flagged inactive.
 
     Args:
         df (pd.DataFrame): A DataFrame containing workflow run data.
@@ -76,12 +214,19 @@ def transform_workflow_overview_df(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: A transformed and sorted DataFrame ready for display.
     """
-    # Convert seconds → minutes:seconds and append url prefix to repo column
-    df["duration"] = df["duration_seconds"].apply(lambda x: f"{int(x // 60)}m {int(x % 60)}s")
-    df["repo"] = "https://github.com/powellrhys/" + df["repo"]
+    # Convert seconds → minutes:seconds, formatting each distinct duration once and leaving missing durations empty
+    codes, durations = pd.factorize(pd.to_numeric(df["duration_seconds"], errors="coerce"))
+    labels = np.array([f"{int(x // 60)}m {int(x % 60)}s" for x in durations] + [None], dtype=object)
+    df["duration"] = labels[codes]
+
+    # Append url prefix to repo column, renaming categories rather than rows of categorical repos
+    if isinstance(df["repo"].dtype, pd.CategoricalDtype):
+        df["repo"] = df["repo"].cat.rename_categories(lambda repo: REPO_URL_PREFIX + repo)
+    else:
+        df["repo"] = REPO_URL_PREFIX + df["repo"]
 
-    # Ensure updated_at is a datetime
-    df["updated_at"] = pd.to_datetime(df["updated_at"], utc=True)
+    # Ensure updated_at is a UTC datetime
+    df["updated_at"] = to_utc_datetime(timestamps=df["updated_at"])
 
     # Today's date (UTC to match GitHub timestamps)
     today = datetime.now(timezone.utc)
@@ -90,8 +235,8 @@ def transform_workflow_overview_df(df: pd.DataFrame) -> pd.DataFrame:
     df["days_since_last_run"] = (today - df["updated_at"]).dt.days
 
     # Create status flag column
-    df["status_flag"] = df["active_status"] \
-        .apply(lambda d: "🟢 Active" if d.strip().lower() == "active" else "🔴 Inactive")
+    active = df["active_status"].astype("string").str.strip().str.lower().eq("active").fillna(False)
+    df["status_flag"] = np.where(active, "🟢 Active", "🔴 Inactive")
 
     # Filter data columns
     df = df[
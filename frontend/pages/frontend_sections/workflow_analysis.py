@@ -1,9 +1,11 @@
 # Import dependencies
 from streamlit_components.plot_functions import PlotlyPlotter
-from functions.data_functions import create_repo_workflow_map
-from shared import BlobClient
+from functions.cached_data_functions import get_repo_workflow_map, get_workflow_runs, get_rollup_trend
+from shared import ROLLUP_GRANULARITIES, apply_run_schema
 import streamlit as st
-import pandas as pd
+
+# Maximum number of most recent runs that can be displayed
+MAX_RUNS = 30
 
 def render_workflows_analysis() -> None:
     """
@@ -12,13 +14,14 @@ def render_workflows_analysis() -> None:
     Displays interactive controls to select a repository and workflow, visualize
     recent workflow run durations and status distributions, and inspect detailed
     run information in a data table. Uses JSON data generated by the workflow
-    scraper to populate charts and tables.
+    scraper to populate charts and tables, and its daily and weekly rollups to
+    chart trends over the full stored history.
     """
     # Render title
     st.title("Workflow Analysis")
 
     # Collect repo workflow map
-    repo_wf_map = create_repo_workflow_map()
+    repo_wf_map = get_repo_workflow_map()
 
     # Define columns
     columns = st.columns([1, 1, 1, 2, 1])
@@ -31,27 +34,25 @@ def render_workflows_analysis() -> None:
     with columns[1]:
         workflow = st.selectbox(label="Workflow", options=repo_wf_map[repo])
 
-    # Read data from storage
-    data = BlobClient(source="frontend") \
-        .read_blob_to_dict(container="project-monitoring", input_filename=f"workflows/{repo}_{workflow}.json")
-
-    # Generate dataframe from data
-    df = pd.DataFrame(data=data)
+    # Read the most recent runs from storage, reporting unreadable workflow files
+    df = get_workflow_runs(repo=repo, workflow=workflow, limit=MAX_RUNS)
+    if df is None or df.empty:
+        st.error(f"Unable to load workflow runs for {repo} / {workflow}")
+        return
 
-    # Modify dataframe data
-    df['created_at'] = pd.to_datetime(df['created_at'])
-    df['conclusion'] = df['conclusion'].str.capitalize()
-    df['status'] = df['status'].str.capitalize()
+    # Capitalize states, keeping the categorical dtype of the run schema
+    df = apply_run_schema(df=df.assign(conclusion=df['conclusion'].astype('string').str.capitalize(),
+                                       status=df['status'].astype('string').str.capitalize()))
 
     # Render navigation button in first column
     with columns[0]:
         st.link_button(label="Navigate to Workflow",
-                       url='/'.join(data[0]["html_url"].split('/')[:-2]),
+                       url='/'.join(df["html_url"].iloc[0].split('/')[:-2]),
                        use_container_width=True)
 
     # Render number of workflows slider in final column
     with columns[-1]:
-        n_runs = st.slider(label="Most Recent Pipeline Runs", min_value=5, max_value=30, value=10)
+        n_runs = st.slider(label="Most Recent Pipeline Runs", min_value=5, max_value=MAX_RUNS, value=10)
 
     # Render expander object
     with st.expander(label="Workflow Performance Metrics", expanded=True):
@@ -77,7 +78,38 @@ def render_workflows_analysis() -> None:
                 title='Workflow Status Distribution'
             ).plot_pie())
 
-    # Render dataframe in second expander
+    # Render long-range trends from the rollups written by the scraper
+    with st.expander(label="Workflow Trends", expanded=True):
+        granularity = st.radio(label="Granularity", options=ROLLUP_GRANULARITIES, horizontal=True,
+                               format_func=str.capitalize)
+        trend = get_rollup_trend(repo=repo, workflow=workflow, granularity=granularity)
+
+        if trend is None:
+            st.info(f"No rollups recorded for {repo} / {workflow} yet")
+        else:
+            columns = st.columns(2)
+
+            # Render duration percentiles in first column
+            with columns[0]:
+                st.plotly_chart(PlotlyPlotter(
+                    df=trend,
+                    x='period',
+                    y=['p50', 'p90', 'p99'],
+                    title='Workflow Run Duration Percentiles',
+                    markers=True,
+                    labels={'value': 'Duration (s)', 'period': 'Period'}).plot_line())
+
+            # Render success rate in final column
+            with columns[-1]:
+                st.plotly_chart(PlotlyPlotter(
+                    df=trend,
+                    x='period',
+                    y='success_rate',
+                    title='Workflow Success Rate',
+                    markers=True,
+                    labels={'success_rate': 'Success Rate', 'period': 'Period'}).plot_line())
+
+    # Render dataframe in final expander
     with st.expander(label="Workflow Breakdown", expanded=True):
         st.dataframe(
             df.head(n_runs).drop(["run_number"], axis=1),
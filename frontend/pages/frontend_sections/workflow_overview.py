@@ -14,6 +14,11 @@ def render_workflow_overview(df: pd.DataFrame) -> None:
     # Render section title
     st.title("Project Workflows Overview")
 
+    # Report workflow files that could not be read
+    skipped = df.attrs.get("skipped_workflows", [])
+    if skipped:
+        st.warning(f"Unable to load {len(skipped)} workflow(s), not shown below: {', '.join(skipped)}")
+
     # Transform dataframe
     df = transform_workflow_overview_df(df=df)
 
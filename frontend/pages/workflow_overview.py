@@ -1,7 +1,7 @@
 # Import python and project dependencies
 from frontend.pages.frontend_sections.workflow_overview import render_workflow_overview
 from streamlit_components.ui_components import configure_page_config
-from functions.data_functions import collect_latest_workflow_runs
+from functions.cached_data_functions import get_latest_workflow_runs
 import streamlit as st
 
 # Set page config
@@ -16,7 +16,7 @@ if not st.user.is_logged_in:
 if st.user.is_logged_in:
 
     # Read in workflow data
-    df = collect_latest_workflow_runs()
+    df = get_latest_workflow_runs()
 
     # Render workflow overview page
     render_workflow_overview(df=df)
@@ -1,5 +1,25 @@
 # Import dependencies
-from .functions import Variables, BlobClient
+from .functions import ROLLUP_GRANULARITIES, Variables, BlobClient, BlobCache, CachedBlobClient, PartitionedRunStore, \
+    RollupStore, apply_run_schema, build_runs_dataframe, check_columnar, columnar_blob_name, to_utc_datetime
 from .interfaces import AbstractBlobClient
+from .models import MANIFEST_FILENAME, WorkflowIndex, WorkflowRun, build_manifest_entry
 
-__all__ = ["AbstractBlobClient", "BlobClient", "Variables"]
+__all__ = [
+    "MANIFEST_FILENAME",
+    "ROLLUP_GRANULARITIES",
+    "apply_run_schema",
+    "build_runs_dataframe",
+    "check_columnar",
+    "columnar_blob_name",
+    "to_utc_datetime",
+    "AbstractBlobClient",
+    "BlobCache",
+    "BlobClient",
+    "CachedBlobClient",
+    "PartitionedRunStore",
+    "RollupStore",
+    "Variables",
+    "WorkflowIndex",
+    "WorkflowRun",
+    "build_manifest_entry"
+]
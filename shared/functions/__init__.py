@@ -1,5 +1,29 @@
 # Import dependencies
+from .columnar import COLUMNAR_DIRECTORY, check_columnar, columnar_blob_name
+from .cached_blob_client import CachedBlobClient, BlobCache
+from .blob_listing import ListingCache, diff_listings
+from .partitioned_run_store import PartitionedRunStore
+from .run_rollups import ROLLUP_GRANULARITIES, RollupStore
+from .run_schema import RUN_COLUMNS, apply_run_schema, build_runs_dataframe, run_dtypes, to_utc_datetime
 from .blob_client import BlobClient
 from .variables import Variables
 
-__all__ = ["BlobClient", "Variables"]
+__all__ = [
+    "COLUMNAR_DIRECTORY",
+    "ROLLUP_GRANULARITIES",
+    "RUN_COLUMNS",
+    "BlobCache",
+    "BlobClient",
+    "CachedBlobClient",
+    "ListingCache",
+    "PartitionedRunStore",
+    "RollupStore",
+    "Variables",
+    "apply_run_schema",
+    "build_runs_dataframe",
+    "check_columnar",
+    "columnar_blob_name",
+    "diff_listings",
+    "run_dtypes",
+    "to_utc_datetime"
+]
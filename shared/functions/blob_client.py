@@ -1,11 +1,75 @@
 # Install dependencies
 from ..interfaces.blob_client_base import AbstractBlobClient
-from azure.storage.blob import BlobServiceClient
-from typing import Optional, Union, List
+from azure.core.exceptions import ResourceNotFoundError, ResourceNotModifiedError
+from azure.core.pipeline.transport import RequestsTransport
+from azure.storage.blob import BlobServiceClient, ContentSettings
+from .blob_encoding import check_encoding, encode_content, decode_content
+from .json_codec import check_codec, encode_json, decode_json, decode_runs
+from .columnar import PARQUET_CONTENT_TYPE, runs_to_parquet, parquet_to_dataframe
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union, List, Tuple
+from azure.core import MatchConditions
+from requests.adapters import HTTPAdapter
 from .variables import Variables
-import json
+from ..models.workflow_run import WorkflowRun
+import pandas as pd
+import threading
+import requests
+import hashlib
 
-class BlobClient(AbstractBlobClient):
+# Blob metadata key holding the SHA-256 hash of the uncompressed blob content
+CONTENT_HASH_METADATA_KEY = "content_sha256"
+
+class BatchReadMixin:
+    """
+    Reads many JSON blobs at a time for blob clients providing `read_blob_bytes`.
+
+    Shared by `BlobClient` and `CachedBlobClient`, so batch reads go through each client's
+    own single blob read path - and through the cache of a caching client.
+    """
+    # JSON codec used to decode blobs. If None, the fastest installed codec is used
+    codec: Optional[str] = None
+
+    def read_blobs_to_dicts(
+        self,
+        container: str,
+        input_filenames: List[str],
+        max_workers: int = 8
+    ) -> List[Union[list, dict, Exception]]:
+        """
+        Download and deserialize many JSON blobs concurrently.
+
+        Blobs are read with `read_blob_bytes` on a bounded thread pool. A failed blob does
+        not abort the batch: its position in the result holds the raised exception, so
+        callers can report or skip it.
+
+        Args:
+            container (str): Name of the container to read from.
+            input_filenames (List[str]): The names of the blobs (JSON files) to retrieve.
+            max_workers (int): Maximum number of blobs downloaded at the same time.
+
+        Returns:
+            List[Union[list, dict, Exception]]: The deserialized JSON content of each blob, in input
+                order, or the exception raised while reading it.
+        """
+        def read(input_filename: str) -> Union[list, dict, Exception]:
+            try:
+                content, _ = self.read_blob_bytes(container=container, input_filename=input_filename)
+                return decode_json(content=decode_content(content=content), codec=self.codec)
+            except Exception as e:
+                return e
+
+        # Read sequentially when there is nothing to parallelise
+        if max_workers <= 1 or len(input_filenames) <= 1:
+            return [read(input_filename) for input_filename in input_filenames]
+
+        # Fan reads out across a bounded pool, preserving input order
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(input_filenames)),
+                                thread_name_prefix="blob-read") as executor:
+            return list(executor.map(read, input_filenames))
+
+
+class BlobClient(BatchReadMixin, AbstractBlobClient):
     """
     A client for interacting with Azure Blob Storage.
 
@@ -20,23 +84,127 @@ class BlobClient(AbstractBlobClient):
     - Retrieving stored data for downstream processing.
 
     Inherits:
+        BatchReadMixin: Reads many JSON blobs concurrently through `read_blob_bytes`.
         AbstractBlobClient: Base class defining common blob client behavior.
         Variables: Provides configuration variables such as connection strings.
 
+    A single `BlobServiceClient` is shared process-wide per connection string. It is
+    created lazily on first use, so every `BlobClient` instance (and every thread)
+    reuses the same warm HTTP connection pool.
+
+    Uploads may be compressed with gzip or zstd, in which case the `Content-Encoding`
+    and `Content-Type` blob properties are set. Reads detect compressed content and
+    decode it transparently, so compressed and uncompressed blobs can coexist. Run
+    histories can also be stored in a typed columnar (Parquet) format that is read
+    straight into a DataFrame.
+
+    JSON is serialized with the fastest available codec (msgspec, then orjson, then
+    the stdlib `json` module) unless a codec is configured. Every codec decodes to
+    the same values, so blobs written by any codec can be read by any other.
+
+    Every upload records a SHA-256 hash of its uncompressed content in the blob
+    metadata. Uploads whose content and encoding match the stored blob are skipped,
+    so unchanged blobs keep their ETag and `last_modified` time. Uploaded and skipped
+    counts are reported by `upload_summary`.
+
     Attributes:
         blob_storage_connection_string (str): Inherited from `Variables`,
             used to authenticate and connect to the Azure Blob account.
+        pool_maxsize (int): Number of pooled HTTP connections of the shared service client.
+        encoding (Optional[str]): Content encoding of uploaded blobs ("gzip", "zstd" or None).
+        skip_unchanged (bool): Whether uploads matching the stored blob content are skipped.
+        codec (Optional[str]): JSON codec ("msgspec", "orjson", "json"), or None for the fastest available.
     """
-    def __init__(self, source: str = "backend"):
+    # Process-wide service clients, keyed by connection string
+    service_clients: dict = {}
+    service_clients_lock = threading.Lock()
+    pool_maxsize: int = 10
+    encoding: Optional[str] = None
+    skip_unchanged: bool = True
+    codec: Optional[str] = None
+    upload_stats: Optional[dict] = None
+    upload_stats_lock = threading.RLock()
+
+    def __init__(
+        self,
+        source: str = "backend",
+        pool_maxsize: int = 10,
+        encoding: Optional[str] = None,
+        skip_unchanged: bool = True,
+        json_codec: Optional[str] = None
+    ):
         """
         Initialize the BlobClient instance.
 
         Calls the parent class initializers (`AbstractBlobClient` and `Variables`)
         to ensure that the Azure Blob Storage connection string and other
         required configuration variables are set up before use.
+
+        Args:
+            source (str): "backend" to read configuration from environment variables, or
+                "frontend" to read it from Streamlit secrets.
+            pool_maxsize (int): Number of pooled HTTP connections used if this instance creates
+                the shared service client. Has no effect once the client exists.
+            encoding (Optional[str]): Compress uploaded blobs with "gzip" or "zstd". If None,
+                blobs are uploaded as plain JSON.
+            skip_unchanged (bool): If True, uploads whose content hash matches the stored blob are skipped.
+            json_codec (Optional[str]): Serialize JSON with "msgspec", "orjson" or "json". If None, the
+                fastest installed codec is used.
         """
         super().__init__()
+        check_encoding(encoding=encoding)
+        check_codec(codec=json_codec)
         self.vars = Variables(source=source)
+        self.pool_maxsize = pool_maxsize
+        self.encoding = encoding
+        self.skip_unchanged = skip_unchanged
+        self.codec = json_codec
+        self.reset_upload_stats()
+
+    @property
+    def blob_service_client(self) -> BlobServiceClient:
+        """
+        The process-wide BlobServiceClient of the configured connection string.
+
+        Returns: BlobServiceClient: The shared service client, created on first access.
+        """
+        return self.get_service_client(connection_string=self.vars.blob_storage_connection_string,
+                                       pool_maxsize=self.pool_maxsize)
+
+    @classmethod
+    def get_service_client(cls, connection_string: str, pool_maxsize: int = 10) -> BlobServiceClient:
+        """
+        Retrieve the shared BlobServiceClient of a connection string, creating it on first use.
+
+        Args:
+            connection_string (str): Azure Blob Storage connection string.
+            pool_maxsize (int): Number of pooled HTTP connections if the client is created.
+
+        Returns: BlobServiceClient: The shared service client.
+        """
+        with cls.service_clients_lock:
+            if connection_string not in cls.service_clients:
+
+                # Build a transport on a session with a sized connection pool
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+
+                cls.service_clients[connection_string] = BlobServiceClient.from_connection_string(
+                    connection_string, transport=RequestsTransport(session=session, session_owner=False))
+
+            return cls.service_clients[connection_string]
+
+    @classmethod
+    def clear_service_clients(cls) -> None:
+        """
+        Close and forget all shared service clients.
+        """
+        with cls.service_clients_lock:
+            for service_client in cls.service_clients.values():
+                service_client.close()
+            cls.service_clients.clear()
 
     def list_blob_filenames(
         self,
@@ -55,54 +223,183 @@ class BlobClient(AbstractBlobClient):
         Returns:
             List[str]: List of blob names matching the prefix.
         """
-        # Create blob service client + container client
-        blob_service_client = BlobServiceClient.from_connection_string(self.vars.blob_storage_connection_string)
-        container_client = blob_service_client.get_container_client(container_name)
+        return [blob["name"] for blob in self.list_blob_properties(container_name=container_name,
+                                                                   directory_path=directory_path)]
+
+    def list_blob_properties(self, container_name: str, directory_path: Optional[str] = "") -> List[dict]:
+        """
+        List the blobs in a container with their properties, optionally filtered by a directory prefix.
 
-        # Collect a list of files in a container
-        blob_names = []
-        blobs_list = container_client.list_blobs(name_starts_with=directory_path)
-        for blob in blobs_list:
-            blob_names.append(blob.name)
+        Properties come from the listing response itself, so no request is made per blob.
 
-        return blob_names
+        Args:
+            container_name (str): Name of the container.
+            directory_path (Optional[str]): Directory prefix inside the container (e.g. "folder1/subfolder/").
+
+        Returns:
+            List[dict]: The `name`, `size`, `last_modified` and `etag` of every blob matching the prefix.
+        """
+        # Create container client from the shared blob service client
+        container_client = self.blob_service_client.get_container_client(container_name)
+
+        return [
+            {"name": blob.name, "size": blob.size, "last_modified": blob.last_modified, "etag": blob.etag}
+            for blob in container_client.list_blobs(name_starts_with=directory_path)
+        ]
 
     def export_dict_to_blob(
         self,
         data: list,
         container: str,
         output_filename: str
-    ) -> None:
+    ) -> dict:
         """
         Upload a Python list or dictionary to Azure Blob Storage as a JSON file.
 
         The method serializes the given data into a JSON string, connects to the
         specified Azure Blob Storage container, and writes the JSON to the given
-        blob filename. If the blob already exists, it will be overwritten.
+        blob filename. If the blob already exists, it will be overwritten, unless it
+        already holds the same content.
 
         Args:
-            data (list): The Python object (typically a list of dicts) to be serialized and uploaded.
+            data (list): The Python object (typically a list of dicts or records exposing `to_dict`)
+                to be serialized and uploaded.
             container (str): Name of the Azure Blob Storage container where the data will be stored.
             output_filename (str): The blob (file) name under which the JSON data will be saved.
 
         Returns:
-            None
+            dict: Properties of the uploaded (or unchanged) blob, including its `etag` and `last_modified` time.
         """
-        # Convert the data to a JSON string
-        json_data = json.dumps(data)
+        # Convert the data to JSON, serialising typed records one at a time
+        json_data = encode_json(data=data, codec=self.codec, default=self.json_default)
 
-        # Connect to Azure Blob Storage
-        blob_service_client = BlobServiceClient.from_connection_string(
-            self.vars.blob_storage_connection_string)
+        # Upload the JSON document to Azure Blob Storage
+        if self.encoding is None:
+            return self.upload_content(container=container, output_filename=output_filename, content=json_data,
+                                       content_hash=hashlib.sha256(json_data).hexdigest())
 
-        # Connect to the specific blob in the container
-        blob_client = blob_service_client.get_blob_client(
+        # Upload compressed JSON, recording the encoding in the blob properties
+        return self.upload_content(
             container=container,
-            blob=output_filename
+            output_filename=output_filename,
+            content=encode_content(data=json_data, encoding=self.encoding),
+            content_hash=hashlib.sha256(json_data).hexdigest(),
+            content_settings=ContentSettings(content_type="application/json", content_encoding=self.encoding)
         )
 
-        # Upload the JSON string to Azure Blob Storage
-        blob_client.upload_blob(json_data, overwrite=True)
+    def export_runs_to_parquet(self, runs: list, container: str, output_filename: str) -> dict:
+        """
+        Upload a workflow run history to Azure Blob Storage as a Parquet file.
+
+        Args:
+            runs (list): WorkflowRun records or run dictionaries, newest first.
+            container (str): Name of the Azure Blob Storage container where the data will be stored.
+            output_filename (str): The blob (file) name under which the Parquet data will be saved.
+
+        Returns:
+            dict: Properties of the uploaded blob, including its `etag` and `last_modified` time.
+
+        Raises:
+            ImportError: If `pyarrow` is not installed.
+        """
+        content = runs_to_parquet(runs=runs)
+        return self.upload_content(container=container, output_filename=output_filename, content=content,
+                                   content_hash=hashlib.sha256(content).hexdigest(),
+                                   content_settings=ContentSettings(content_type=PARQUET_CONTENT_TYPE))
+
+    def upload_content(
+        self,
+        container: str,
+        output_filename: str,
+        content: Union[str, bytes],
+        content_hash: str,
+        content_settings: Optional[ContentSettings] = None
+    ) -> dict:
+        """
+        Upload blob content, skipping the upload if the stored blob holds the same content.
+
+        The stored blob is unchanged if its `content_sha256` metadata matches the content
+        hash and it is stored with the same content encoding.
+
+        Args:
+            container (str): Name of the Azure Blob Storage container where the data will be stored.
+            output_filename (str): The blob (file) name under which the content will be saved.
+            content (Union[str, bytes]): The content to upload, encoded as it will be stored.
+            content_hash (str): SHA-256 hex digest of the uncompressed content.
+            content_settings (Optional[ContentSettings]): Content type and encoding of the blob, if any.
+
+        Returns:
+            dict: Properties of the uploaded (or unchanged) blob, including its `etag` and `last_modified` time.
+        """
+        blob_client = self.blob_service_client.get_blob_client(container=container, blob=output_filename)
+        size = len(content)
+
+        # Compare the content hash with the metadata of the stored blob
+        if self.skip_unchanged:
+            try:
+                properties = blob_client.get_blob_properties()
+                if (properties.metadata or {}).get(CONTENT_HASH_METADATA_KEY) == content_hash and \
+                        (properties.content_settings.content_encoding or None) == \
+                        (content_settings.content_encoding if content_settings else None):
+                    self.record_upload(skipped=True, size=size)
+                    return {"etag": properties.etag, "last_modified": properties.last_modified}
+            except ResourceNotFoundError:
+                pass
+
+        # Upload the content, recording its hash in the blob metadata
+        kwargs = {"content_settings": content_settings} if content_settings else {}
+        properties = blob_client.upload_blob(content, overwrite=True,
+                                             metadata={CONTENT_HASH_METADATA_KEY: content_hash}, **kwargs)
+        self.record_upload(skipped=False, size=size)
+
+        return properties
+
+    def reset_upload_stats(self) -> None:
+        """
+        Reset the uploaded and skipped counts reported by `upload_summary`.
+        """
+        with self.upload_stats_lock:
+            self.upload_stats = {"uploaded": 0, "skipped": 0, "bytes_uploaded": 0, "bytes_saved": 0}
+
+    def record_upload(self, skipped: bool, size: int) -> None:
+        """
+        Count an uploaded or skipped blob.
+
+        Args:
+            skipped (bool): True if the upload was skipped as the stored blob was unchanged.
+            size (int): Size of the blob content in bytes.
+        """
+        with self.upload_stats_lock:
+            if self.upload_stats is None:
+                self.reset_upload_stats()
+            self.upload_stats["skipped" if skipped else "uploaded"] += 1
+            self.upload_stats["bytes_saved" if skipped else "bytes_uploaded"] += size
+
+    def upload_summary(self) -> dict:
+        """
+        Summarize the uploads since the counts were last reset.
+
+        Returns: dict: Uploaded and skipped blob counts, bytes uploaded and bytes saved by skipped uploads.
+        """
+        with self.upload_stats_lock:
+            if self.upload_stats is None:
+                self.reset_upload_stats()
+            return dict(self.upload_stats)
+
+    @staticmethod
+    def json_default(obj: object) -> dict:
+        """
+        Serialize objects the `json` module does not support natively.
+
+        Args: obj (object): The object to serialize, typically a record exposing `to_dict`.
+
+        Returns: dict: The JSON serializable representation of the object.
+
+        Raises: TypeError: If the object cannot be serialized.
+        """
+        if hasattr(obj, "to_dict"):
+            return obj.to_dict()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
     def read_blob_to_dict(
         self,
@@ -113,8 +410,8 @@ class BlobClient(AbstractBlobClient):
         Download and deserialize JSON data from Azure Blob Storage.
 
         This method connects to the specified Azure Blob Storage container, retrieves
-        the contents of the given blob, and converts the JSON data into a native Python
-        object (list or dictionary).
+        the contents of the given blob, decompresses it if it is gzip or zstd encoded,
+        and converts the JSON data into a native Python object (list or dictionary).
 
         Args:
             container (str): Name of the Azure Blob Storage container to read from.
@@ -128,20 +425,112 @@ class BlobClient(AbstractBlobClient):
             azure.core.exceptions.ResourceNotFoundError: If the specified blob does not exist.
             Exception: For other unexpected errors during retrieval or parsing.
         """
-        # Define blob service client
-        blob_service_client = BlobServiceClient.from_connection_string(
-            self.vars.blob_storage_connection_string
-        )
+        # Download blob content as bytes
+        blob_data, _ = self.read_blob_bytes(container=container, input_filename=input_filename)
+
+        # Decode and convert bytes to Python object
+        return decode_json(content=decode_content(content=blob_data), codec=self.codec)
+
+    def read_blob_to_runs(self, container: str, input_filename: str) -> List[WorkflowRun]:
+        """
+        Download a JSON run history straight into typed run records.
+
+        Args:
+            container (str): Name of the Azure Blob Storage container to read from.
+            input_filename (str): The name of the blob (JSON file) to retrieve.
+
+        Returns: List[WorkflowRun]: The stored run records, in stored order.
+
+        Raises:
+            json.JSONDecodeError: If the blob content cannot be parsed as valid JSON.
+            azure.core.exceptions.ResourceNotFoundError: If the specified blob does not exist.
+        """
+        blob_data, _ = self.read_blob_bytes(container=container, input_filename=input_filename)
+        return decode_runs(content=decode_content(content=blob_data), codec=self.codec)
 
-        # Define container client
-        blob_client = blob_service_client.get_blob_client(
+    def read_blob_bytes(
+        self,
+        container: str,
+        input_filename: str,
+        etag: Optional[str] = None
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Download the raw content of a blob, optionally only if its ETag changed.
+
+        Args:
+            container (str): Name of the Azure Blob Storage container to read from.
+            input_filename (str): The name of the blob to retrieve.
+            etag (Optional[str]): ETag of a previously read version. If given, the download
+                is conditional (`If-None-Match`) and skipped when the blob is unchanged.
+
+        Returns:
+            Tuple[Optional[bytes], Optional[str]]: The blob content (None if unchanged) and its current ETag.
+
+        Raises:
+            azure.core.exceptions.ResourceNotFoundError: If the specified blob does not exist.
+        """
+        # Define blob client from the shared blob service client
+        blob_client = self.blob_service_client.get_blob_client(
             container=container,
             blob=input_filename
         )
 
-        # Download blob content as bytes
-        download_stream = blob_client.download_blob()
-        blob_data = download_stream.readall()
+        # Download the blob, conditionally if a previous ETag is known
+        try:
+            download_stream = blob_client.download_blob(etag=etag, match_condition=MatchConditions.IfModified) \
+                if etag else blob_client.download_blob()
+        except ResourceNotModifiedError:
+            return None, etag
+
+        return download_stream.readall(), download_stream.properties.etag
+
+    def read_blob_to_dataframe(
+        self,
+        container: str,
+        input_filename: str,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Download a Parquet blob straight into a DataFrame.
+
+        Args:
+            container (str): Name of the Azure Blob Storage container to read from.
+            input_filename (str): The name of the blob (Parquet file) to retrieve.
+            columns (Optional[List[str]]): Columns to read. If None, all columns are read.
+
+        Returns:
+            pd.DataFrame: The typed DataFrame stored in the blob.
+
+        Raises:
+            ImportError: If `pyarrow` is not installed.
+            azure.core.exceptions.ResourceNotFoundError: If the specified blob does not exist.
+        """
+        content, _ = self.read_blob_bytes(container=container, input_filename=input_filename)
+        return parquet_to_dataframe(content=content, columns=columns)
+
+    def migrate_blobs(self, container_name: str, directory_path: Optional[str] = "") -> int:
+        """
+        Rewrite existing blobs with the configured encoding.
+
+        Reads are transparent for both formats, so migrating is optional; it converts
+        blobs that would otherwise only be rewritten on their next update.
+
+        Args:
+            container_name (str): Name of the container.
+            directory_path (Optional[str]): Directory prefix of the blobs to migrate.
+
+        Returns: int: Number of blobs rewritten.
+        """
+        # Read all blobs concurrently
+        filenames = self.list_blob_filenames(container_name=container_name, directory_path=directory_path)
+        results = self.read_blobs_to_dicts(container=container_name, input_filenames=filenames)
+
+        # Rewrite every readable blob
+        migrated = 0
+        for filename, data in zip(filenames, results):
+            if isinstance(data, Exception):
+                continue
+            self.export_dict_to_blob(data=data, container=container_name, output_filename=filename)
+            migrated += 1
 
-        # Convert bytes to Python object
-        return json.loads(blob_data)
+        return migrated
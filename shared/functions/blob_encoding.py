@@ -0,0 +1,69 @@
+# Import dependencies
+from typing import Optional
+import gzip
+
+# zstandard is optional and only needed for the "zstd" encoding
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Supported content encodings and their magic numbers
+BLOB_ENCODINGS = ("gzip", "zstd")
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+def check_encoding(encoding: Optional[str]) -> None:
+    """
+    Validate a blob content encoding.
+
+    Args: encoding (Optional[str]): "gzip", "zstd", or None for uncompressed content.
+
+    Raises: ValueError: If the encoding is unknown, or "zstd" is requested without `zstandard` installed.
+    """
+    if encoding is not None and encoding not in BLOB_ENCODINGS:
+        raise ValueError(f"Unsupported blob encoding: {encoding}. Expected one of {BLOB_ENCODINGS} or None")
+    if encoding == "zstd" and zstandard is None:
+        raise ValueError("The zstd blob encoding requires the zstandard package")
+
+
+def encode_content(data: bytes, encoding: Optional[str]) -> bytes:
+    """
+    Compress blob content.
+
+    gzip output is written without a timestamp, so equal content always encodes to equal bytes.
+
+    Args:
+        data (bytes): The uncompressed content.
+        encoding (Optional[str]): "gzip", "zstd", or None to leave the content uncompressed.
+
+    Returns: bytes: The encoded content.
+    """
+    check_encoding(encoding=encoding)
+    if encoding == "gzip":
+        return gzip.compress(data, mtime=0)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+def decode_content(content: bytes) -> bytes:
+    """
+    Decompress blob content, detecting the encoding from its magic number.
+
+    Detection does not rely on blob properties, so uncompressed blobs written before
+    compression was enabled, and content already decoded by the transport, pass through.
+
+    Args: content (bytes): The stored content.
+
+    Returns: bytes: The uncompressed content.
+
+    Raises: ValueError: If the content is zstd encoded and `zstandard` is not installed.
+    """
+    if content[:2] == GZIP_MAGIC:
+        return gzip.decompress(content)
+    if content[:4] == ZSTD_MAGIC:
+        if zstandard is None:
+            raise ValueError("Decoding zstd encoded blobs requires the zstandard package")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(content)
+    return content
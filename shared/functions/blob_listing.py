@@ -0,0 +1,137 @@
+# Import dependencies
+from typing import List, Optional
+import threading
+import time
+
+# Number of seconds a blob listing snapshot is served without listing the container again
+DEFAULT_LISTING_TTL = 30.0
+
+class ListingCache:
+    """
+    A thread-safe, in-memory store of blob listing snapshots.
+
+    A snapshot holds the name, size, last modified time and ETag of every blob under a
+    prefix of a container. Snapshots younger than the requested maximum age are served
+    without a request, and a snapshot of a prefix also serves listings of any longer
+    prefix it covers. Snapshots covering a blob are dropped when the blob is written.
+    """
+    def __init__(self) -> None:
+        """
+        Initialize an empty ListingCache.
+        """
+        self.lock = threading.Lock()
+
+        # Snapshots keyed by (container, prefix), holding their fetch time and listing
+        self.snapshots: dict = {}
+
+        # Usage statistics
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, container: str, prefix: str, max_age: float) -> Optional[List[dict]]:
+        """
+        Retrieve a fresh listing of a prefix from a snapshot covering it.
+
+        Args:
+            container (str): The container name.
+            prefix (str): The blob name prefix being listed.
+            max_age (float): Maximum age in seconds of a snapshot that may be served.
+
+        Returns: Optional[List[dict]]: The blob properties under the prefix, or None if no fresh snapshot covers it.
+        """
+        now = time.time()
+        with self.lock:
+            for (snapshot_container, snapshot_prefix), (fetched_at, listing) in self.snapshots.items():
+                if snapshot_container == container and prefix.startswith(snapshot_prefix) \
+                        and now - fetched_at < max_age:
+                    self.hits += 1
+                    return [blob for blob in listing if blob["name"].startswith(prefix)]
+
+            self.misses += 1
+            return None
+
+    def etag(self, container: str, name: str, max_age: float) -> Optional[str]:
+        """
+        Look up the ETag of a blob in a fresh snapshot covering it, without counting a listing.
+
+        Args:
+            container (str): The container name.
+            name (str): The blob name.
+            max_age (float): Maximum age in seconds of a snapshot that may be used.
+
+        Returns: Optional[str]: The listed ETag, or None if no fresh snapshot lists the blob.
+        """
+        now = time.time()
+        with self.lock:
+            for (snapshot_container, snapshot_prefix), (fetched_at, listing) in self.snapshots.items():
+                if snapshot_container == container and name.startswith(snapshot_prefix) \
+                        and now - fetched_at < max_age:
+                    for blob in listing:
+                        if blob["name"] == name:
+                            return blob.get("etag")
+
+            return None
+
+    def put(self, container: str, prefix: str, listing: List[dict]) -> None:
+        """
+        Store the listing snapshot of a prefix.
+
+        Args:
+            container (str): The container name.
+            prefix (str): The blob name prefix that was listed.
+            listing (List[dict]): The blob properties under the prefix.
+        """
+        with self.lock:
+            self.snapshots[(container, prefix)] = (time.time(), listing)
+
+    def invalidate(self, container: str, name: str) -> None:
+        """
+        Drop every snapshot covering a blob.
+
+        Args:
+            container (str): The container name.
+            name (str): The name of the written blob.
+        """
+        with self.lock:
+            for key in [key for key in self.snapshots if key[0] == container and name.startswith(key[1])]:
+                del self.snapshots[key]
+
+    def clear(self) -> None:
+        """
+        Drop every snapshot.
+        """
+        with self.lock:
+            self.snapshots.clear()
+
+    def summary(self) -> dict:
+        """
+        Summarise the usage of the listing cache.
+
+        Returns: dict: Listing hit and miss counts and the number of stored snapshots.
+        """
+        with self.lock:
+            return {"listing_hits": self.hits, "listing_misses": self.misses, "snapshots": len(self.snapshots)}
+
+
+def diff_listings(previous: List[dict], current: List[dict]) -> dict:
+    """
+    Compare two listing snapshots of the same prefix.
+
+    Blobs are matched by name and compared by ETag, so changes are detected without
+    downloading any content.
+
+    Args:
+        previous (List[dict]): The earlier snapshot.
+        current (List[dict]): The later snapshot.
+
+    Returns: dict: Sorted names of the `added`, `removed` and `changed` blobs.
+    """
+    previous_etags = {blob["name"]: blob.get("etag") for blob in previous}
+    current_etags = {blob["name"]: blob.get("etag") for blob in current}
+
+    return {
+        "added": sorted(current_etags.keys() - previous_etags.keys()),
+        "removed": sorted(previous_etags.keys() - current_etags.keys()),
+        "changed": sorted(name for name in current_etags.keys() & previous_etags.keys()
+                          if current_etags[name] != previous_etags[name])
+    }
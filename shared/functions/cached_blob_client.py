@@ -0,0 +1,440 @@
+# Import dependencies
+from ..interfaces.blob_client_base import AbstractBlobClient
+from .blob_client import BatchReadMixin
+from .columnar import parquet_to_dataframe
+from .blob_listing import ListingCache, DEFAULT_LISTING_TTL
+from .blob_encoding import decode_content
+from .json_codec import decode_json
+from typing import Optional, Union, List, Tuple
+from collections import OrderedDict
+import pandas as pd
+import threading
+import tempfile
+import hashlib
+import json
+import time
+import os
+
+# Default location and size of the local blob cache
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "project-monitoring-blob-cache")
+DEFAULT_CACHE_MAX_BYTES = 256 * 2 ** 20
+
+class BlobCache:
+    """
+    A thread-safe, size-bounded LRU store of blob bytes on local disk.
+
+    Each entry is stored as a content file and a small metadata file holding the blob's
+    ETag and fetch time. Entries already on disk are indexed when the cache is created,
+    so the cache survives process restarts. Least recently used entries are evicted once
+    the total content size exceeds `max_bytes`. Hit, miss, revalidation and eviction
+    counters are recorded for sizing.
+    """
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        """
+        Initialize the BlobCache and index entries already stored in `cache_dir`.
+
+        Args:
+            cache_dir (str): Directory holding the cached blobs.
+            max_bytes (int): Maximum total size of cached blob content in bytes.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+
+        # LRU index of cached entries, least recently used first
+        self.entries: OrderedDict = OrderedDict()
+        self.total_bytes = 0
+
+        # Usage statistics
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.load()
+
+    def load(self) -> None:
+        """
+        Index the entries stored in the cache directory, oldest access first.
+        """
+        stored = []
+        for filename in os.listdir(self.cache_dir):
+            if not filename.endswith(".meta"):
+                continue
+
+            # Skip entries with missing or corrupt files
+            try:
+                meta_path = os.path.join(self.cache_dir, filename)
+                with open(meta_path) as f:
+                    meta = json.load(f)
+                meta["size"] = os.path.getsize(self.content_path(key=meta["key"]))
+                stored.append((os.path.getmtime(meta_path), meta))
+            except (OSError, ValueError, KeyError):
+                continue
+
+        for _, meta in sorted(stored, key=lambda item: item[0]):
+            self.entries[meta["key"]] = meta
+            self.total_bytes += meta["size"]
+
+        self.evict()
+
+    def get(self, key: str) -> Optional[Tuple[bytes, dict]]:
+        """
+        Retrieve a cached entry and mark it as most recently used.
+
+        Args: key (str): The cache key of the blob.
+
+        Returns: Optional[Tuple[bytes, dict]]: The cached content and metadata, or None if not cached.
+        """
+        with self.lock:
+            meta = self.entries.get(key)
+            if meta is None:
+                return None
+
+            # Drop entries whose content file disappeared
+            try:
+                with open(self.content_path(key=key), "rb") as f:
+                    content = f.read()
+            except OSError:
+                self.remove(key=key)
+                return None
+
+            self.entries.move_to_end(key)
+            return content, dict(meta)
+
+    def put(self, key: str, content: bytes, etag: Optional[str]) -> None:
+        """
+        Store blob content, evicting least recently used entries if the cache is full.
+
+        Args:
+            key (str): The cache key of the blob.
+            content (bytes): The blob content.
+            etag (Optional[str]): The ETag of the stored version.
+        """
+        with self.lock:
+            self.remove(key=key)
+
+            # Skip content that can never fit in the cache
+            if len(content) > self.max_bytes:
+                return
+
+            meta = {"key": key, "etag": etag, "fetched_at": time.time(), "size": len(content)}
+            self.write(path=self.content_path(key=key), data=content)
+            self.write(path=self.meta_path(key=key), data=json.dumps(meta).encode())
+
+            self.entries[key] = meta
+            self.total_bytes += len(content)
+            self.evict()
+
+    def touch(self, key: str) -> None:
+        """
+        Record that a cached entry was revalidated and is fresh again.
+
+        Args: key (str): The cache key of the blob.
+        """
+        with self.lock:
+            meta = self.entries.get(key)
+            if meta is None:
+                return
+
+            meta["fetched_at"] = time.time()
+            self.write(path=self.meta_path(key=key), data=json.dumps(meta).encode())
+            self.entries.move_to_end(key)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove an entry from the cache.
+
+        Args: key (str): The cache key of the blob.
+        """
+        with self.lock:
+            self.remove(key=key)
+
+    def count(self, counter: str) -> None:
+        """
+        Increment a usage counter.
+
+        Args: counter (str): One of "hits", "misses", "revalidations" or "evictions".
+        """
+        with self.lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def summary(self) -> dict:
+        """
+        Summarise the usage of the cache.
+
+        Returns: dict: Hit, miss, revalidation and eviction counts, entry count and size in bytes.
+        """
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+                "entries": len(self.entries),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes
+            }
+
+    def evict(self) -> None:
+        """
+        Evict least recently used entries until the cache fits in `max_bytes`. Must be called with the lock held.
+        """
+        while self.total_bytes > self.max_bytes and self.entries:
+            self.remove(key=next(iter(self.entries)))
+            self.evictions += 1
+
+    def remove(self, key: str) -> None:
+        """
+        Delete the files and index entry of a cached blob. Must be called with the lock held.
+
+        Args: key (str): The cache key of the blob.
+        """
+        meta = self.entries.pop(key, None)
+        if meta is not None:
+            self.total_bytes -= meta["size"]
+
+        for path in (self.content_path(key=key), self.meta_path(key=key)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def content_path(self, key: str) -> str:
+        """
+        Build the path of the content file of a cached blob.
+
+        Args: key (str): The cache key of the blob.
+
+        Returns: str: The content file path.
+        """
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode()).hexdigest() + ".blob")
+
+    def meta_path(self, key: str) -> str:
+        """
+        Build the path of the metadata file of a cached blob.
+
+        Args: key (str): The cache key of the blob.
+
+        Returns: str: The metadata file path.
+        """
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode()).hexdigest() + ".meta")
+
+    @staticmethod
+    def write(path: str, data: bytes) -> None:
+        """
+        Write a file atomically, so concurrent readers never observe partial content.
+
+        Args:
+            path (str): The file path.
+            data (bytes): The file content.
+        """
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+
+class CachedBlobClient(BatchReadMixin, AbstractBlobClient):
+    """
+    A read-through caching layer for any `AbstractBlobClient`.
+
+    Blob bytes are kept in a local disk `BlobCache`. Entries fetched within `max_age`
+    seconds are served without a request; older entries, and entries whose ETag differs
+    from the one in a current listing snapshot, are revalidated with a conditional
+    `If-None-Match` request and only downloaded again if their ETag changed.
+    Writes go to the wrapped client and invalidate the cached entry. Caches are shared
+    process-wide per cache directory, so every instance contributes to the same LRU
+    and usage counters.
+
+    Blob listings are served from in-memory snapshots shared by every instance in the
+    process, taken at most `listing_ttl` seconds ago, so repeated listings of the same
+    prefix within a page render cost a single request.
+    """
+    # Process-wide caches, keyed by cache directory
+    caches: dict = {}
+    caches_lock = threading.Lock()
+
+    # Process-wide blob listing snapshots
+    listing_cache = ListingCache()
+
+    def __init__(
+        self,
+        client: AbstractBlobClient,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        max_age: float = 60.0,
+        listing_ttl: float = DEFAULT_LISTING_TTL
+    ) -> None:
+        """
+        Initialize the CachedBlobClient.
+
+        Args:
+            client (AbstractBlobClient): The blob client used for requests that miss the cache.
+            cache_dir (str): Directory holding the cached blobs.
+            max_bytes (int): Maximum total size of cached blob content, used if this instance creates the cache.
+            max_age (float): Number of seconds a cached blob is served without revalidation.
+            listing_ttl (float): Number of seconds a blob listing snapshot is served without listing again.
+        """
+        super().__init__()
+        self.client = client
+        self.max_age = max_age
+        self.listing_ttl = listing_ttl
+        self.cache = self.get_cache(cache_dir=cache_dir, max_bytes=max_bytes)
+
+    @classmethod
+    def get_cache(cls, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> BlobCache:
+        """
+        Retrieve the shared BlobCache of a directory, creating it on first use.
+
+        Args:
+            cache_dir (str): Directory holding the cached blobs.
+            max_bytes (int): Maximum total size of cached blob content if the cache is created.
+
+        Returns: BlobCache: The shared cache.
+        """
+        with cls.caches_lock:
+            if cache_dir not in cls.caches:
+                cls.caches[cache_dir] = BlobCache(cache_dir=cache_dir, max_bytes=max_bytes)
+            return cls.caches[cache_dir]
+
+    def list_blob_filenames(self, container_name: str, directory_path: Optional[str] = "") -> List[str]:
+        """
+        List blob filenames in a container through the wrapped client.
+
+        Args:
+            container_name (str): Name of the container.
+            directory_path (Optional[str]): Directory prefix inside the container.
+
+        Returns: List[str]: List of blob names matching the prefix.
+        """
+        return [blob["name"] for blob in self.list_blob_properties(container_name=container_name,
+                                                                   directory_path=directory_path)]
+
+    def list_blob_properties(self, container_name: str, directory_path: Optional[str] = "") -> List[dict]:
+        """
+        List the blobs in a container with their properties, from a recent snapshot if one covers the prefix.
+
+        Args:
+            container_name (str): Name of the container.
+            directory_path (Optional[str]): Directory prefix inside the container.
+
+        Returns: List[dict]: The `name`, `size`, `last_modified` and `etag` of every blob matching the prefix.
+        """
+        prefix = directory_path or ""
+        listing = self.listing_cache.get(container=container_name, prefix=prefix, max_age=self.listing_ttl)
+        if listing is None:
+            listing = self.client.list_blob_properties(container_name=container_name, directory_path=prefix)
+            self.listing_cache.put(container=container_name, prefix=prefix, listing=listing)
+
+        return listing
+
+    def export_dict_to_blob(self, data: list, container: str, output_filename: str) -> Optional[dict]:
+        """
+        Upload data through the wrapped client and invalidate the cached copy and listings of the blob.
+
+        Args:
+            data (list): The data to serialize and upload.
+            container (str): The target container name.
+            output_filename (str): The name of the output blob.
+
+        Returns: Optional[dict]: Properties of the uploaded blob, as returned by the wrapped client.
+        """
+        properties = self.client.export_dict_to_blob(data=data, container=container, output_filename=output_filename)
+        self.cache.invalidate(key=f"{container}/{output_filename}")
+        self.listing_cache.invalidate(container=container, name=output_filename)
+
+        return properties
+
+    def read_blob_bytes(
+        self,
+        container: str,
+        input_filename: str,
+        etag: Optional[str] = None
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Read the raw content of a blob through the cache.
+
+        Args:
+            container (str): The container name.
+            input_filename (str): The name of the blob to read.
+            etag (Optional[str]): ETag of a version the caller already holds. If the blob still has
+                this ETag, no content is returned.
+
+        Returns:
+            Tuple[Optional[bytes], Optional[str]]: The blob content (None if unchanged) and its current ETag.
+        """
+        key = f"{container}/{input_filename}"
+        cached = self.cache.get(key=key)
+
+        # Serve fresh entries without a request, unless a listing snapshot already shows a newer version
+        listed_etag = self.listing_cache.etag(container=container, name=input_filename, max_age=self.listing_ttl)
+        if cached is not None and time.time() - cached[1]["fetched_at"] <= self.max_age \
+                and listed_etag in (None, cached[1]["etag"]):
+            self.cache.count(counter="hits")
+            content, current_etag = cached[0], cached[1]["etag"]
+
+        # Revalidate stale entries, downloading only if the blob changed
+        elif cached is not None and cached[1]["etag"]:
+            self.cache.count(counter="revalidations")
+            content, current_etag = self.client.read_blob_bytes(container=container, input_filename=input_filename,
+                                                                etag=cached[1]["etag"])
+            if content is None:
+                self.cache.count(counter="hits")
+                self.cache.touch(key=key)
+                content = cached[0]
+            else:
+                self.cache.count(counter="misses")
+                self.cache.put(key=key, content=content, etag=current_etag)
+
+        # Download blobs missing from the cache
+        else:
+            self.cache.count(counter="misses")
+            content, current_etag = self.client.read_blob_bytes(container=container, input_filename=input_filename)
+            self.cache.put(key=key, content=content, etag=current_etag)
+
+        if etag is not None and etag == current_etag:
+            return None, current_etag
+        return content, current_etag
+
+    def read_blob_to_dict(self, container: str, input_filename: str) -> Union[list, dict]:
+        """
+        Read, decode and deserialize a JSON blob through the cache.
+
+        Args:
+            container (str): The container name.
+            input_filename (str): The name of the blob to read.
+
+        Returns: Union[list, dict]: The deserialized JSON object from the blob.
+        """
+        content, _ = self.read_blob_bytes(container=container, input_filename=input_filename)
+        return decode_json(content=decode_content(content=content))
+
+    def read_blob_to_dataframe(
+        self,
+        container: str,
+        input_filename: str,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Read a Parquet blob through the cache straight into a DataFrame.
+
+        Args:
+            container (str): The container name.
+            input_filename (str): The name of the blob to read.
+            columns (Optional[List[str]]): Columns to read. If None, all columns are read.
+
+        Returns: pd.DataFrame: The typed DataFrame stored in the blob.
+        """
+        content, _ = self.read_blob_bytes(container=container, input_filename=input_filename)
+        return parquet_to_dataframe(content=content, columns=columns)
+
+    def summary(self) -> dict:
+        """
+        Summarise the usage of the shared cache.
+
+        Returns: dict: Hit, miss, revalidation and eviction counts, entry count and size in bytes,
+            and listing snapshot hit and miss counts.
+        """
+        return {**self.cache.summary(), **self.listing_cache.summary()}
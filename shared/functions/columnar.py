@@ -0,0 +1,122 @@
+# Import dependencies
+from typing import List, Optional
+import pandas as pd
+import io
+
+# pyarrow is optional and only needed for the columnar (Parquet) format
+try:
+    import pyarrow.parquet as pq
+    import pyarrow as pa
+except ImportError:
+    pq = pa = None
+
+# Content type of columnar blobs
+PARQUET_CONTENT_TYPE = "application/vnd.apache.parquet"
+
+# Directory holding the columnar copy of every workflow run history
+COLUMNAR_DIRECTORY = "columnar"
+
+# Low-cardinality string columns stored dictionary encoded, read back as categoricals
+CATEGORICAL_COLUMNS = ("repo", "workflow_name", "active_status", "status", "conclusion")
+
+# Timestamp columns stored as UTC timestamps rather than ISO 8601 strings
+TIMESTAMP_COLUMNS = ("created_at", "updated_at")
+
+def check_columnar() -> None:
+    """
+    Verify that the columnar format is available.
+
+    Raises: ImportError: If `pyarrow` is not installed.
+    """
+    if pa is None:
+        raise ImportError("The columnar blob format requires the pyarrow package")
+
+
+def workflow_run_schema() -> "pa.Schema":
+    """
+    Build the Arrow schema of a workflow run history.
+
+    Returns: pa.Schema: Typed columns matching the fields of `WorkflowRun`.
+    """
+    check_columnar()
+    categorical = pa.dictionary(pa.int32(), pa.string())
+    timestamp = pa.timestamp("us", tz="UTC")
+
+    return pa.schema([
+        ("repo", categorical),
+        ("workflow_name", categorical),
+        ("active_status", categorical),
+        ("status", categorical),
+        ("conclusion", categorical),
+        ("created_at", timestamp),
+        ("updated_at", timestamp),
+        ("run_number", pa.int64()),
+        ("html_url", pa.string()),
+        ("duration_seconds", pa.float64())
+    ])
+
+
+def runs_to_parquet(runs: list) -> bytes:
+    """
+    Serialize a workflow run history to Parquet.
+
+    Args: runs (list): WorkflowRun records or run dictionaries, newest first.
+
+    Returns: bytes: The zstd compressed Parquet file.
+    """
+    schema = workflow_run_schema()
+
+    # Build typed columns, parsing ISO 8601 timestamps once at write time
+    df = pd.DataFrame([run.to_dict() if hasattr(run, "to_dict") else run for run in runs], columns=schema.names)
+    for column in TIMESTAMP_COLUMNS:
+        df[column] = pd.to_datetime(df[column], utc=True, format="ISO8601")
+    df["run_number"] = df["run_number"].astype("Int64")
+    df["duration_seconds"] = df["duration_seconds"].astype("float64")
+
+    # Write the table to an in-memory Parquet file
+    buffer = io.BytesIO()
+    pq.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False), buffer, compression="zstd")
+
+    return buffer.getvalue()
+
+
+def parquet_to_dataframe(content: bytes, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read a Parquet file straight into a DataFrame.
+
+    Args:
+        content (bytes): The Parquet file.
+        columns (Optional[List[str]]): Columns to read. If None, all columns are read.
+
+    Returns: pd.DataFrame: The typed DataFrame, with categorical, timestamp and integer columns.
+    """
+    check_columnar()
+    return pq.read_table(io.BytesIO(content), columns=columns).to_pandas()
+
+
+def dataframe_to_runs(df: pd.DataFrame) -> list:
+    """
+    Convert a run history DataFrame read from Parquet back into JSON compatible run dictionaries.
+
+    Args: df (pd.DataFrame): A DataFrame with the columns of `workflow_run_schema`.
+
+    Returns: list: Run dictionaries with ISO 8601 timestamps and None for missing values.
+    """
+    df = df.copy()
+    for column in TIMESTAMP_COLUMNS:
+        df[column] = df[column].dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    return df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+
+def columnar_blob_name(repo: str, workflow_name: str) -> str:
+    """
+    Build the name of the columnar blob of a workflow run history.
+
+    Args:
+        repo (str): The name of the GitHub repository.
+        workflow_name (str): The name of the workflow.
+
+    Returns: str: The blob name.
+    """
+    return f"{COLUMNAR_DIRECTORY}/{repo}_{workflow_name}.parquet"
@@ -0,0 +1,122 @@
+# Import dependencies
+from ..models.workflow_run import WorkflowRun
+from typing import Any, Callable, List, Optional
+import json
+
+# msgspec and orjson are optional, faster drop-in JSON codecs
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Supported JSON codecs, in order of preference
+JSON_CODECS = ("msgspec", "orjson", "json")
+
+def check_codec(codec: Optional[str]) -> None:
+    """
+    Validate a JSON codec.
+
+    Args: codec (Optional[str]): "msgspec", "orjson", "json", or None for the fastest available codec.
+
+    Raises: ValueError: If the codec is unknown, or its package is not installed.
+    """
+    if codec is not None and codec not in JSON_CODECS:
+        raise ValueError(f"Unsupported JSON codec: {codec}. Expected one of {JSON_CODECS} or None")
+    if (codec == "orjson" and orjson is None) or (codec == "msgspec" and msgspec is None):
+        raise ValueError(f"The {codec} JSON codec requires the {codec} package")
+
+
+def resolve_codec(codec: Optional[str] = None) -> str:
+    """
+    Resolve the JSON codec to use.
+
+    Args: codec (Optional[str]): The requested codec, or None for the fastest available codec.
+
+    Returns: str: The codec name.
+    """
+    check_codec(codec=codec)
+    if codec is not None:
+        return codec
+    if msgspec is not None:
+        return "msgspec"
+    if orjson is not None:
+        return "orjson"
+    return "json"
+
+
+def encode_json(data: Any, codec: Optional[str] = None, default: Optional[Callable] = None) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON.
+
+    Every codec produces the same JSON values: objects keep their key order, typed records
+    and other unsupported objects are serialized through `default`. msgspec and orjson
+    write compact JSON without escaping non-ASCII characters, so the bytes differ from
+    the stdlib output but decode to equal values.
+
+    Args:
+        data (Any): The data to serialize.
+        codec (Optional[str]): The codec to use, or None for the fastest available codec.
+        default (Optional[Callable]): Called with objects the codec cannot serialize natively.
+
+    Returns: bytes: The JSON document.
+    """
+    codec = resolve_codec(codec=codec)
+    if codec == "orjson":
+        return orjson.dumps(data, default=default, option=orjson.OPT_NON_STR_KEYS)
+    if codec == "msgspec":
+        return msgspec.json.encode(data, enc_hook=default)
+    return json.dumps(data, default=default).encode()
+
+
+def decode_json(content: bytes, codec: Optional[str] = None) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        content (bytes): The JSON document.
+        codec (Optional[str]): The codec to use, or None for the fastest available codec.
+
+    Returns: Any: The deserialized lists, dictionaries and values.
+
+    Raises: json.JSONDecodeError: If the content is not valid JSON, whatever the codec.
+    """
+    codec = resolve_codec(codec=codec)
+    if codec == "orjson":
+        return orjson.loads(content)
+    if codec == "msgspec":
+        try:
+            return msgspec.json.decode(content)
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), content.decode(errors="replace"), 0) from e
+    return json.loads(content)
+
+
+def decode_runs(content: bytes, codec: Optional[str] = None) -> List[WorkflowRun]:
+    """
+    Deserialize a JSON run history into typed run records.
+
+    msgspec decodes straight into `WorkflowRun` records without building intermediate
+    dictionaries. Other codecs decode to dictionaries which are then converted.
+
+    Args:
+        content (bytes): The JSON run history.
+        codec (Optional[str]): The codec to use, or None for the fastest available codec.
+
+    Returns: List[WorkflowRun]: The run records, in stored order.
+
+    Raises: json.JSONDecodeError: If the content is not valid JSON, whatever the codec.
+    """
+    if resolve_codec(codec=codec) == "msgspec":
+        try:
+            return msgspec.json.decode(content, type=List[WorkflowRun])
+        except msgspec.ValidationError:
+            pass
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), content.decode(errors="replace"), 0) from e
+
+    return [WorkflowRun.from_dict(run) for run in decode_json(content=content, codec=codec)]
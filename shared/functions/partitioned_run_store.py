@@ -0,0 +1,300 @@
+# Import dependencies
+from .columnar import check_columnar, dataframe_to_runs
+from .run_schema import build_runs_dataframe
+from ..interfaces.blob_client_base import AbstractBlobClient
+from azure.core.exceptions import ResourceNotFoundError
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote
+from typing import List, Optional
+import pandas as pd
+
+# Directory holding the partitioned run histories
+RUNS_DIRECTORY = "runs"
+
+# Supported partition formats and their file extensions
+PARTITION_FORMATS = {"json": ".json", "parquet": ".parquet"}
+
+class PartitionedRunStore:
+    """
+    Stores workflow run histories as monthly partitions: `runs/{repo}/{workflow}/{yyyy-mm}.json`
+    (or `.parquet`), with "/" and "%" URL-quoted in the workflow name.
+
+    Runs are assigned to the partition of the month they were created in, and each
+    partition holds its runs newest first. Writing new runs only rewrites the partitions
+    they fall in - usually just the current month - so write cost grows with the new
+    data rather than the length of the history. Readers fetch only the partitions that
+    overlap the requested time range, newest first, stopping once enough runs are read.
+    """
+    def __init__(
+        self,
+        client: AbstractBlobClient,
+        container: str = "project-monitoring",
+        partition_format: str = "json",
+        max_workers: int = 8
+    ) -> None:
+        """
+        Initialize the PartitionedRunStore.
+
+        Args:
+            client (AbstractBlobClient): Blob client used to read and write partitions. Writing
+                Parquet partitions requires a client providing `export_runs_to_parquet`.
+            container (str): Name of the container holding the partitions.
+            partition_format (str): Format of written partitions, "json" or "parquet". Partitions
+                of either format are read.
+            max_workers (int): Maximum number of partitions read at the same time.
+        """
+        if partition_format not in PARTITION_FORMATS:
+            raise ValueError(f"Unsupported partition format: {partition_format}. "
+                             f"Expected one of {list(PARTITION_FORMATS)}")
+        if partition_format == "parquet":
+            check_columnar()
+
+        self.client = client
+        self.container = container
+        self.partition_format = partition_format
+        self.max_workers = max_workers
+
+    @staticmethod
+    def encode_workflow(workflow: str) -> str:
+        """
+        Encode a workflow name as a single path segment of a partition name.
+
+        Only "/" and "%" are URL-quoted, so names without them keep their readable path.
+
+        Args: workflow (str): The name of the workflow.
+
+        Returns: str: The encoded path segment.
+        """
+        return workflow.replace("%", "%25").replace("/", "%2F")
+
+    @staticmethod
+    def decode_workflow(segment: str) -> str:
+        """
+        Decode the workflow name of a partition path segment.
+
+        Args: segment (str): The path segment built by `encode_workflow`.
+
+        Returns: str: The name of the workflow.
+        """
+        return unquote(segment)
+
+    @classmethod
+    def partition_prefix(cls, repo: str, workflow: str) -> str:
+        """
+        Build the blob name prefix of the partitions of a workflow.
+
+        Args:
+            repo (str): The name of the GitHub repository.
+            workflow (str): The name of the workflow.
+
+        Returns: str: The partition prefix, ending with "/".
+        """
+        return f"{RUNS_DIRECTORY}/{repo}/{cls.encode_workflow(workflow=workflow)}/"
+
+    def partition_name(self, repo: str, workflow: str, created_at: Optional[str]) -> str:
+        """
+        Build the name of the partition a run belongs to.
+
+        Args:
+            repo (str): The name of the GitHub repository.
+            workflow (str): The name of the workflow.
+            created_at (Optional[str]): ISO 8601 creation timestamp of the run.
+
+        Returns: str: The partition blob name. Runs without a creation time go to the "unknown" partition.
+        """
+        month = created_at[:7] if created_at else "unknown"
+        return f"{self.partition_prefix(repo=repo, workflow=workflow)}{month}{PARTITION_FORMATS[self.partition_format]}"
+
+    def list_partitions(self, repo: str, workflow: str) -> List[str]:
+        """
+        List the partitions of a workflow, newest month first.
+
+        Args:
+            repo (str): The name of the GitHub repository.
+            workflow (str): The name of the workflow.
+
+        Returns: List[str]: The partition blob names.
+        """
+        names = self.client.list_blob_filenames(container_name=self.container,
+                                                directory_path=self.partition_prefix(repo=repo, workflow=workflow))
+
+        # Order monthly partitions newest first, followed by the "unknown" partition
+        partitions = [name for name in names if name.endswith(tuple(PARTITION_FORMATS.values()))]
+        return sorted(partitions, key=lambda name: (self.partition_month(name=name) is not None, name), reverse=True)
+
+    @staticmethod
+    def partition_month(name: str) -> Optional[str]:
+        """
+        Extract the month of a partition from its name.
+
+        Args: name (str): The partition blob name.
+
+        Returns: Optional[str]: The month as "yyyy-mm", or None for the "unknown" partition.
+        """
+        month = name.rsplit("/", 1)[-1][:7]
+        return month if month[:4].isdigit() else None
+
+    def in_month_range(self, name: str, since: Optional[str], until: Optional[str]) -> bool:
+        """
+        Determine whether a partition holds runs created within a time range.
+
+        Args:
+            name (str): The partition blob name.
+            since (Optional[str]): ISO 8601 timestamp of the start of the range, if any.
+            until (Optional[str]): ISO 8601 timestamp of the end of the range, if any.
+
+        Returns: bool: True if the month of the partition overlaps the range. Always False for the "unknown" partition.
+        """
+        month = self.partition_month(name=name)
+        if month is None:
+            return False
+
+        return (since is None or month >= since[:7]) and (until is None or month <= until[:7])
+
+    def list_workflows(self) -> List[tuple]:
+        """
+        List the workflows stored in the partitioned layout.
+
+        Returns: List[tuple]: Sorted (repo, workflow) pairs, with decoded workflow names.
+        """
+        names = self.client.list_blob_filenames(container_name=self.container, directory_path=f"{RUNS_DIRECTORY}/")
+        return sorted({(name.split("/")[1], self.decode_workflow(segment=name.split("/")[2]))
+                       for name in names if name.count("/") == 3})
+
+    def read_partition(self, name: str) -> list:
+        """
+        Read the runs of a partition.
+
+        Args: name (str): The partition blob name.
+
+        Returns: list: Run dictionaries, newest first. Missing partitions are empty.
+        """
+        try:
+            if name.endswith(PARTITION_FORMATS["parquet"]):
+                return dataframe_to_runs(df=self.client.read_blob_to_dataframe(container=self.container,
+                                                                               input_filename=name))
+            return self.client.read_blob_to_dict(container=self.container, input_filename=name)
+        except ResourceNotFoundError:
+            return []
+
+    def read_runs(
+        self,
+        repo: str,
+        workflow: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> list:
+        """
+        Read the runs of a workflow created within a time range, newest first.
+
+        Only partitions overlapping the range are fetched. Without a limit they are read
+        concurrently; with a limit they are read newest first until enough runs are found.
+
+        Args:
+            repo (str): The name of the GitHub repository.
+            workflow (str): The name of the workflow.
+            since (Optional[str]): ISO 8601 timestamp. If set, only runs created at or after it are read.
+            until (Optional[str]): ISO 8601 timestamp. If set, only runs created before it are read.
+            limit (Optional[int]): Maximum number of runs returned.
+
+        Returns: list: Run dictionaries, newest first.
+        """
+        # Select the partitions whose month overlaps the range
+        partitions = self.list_partitions(repo=repo, workflow=workflow)
+        if since is not None or until is not None:
+            partitions = [name for name in partitions if self.in_month_range(name=name, since=since, until=until)]
+
+        def in_range(run: dict) -> bool:
+            created_at = run.get("created_at") or ""
+            return (since is None or created_at >= since) and (until is None or created_at < until)
+
+        # Read all selected partitions concurrently
+        if limit is None:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(partitions)))) as executor:
+                return [run for runs in executor.map(self.read_partition, partitions) for run in runs if in_range(run)]
+
+        # Read partitions newest first until the limit is reached
+        runs = []
+        for name in partitions:
+            runs.extend(run for run in self.read_partition(name=name) if in_range(run))
+            if len(runs) >= limit:
+                break
+
+        return runs[:limit]
+
+    def read_dataframe(
+        self,
+        repo: str,
+        workflow: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+        columns: Optional[List[str]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Read the runs of a workflow created within a time range into a DataFrame.
+
+        Args:
+            repo (str): The name of the GitHub repository.
+            workflow (str): The name of the workflow.
+            since (Optional[str]): ISO 8601 timestamp. If set, only runs created at or after it are read.
+            until (Optional[str]): ISO 8601 timestamp. If set, only runs created before it are read.
+            limit (Optional[int]): Maximum number of runs returned.
+            columns (Optional[List[str]]): Columns to return. If None, all columns are returned.
+
+        Returns: Optional[pd.DataFrame]: The runs newest first, or None if the workflow has no partitions.
+        """
+        runs = self.read_runs(repo=repo, workflow=workflow, since=since, until=until, limit=limit)
+        if not runs:
+            return None
+
+        return build_runs_dataframe(runs=runs, columns=columns)
+
+    def write_runs(self, repo: str, workflow: str, runs: list) -> dict:
+        """
+        Merge runs into the partitions they belong to.
+
+        Runs are deduplicated on `run_number`, with the given runs replacing stored ones.
+        Partitions whose content does not change are not rewritten.
+
+        Args:
+            repo (str): The name of the GitHub repository.
+            workflow (str): The name of the workflow.
+            runs (list): WorkflowRun records or run dictionaries.
+
+        Returns:
+            dict: The names of the rewritten partitions (`written`), the number of runs that were
+                not stored before (`added`) and the properties of the last uploaded partition (`properties`).
+        """
+        # Group runs by partition
+        partitions = {}
+        for run in runs:
+            run = run.to_dict() if hasattr(run, "to_dict") else run
+            partitions.setdefault(self.partition_name(repo=repo, workflow=workflow,
+                                                      created_at=run.get("created_at")), []).append(run)
+
+        result = {"written": [], "added": 0, "properties": None}
+        for name, new_runs in sorted(partitions.items()):
+
+            # Merge new runs into the stored partition, newest first
+            existing_runs = self.read_partition(name=name)
+            new_run_numbers = {run.get("run_number") for run in new_runs}
+            stored_run_numbers = {run.get("run_number") for run in existing_runs}
+            merged = new_runs + [run for run in existing_runs if run.get("run_number") not in new_run_numbers]
+            merged.sort(key=lambda run: (run.get("created_at") or "", run.get("run_number") or 0), reverse=True)
+
+            # Skip partitions whose content is unchanged
+            result["added"] += len(new_run_numbers - stored_run_numbers)
+            if merged == existing_runs:
+                continue
+
+            if self.partition_format == "parquet":
+                result["properties"] = self.client.export_runs_to_parquet(runs=merged, container=self.container,
+                                                                          output_filename=name)
+            else:
+                result["properties"] = self.client.export_dict_to_blob(data=merged, container=self.container,
+                                                                       output_filename=name)
+            result["written"].append(name)
+
+        return result
@@ -0,0 +1,337 @@
+# Import dependencies
+from ..interfaces.blob_client_base import AbstractBlobClient
+from azure.core.exceptions import ResourceNotFoundError
+from datetime import date, timedelta
+from typing import Callable, List, Optional
+import math
+
+# Directory holding the rollup blobs
+ROLLUPS_DIRECTORY = "rollups"
+
+# Supported rollup granularities
+ROLLUP_GRANULARITIES = ("daily", "weekly")
+
+# Duration percentiles reported by every rollup bucket
+ROLLUP_PERCENTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+
+# Relative accuracy of rollup duration percentiles
+DURATION_ACCURACY = 0.01
+
+# Growth factor between consecutive duration histogram bins
+DURATION_GAMMA = (1 + DURATION_ACCURACY) / (1 - DURATION_ACCURACY)
+
+# Maximum number of in-progress runs a workflow rollup waits on
+MAX_PENDING_RUNS = 100
+
+def duration_bin(seconds: float) -> str:
+    """
+    Find the duration histogram bin of a run duration.
+
+    Bins grow geometrically, so every duration in a bin lies within `DURATION_ACCURACY`
+    of the value reported for the bin.
+
+    Args: seconds (float): The run duration in seconds.
+
+    Returns: str: The bin index, as a JSON object key. "0" holds zero durations.
+    """
+    if seconds <= 0:
+        return "0"
+
+    return str(math.ceil(math.log(seconds, DURATION_GAMMA)))
+
+
+def bin_value(key: str) -> float:
+    """
+    Find the duration reported for a duration histogram bin.
+
+    Args: key (str): The bin index, as returned by `duration_bin`.
+
+    Returns: float: The duration in seconds.
+    """
+    if key == "0":
+        return 0.0
+
+    return 2 * DURATION_GAMMA ** int(key) / (DURATION_GAMMA + 1)
+
+
+def histogram_percentile(histogram: dict, percentile: float) -> Optional[float]:
+    """
+    Estimate a nearest-rank percentile of the durations counted in a histogram.
+
+    Args:
+        histogram (dict): Duration counts keyed by bin index.
+        percentile (float): The percentile, between 0 and 1.
+
+    Returns: Optional[float]: The duration in seconds, rounded to 0.1s, or None if the histogram is empty.
+    """
+    total = sum(histogram.values())
+    if not total:
+        return None
+
+    # Find the bin of the nearest-rank duration
+    rank, seen = max(1, math.ceil(percentile * total)), 0
+    for key in sorted(histogram, key=lambda key: -math.inf if key == "0" else int(key)):
+        seen += histogram[key]
+        if seen >= rank:
+            return round(bin_value(key=key), 1)
+
+
+def period_start(created_at: str, granularity: str) -> str:
+    """
+    Find the period a run belongs to.
+
+    Args:
+        created_at (str): ISO 8601 creation timestamp of the run.
+        granularity (str): "daily", or "weekly" for ISO weeks starting on Monday.
+
+    Returns: str: The first day of the period, as YYYY-MM-DD.
+    """
+    day = date.fromisoformat(created_at[:10])
+    if granularity == "weekly":
+        day -= timedelta(days=day.weekday())
+
+    return day.isoformat()
+
+
+def empty_bucket() -> dict:
+    """
+    Build an empty rollup bucket.
+
+    Returns: dict: A bucket counting no runs.
+    """
+    return {"runs": 0, "conclusions": {}, "durations": {}}
+
+
+def add_run(bucket: dict, run: dict) -> None:
+    """
+    Count a completed run in a rollup bucket.
+
+    Args:
+        bucket (dict): The bucket to update.
+        run (dict): The run dictionary.
+    """
+    conclusion = run.get("conclusion") or "unknown"
+    bucket["runs"] += 1
+    bucket["conclusions"][conclusion] = bucket["conclusions"].get(conclusion, 0) + 1
+
+    if run.get("duration_seconds") is not None:
+        key = duration_bin(seconds=run["duration_seconds"])
+        bucket["durations"][key] = bucket["durations"].get(key, 0) + 1
+
+
+def merge_bucket(target: dict, source: dict) -> None:
+    """
+    Add the counts of a rollup bucket to another bucket.
+
+    Args:
+        target (dict): The bucket to update.
+        source (dict): The bucket whose counts are added.
+    """
+    target["runs"] += source["runs"]
+    for field in ("conclusions", "durations"):
+        for key, count in source[field].items():
+            target[field][key] = target[field].get(key, 0) + count
+
+
+def summarize_bucket(bucket: dict) -> dict:
+    """
+    Compute the reported statistics of a rollup bucket from its counts.
+
+    Args: bucket (dict): The bucket.
+
+    Returns: dict: The bucket with `success_rate`, `failure_rate` and duration percentiles set.
+    """
+    runs = bucket["runs"]
+    bucket["success_rate"] = round(bucket["conclusions"].get("success", 0) / runs, 4) if runs else None
+    bucket["failure_rate"] = round(bucket["conclusions"].get("failure", 0) / runs, 4) if runs else None
+    for name, percentile in ROLLUP_PERCENTILES.items():
+        bucket[name] = histogram_percentile(histogram=bucket["durations"], percentile=percentile)
+
+    return bucket
+
+
+def merge_rollups(target: dict, source: dict) -> dict:
+    """
+    Add the buckets of a rollup to another rollup, recomputing the statistics of changed buckets.
+
+    Args:
+        target (dict): The rollup to update.
+        source (dict): The rollup whose buckets are added.
+
+    Returns: dict: The updated target rollup, with periods in order.
+    """
+    for granularity in ROLLUP_GRANULARITIES:
+        buckets = target.setdefault(granularity, {})
+        for period, bucket in source.get(granularity, {}).items():
+            merge_bucket(target=buckets.setdefault(period, empty_bucket()), source=bucket)
+            summarize_bucket(bucket=buckets[period])
+        target[granularity] = dict(sorted(buckets.items()))
+
+    return target
+
+
+class RollupStore:
+    """
+    Stores precomputed daily and weekly aggregates of workflow runs:
+    `rollups/workflows/{repo}/{workflow}.json` per workflow and `rollups/repos/{repo}.json`
+    per repository.
+
+    Every bucket holds the run count, the count of every conclusion, success and failure
+    rates, and p50/p90/p99 durations estimated from a log-binned duration histogram.
+    Counts and histograms are additive, so workflow rollups are updated from new runs
+    only and repository rollups are rebuilt as the sum of their stored workflow rollups.
+
+    A workflow rollup records the highest run number it has counted. Runs still in
+    progress are not counted until a later scrape sees them completed.
+    """
+    def __init__(self, client: AbstractBlobClient, container: str = "project-monitoring") -> None:
+        """
+        Initialize the RollupStore.
+
+        Args:
+            client (AbstractBlobClient): Client used to read and write the rollup blobs.
+            container (str): The container holding the rollups.
+        """
+        self.client = client
+        self.container = container
+
+    @staticmethod
+    def workflow_rollup_name(repo: str, workflow: str) -> str:
+        """
+        Build the blob name of a workflow rollup.
+
+        Args:
+            repo (str): The name of the GitHub repository.
+            workflow (str): The name of the workflow.
+
+        Returns: str: The blob name.
+        """
+        return f"{ROLLUPS_DIRECTORY}/workflows/{repo}/{workflow}.json"
+
+    @staticmethod
+    def repo_rollup_name(repo: str) -> str:
+        """
+        Build the blob name of a repository rollup.
+
+        Args: repo (str): The name of the GitHub repository.
+
+        Returns: str: The blob name.
+        """
+        return f"{ROLLUPS_DIRECTORY}/repos/{repo}.json"
+
+    def read_rollup(self, name: str) -> Optional[dict]:
+        """
+        Read a rollup blob.
+
+        Args: name (str): The blob name.
+
+        Returns: Optional[dict]: The rollup, or None if it does not exist.
+        """
+        try:
+            return self.client.read_blob_to_dict(container=self.container, input_filename=name)
+        except ResourceNotFoundError:
+            return None
+
+    def update_workflow_rollup(
+        self,
+        repo: str,
+        workflow: str,
+        runs: list,
+        read_history: Optional[Callable[[], list]] = None
+    ) -> dict:
+        """
+        Count the new and newly completed runs of a workflow in its rollup.
+
+        Args:
+            repo (str): The name of the GitHub repository.
+            workflow (str): The name of the workflow.
+            runs (list): WorkflowRun records or run dictionaries, holding at least every run not counted yet.
+            read_history (Optional[Callable[[], list]]): Reads the complete run history. Called instead of
+                using `runs` when the workflow has no rollup yet, if `runs` may not be the complete history.
+
+        Returns: dict: The `daily` and `weekly` buckets of the runs counted by this update.
+        """
+        name = self.workflow_rollup_name(repo=repo, workflow=workflow)
+        rollup = self.read_rollup(name=name)
+        if rollup is None:
+            rollup = {"repo": repo, "workflow_name": workflow, "last_run_number": None, "pending": []}
+            runs = read_history() if read_history is not None else runs
+
+        # Count runs newer than the rollup, and stored runs that have completed since
+        last_run_number, pending = rollup["last_run_number"], set(rollup["pending"])
+        previous_pending = set(pending)
+        delta = {granularity: {} for granularity in ROLLUP_GRANULARITIES}
+        for run in (run.to_dict() if hasattr(run, "to_dict") else run for run in runs):
+            run_number = run.get("run_number")
+            if run_number is None or not run.get("created_at"):
+                continue
+            if last_run_number is not None and run_number <= last_run_number and run_number not in pending:
+                continue
+
+            # Wait for runs in progress to complete
+            if rollup["last_run_number"] is None or run_number > rollup["last_run_number"]:
+                rollup["last_run_number"] = run_number
+            if run.get("status") not in (None, "completed"):
+                pending.add(run_number)
+                continue
+
+            pending.discard(run_number)
+            for granularity in ROLLUP_GRANULARITIES:
+                period = period_start(created_at=run["created_at"], granularity=granularity)
+                add_run(bucket=delta[granularity].setdefault(period, empty_bucket()), run=run)
+
+        # Upload the rollup only if it changed
+        if any(delta.values()) or pending != previous_pending or rollup["last_run_number"] != last_run_number:
+            rollup["pending"] = sorted(pending)[-MAX_PENDING_RUNS:]
+            self.client.export_dict_to_blob(data=merge_rollups(target=rollup, source=delta),
+                                            container=self.container, output_filename=name)
+
+        return delta
+
+    def rebuild_repo_rollup(self, repo: str) -> dict:
+        """
+        Rebuild the rollup of a repository as the sum of its stored workflow rollups.
+
+        The repository rollup is derived from persisted state only, so runs counted in a
+        workflow rollup always reach it, even if an earlier scrape stopped before the
+        repository rollup was written.
+
+        Args: repo (str): The name of the GitHub repository.
+
+        Returns: dict: The repository rollup.
+        """
+        rollup = {"repo": repo}
+        prefix = f"{ROLLUPS_DIRECTORY}/workflows/{repo}/"
+        for name in self.client.list_blob_filenames(container_name=self.container, directory_path=prefix):
+            workflow_rollup = self.read_rollup(name=name)
+            if workflow_rollup is not None:
+                merge_rollups(target=rollup, source=workflow_rollup)
+
+        self.client.export_dict_to_blob(data=rollup, container=self.container,
+                                        output_filename=self.repo_rollup_name(repo=repo))
+
+        return rollup
+
+    def read_trend(self, repo: str, workflow: Optional[str] = None, granularity: str = "daily") -> List[dict]:
+        """
+        Read the statistics of every period of a workflow or repository rollup.
+
+        Args:
+            repo (str): The name of the GitHub repository.
+            workflow (Optional[str]): The name of the workflow. If None, the repository rollup is read.
+            granularity (str): "daily" or "weekly".
+
+        Returns: List[dict]: One row per period, oldest first, without histogram counts. Empty if no rollup exists.
+
+        Raises: ValueError: If the granularity is unknown.
+        """
+        if granularity not in ROLLUP_GRANULARITIES:
+            raise ValueError(f"Unsupported rollup granularity: {granularity}. Expected one of {ROLLUP_GRANULARITIES}")
+
+        name = self.repo_rollup_name(repo=repo) if workflow is None \
+            else self.workflow_rollup_name(repo=repo, workflow=workflow)
+        rollup = self.read_rollup(name=name) or {}
+
+        return [{"period": period, **{key: value for key, value in bucket.items()
+                                      if key not in ("conclusions", "durations")}}
+                for period, bucket in rollup.get(granularity, {}).items()]
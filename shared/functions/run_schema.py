@@ -0,0 +1,139 @@
+# Import dependencies
+from .columnar import CATEGORICAL_COLUMNS, TIMESTAMP_COLUMNS
+from typing import List, Optional
+import pandas as pd
+import numpy as np
+
+# pyarrow is optional and backs string columns when installed
+try:
+    import pyarrow
+    import pyarrow.compute
+except ImportError:
+    pyarrow = None
+
+# Timestamp format of the GitHub API
+GITHUB_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# Columns of a workflow run DataFrame, in the field order of `WorkflowRun`
+RUN_COLUMNS = ("repo", "workflow_name", "active_status", "status", "conclusion", "created_at", "updated_at",
+               "run_number", "html_url", "duration_seconds")
+
+def run_dtypes() -> dict:
+    """
+    Build the dtypes of a workflow run DataFrame.
+
+    Low-cardinality strings are categorical, timestamps are UTC datetimes, run numbers
+    are nullable integers and links are Arrow-backed strings when pyarrow is installed.
+
+    Returns: dict: The dtype of every column of `RUN_COLUMNS`.
+    """
+    dtypes = {column: "category" for column in CATEGORICAL_COLUMNS}
+    dtypes.update({column: pd.DatetimeTZDtype(unit="us", tz="UTC") for column in TIMESTAMP_COLUMNS})
+    dtypes.update({
+        "run_number": pd.Int64Dtype(),
+        "html_url": pd.StringDtype(storage="pyarrow" if pyarrow is not None else "python"),
+        "duration_seconds": "float64"
+    })
+
+    return dtypes
+
+
+def parse_github_timestamps(values: np.ndarray, missing: np.ndarray) -> np.ndarray:
+    """
+    Parse GitHub's `YYYY-MM-DDTHH:MM:SSZ` timestamps as one array, with Arrow when installed
+    or numpy otherwise.
+
+    Args:
+        values (np.ndarray): Object array of timestamps.
+        missing (np.ndarray): Boolean mask of the missing values.
+
+    Returns: np.ndarray: The naive UTC datetimes as `datetime64[us]`, NaT where a value is missing or
+        in another format.
+    """
+    if pyarrow is not None:
+        try:
+            array = pyarrow.array(values, type=pyarrow.string(), from_pandas=True)
+            return pyarrow.compute.strptime(array, format=GITHUB_TIMESTAMP_FORMAT, unit="us", error_is_null=True) \
+                .to_numpy(zero_copy_only=False)
+        except pyarrow.ArrowException:
+            pass
+
+    # Strip the "Z" and parse with numpy, leaving every value to pandas if one is malformed
+    strings = values.astype(str)
+    utc = np.char.endswith(strings, "Z") & ~missing
+    parsed = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[us]")
+    try:
+        parsed[utc] = np.char.rstrip(strings[utc], "Z").astype(object).astype("datetime64[us]")
+    except ValueError:
+        parsed[utc] = np.datetime64("NaT")
+
+    return parsed
+
+
+def to_utc_datetime(timestamps: pd.Series, errors: str = "raise") -> pd.Series:
+    """
+    Convert timestamps to timezone-aware UTC datetimes.
+
+    Datetime columns are only localized. GitHub's `YYYY-MM-DDTHH:MM:SSZ` strings are parsed
+    natively as one array, which is several times faster than pandas' ISO 8601 parser;
+    only other strings and offsets go through `pd.to_datetime`. Missing values become NaT.
+
+    Args:
+        timestamps (pd.Series): Datetimes or ISO 8601 timestamp strings.
+        errors (str): "raise" to raise on invalid timestamps, or "coerce" to set them to NaT.
+
+    Returns: pd.Series: The UTC datetimes.
+    """
+    if pd.api.types.is_datetime64_any_dtype(timestamps):
+        return timestamps.dt.tz_convert("UTC") if timestamps.dt.tz is not None else timestamps.dt.tz_localize("UTC")
+
+    # Parse GitHub's timestamps natively, then any other timestamps with pandas
+    values = timestamps.to_numpy(dtype=object)
+    missing = pd.isna(values)
+    parsed = parse_github_timestamps(values=values, missing=missing)
+    others = np.isnat(parsed) & ~missing
+    if others.any():
+        parsed[others] = pd.to_datetime(pd.Series(values[others]), utc=True, format="ISO8601", errors=errors) \
+            .dt.tz_localize(None).to_numpy(dtype="datetime64[us]")
+
+    return pd.Series(parsed, index=timestamps.index, name=timestamps.name).dt.tz_localize("UTC")
+
+
+def apply_run_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast the workflow run columns of a DataFrame to their schema dtypes.
+
+    Columns already holding their dtype, such as those read from Parquet, are left
+    untouched, as are columns outside the schema.
+
+    Args: df (pd.DataFrame): A DataFrame of workflow runs.
+
+    Returns: pd.DataFrame: The DataFrame with typed columns.
+    """
+    for column, dtype in run_dtypes().items():
+        if column not in df.columns:
+            continue
+        if column in TIMESTAMP_COLUMNS:
+            df[column] = to_utc_datetime(timestamps=df[column])
+        elif dtype == "category":
+            if not isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = df[column].astype(dtype)
+        elif df[column].dtype != dtype:
+            df[column] = df[column].astype(dtype)
+
+    return df
+
+
+def build_runs_dataframe(runs: list, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Build a typed DataFrame of workflow runs in one step.
+
+    Args:
+        runs (list): WorkflowRun records or run dictionaries.
+        columns (Optional[List[str]]): Columns to keep. If None, all fields of the runs are kept.
+
+    Returns: pd.DataFrame: The runs, in the given order, with the dtypes of `run_dtypes`.
+    """
+    records = [run.to_dict() if hasattr(run, "to_dict") else run for run in runs]
+
+    return apply_run_schema(df=pd.DataFrame(data=records, columns=columns))
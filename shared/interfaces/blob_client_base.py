@@ -1,13 +1,14 @@
 # Import dependencies
-from typing import List, Union, Optional
+from typing import List, Union, Optional, Tuple
 from abc import ABC, abstractmethod
+import pandas as pd
 
 class AbstractBlobClient(ABC):
     """
     Abstract base class defining the interface for interacting with blob storage backends.
 
     Subclasses must implement methods for listing blobs, uploading JSON data,
-    and reading JSON data from the storage backend.
+    and reading JSON data from the storage backend, one blob or many at a time.
     """
     @abstractmethod
     def list_blob_filenames(self, container_name: str, directory_path: Optional[str] = None) -> List[str]:
@@ -24,7 +25,21 @@ class AbstractBlobClient(ABC):
         pass
 
     @abstractmethod
-    def export_dict_to_blob(self, data: list, container: str, output_filename: str) -> None:
+    def list_blob_properties(self, container_name: str, directory_path: Optional[str] = None) -> List[dict]:
+        """
+        List the blobs in a given container with their properties, optionally filtered by directory prefix.
+
+        Args:
+            container_name (str): The name of the container.
+            directory_path (Optional[str]): Prefix filter for blob names (e.g., "folder/").
+
+        Returns:
+            List[dict]: The `name`, `size`, `last_modified` and `etag` of every blob matching the prefix.
+        """
+        pass
+
+    @abstractmethod
+    def export_dict_to_blob(self, data: list, container: str, output_filename: str) -> Optional[dict]:
         """
         Uploads a list (or dict) as a JSON blob to the specified container.
 
@@ -32,6 +47,30 @@ class AbstractBlobClient(ABC):
             data (list): The data to serialize and upload.
             container (str): The target container name.
             output_filename (str): The name of the output blob.
+
+        Returns:
+            Optional[dict]: Properties of the uploaded blob (e.g. `etag`, `last_modified`), if available.
+        """
+        pass
+
+    @abstractmethod
+    def read_blob_bytes(
+        self,
+        container: str,
+        input_filename: str,
+        etag: Optional[str] = None
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Downloads the raw content of a blob, optionally only if it changed.
+
+        Args:
+            container (str): The container name.
+            input_filename (str): The name of the blob to read.
+            etag (Optional[str]): ETag of a previously read version. If the blob still has this
+                ETag, no content is downloaded.
+
+        Returns:
+            Tuple[Optional[bytes], Optional[str]]: The blob content (None if unchanged) and its current ETag.
         """
         pass
 
@@ -48,3 +87,44 @@ class AbstractBlobClient(ABC):
             Union[list, dict]: The deserialized JSON object from the blob.
         """
         pass
+
+    @abstractmethod
+    def read_blobs_to_dicts(
+        self,
+        container: str,
+        input_filenames: List[str],
+        max_workers: int = 8
+    ) -> List[Union[list, dict, Exception]]:
+        """
+        Downloads and parses many JSON blobs concurrently.
+
+        Args:
+            container (str): The container name.
+            input_filenames (List[str]): The names of the blobs to read.
+            max_workers (int): Maximum number of blobs downloaded at the same time.
+
+        Returns:
+            List[Union[list, dict, Exception]]: The deserialized JSON object of each blob, in input
+                order. A blob that could not be read yields the raised exception instead.
+        """
+        pass
+
+    @abstractmethod
+    def read_blob_to_dataframe(
+        self,
+        container: str,
+        input_filename: str,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Downloads a columnar (Parquet) blob straight into a DataFrame.
+
+        Args:
+            container (str): The container name.
+            input_filename (str): The name of the blob to read.
+            columns (Optional[List[str]]): Columns to read. If None, all columns are read.
+
+        Returns:
+            pd.DataFrame: The typed DataFrame stored in the blob.
+        """
+        pass
@@ -0,0 +1,6 @@
+# Import dependencies
+from .workflow_manifest import MANIFEST_FILENAME, build_manifest_entry
+from .workflow_index import WorkflowIndex, WorkflowIndexEntry
+from .workflow_run import WorkflowRun
+
+__all__ = ["MANIFEST_FILENAME", "WorkflowIndex", "WorkflowIndexEntry", "WorkflowRun", "build_manifest_entry"]
@@ -0,0 +1,216 @@
+# Import dependencies
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from urllib.parse import unquote
+import bisect
+
+@dataclass(slots=True)
+class WorkflowIndexEntry:
+    """
+    A workflow recorded in a WorkflowIndex.
+
+    Attributes:
+        repo (str): The name of the GitHub repository.
+        workflow_name (str): The name of the workflow.
+        blob_name (Optional[str]): The workflow blob name, or the partition prefix of a partitioned history.
+        latest_run (Optional[dict]): The latest run of the workflow, as recorded in the manifest.
+    """
+    repo: str
+    workflow_name: str
+    blob_name: Optional[str] = None
+    latest_run: Optional[dict] = None
+
+
+class WorkflowIndex:
+    """
+    An index of the stored workflows, mapping repo → workflow → entry.
+
+    The index is built in a single pass from structured sources: the latest run manifest
+    and the partitioned `runs/{repo}/{workflow}/` layout record repository and workflow
+    names explicitly. Flat `workflows/{repo}_{workflow}.json` names are split at the
+    longest repository name already known, so names containing underscores are attributed
+    correctly; only unknown repositories fall back to the first underscore.
+
+    Lookups by repository and workflow are dictionary lookups. Prefix searches bisect
+    sorted name lists, which are rebuilt lazily after the index changes.
+    """
+    def __init__(self) -> None:
+        """
+        Initialize an empty WorkflowIndex.
+        """
+        self.repos: Dict[str, Dict[str, WorkflowIndexEntry]] = {}
+        self.sorted_repos: Optional[List[str]] = None
+        self.sorted_workflows: Dict[str, List[str]] = {}
+        self.blob_names: set = set()
+
+    def __len__(self) -> int:
+        """
+        Count the indexed workflows.
+
+        Returns: int: The number of workflows.
+        """
+        return sum(len(workflows) for workflows in self.repos.values())
+
+    def add(
+        self,
+        repo: str,
+        workflow_name: str,
+        blob_name: Optional[str] = None,
+        latest_run: Optional[dict] = None
+    ) -> WorkflowIndexEntry:
+        """
+        Record a workflow, filling in details of an existing entry.
+
+        Args:
+            repo (str): The name of the GitHub repository.
+            workflow_name (str): The name of the workflow.
+            blob_name (Optional[str]): The workflow blob name or partition prefix.
+            latest_run (Optional[dict]): The latest run of the workflow.
+
+        Returns: WorkflowIndexEntry: The entry of the workflow.
+        """
+        workflows = self.repos.get(repo)
+        if workflows is None:
+            workflows = self.repos[repo] = {}
+            self.sorted_repos = None
+
+        entry = workflows.get(workflow_name)
+        if entry is None:
+            entry = workflows[workflow_name] = WorkflowIndexEntry(repo=repo, workflow_name=workflow_name)
+            self.sorted_workflows.pop(repo, None)
+
+        entry.blob_name = entry.blob_name or blob_name
+        entry.latest_run = entry.latest_run or latest_run
+        if blob_name is not None:
+            self.blob_names.add(blob_name)
+
+        return entry
+
+    def add_manifest(self, manifest: dict) -> None:
+        """
+        Record the workflows of a latest run manifest.
+
+        Args: manifest (dict): Manifest entries keyed by workflow blob name.
+        """
+        for blob_name, entry in manifest.items():
+            if entry.get("repo") and entry.get("workflow_name"):
+                self.add(repo=entry["repo"], workflow_name=entry["workflow_name"], blob_name=blob_name,
+                         latest_run=entry.get("latest_run"))
+
+    def add_blob_names(self, names: List[str]) -> None:
+        """
+        Record the workflows of stored blob names.
+
+        Partitioned names (`runs/{repo}/{workflow}/...`, with URL-quoted workflow names) are
+        recorded first, so their repositories help split the flat names (`workflows/{repo}_{workflow}.json`).
+
+        Args: names (List[str]): Blob names of workflow histories.
+        """
+        flat_names = []
+        for name in names:
+            parts = name.split("/")
+            if parts[0] == "runs" and len(parts) == 4:
+                self.add(repo=parts[1], workflow_name=unquote(parts[2]), blob_name=f"runs/{parts[1]}/{parts[2]}/")
+            elif name.endswith(".json") and name not in self.blob_names:
+                flat_names.append(name)
+
+        for name in flat_names:
+            stem = name.rsplit("/", 1)[-1][:-len(".json")]
+            repo = self.split_repo(stem=stem)
+            if repo is not None:
+                self.add(repo=repo, workflow_name=stem[len(repo) + 1:], blob_name=name)
+
+    def split_repo(self, stem: str) -> Optional[str]:
+        """
+        Find the repository of a flat `{repo}_{workflow}` blob name.
+
+        Args: stem (str): The blob file name without its directory and extension.
+
+        Returns: Optional[str]: The longest known repository prefixing the name, else the text before the
+            first underscore. None if the name holds no underscore.
+        """
+        separators = [i for i, char in enumerate(stem) if char == "_"]
+        for i in reversed(separators):
+            if stem[:i] in self.repos:
+                return stem[:i]
+
+        return stem[:separators[0]] if separators else None
+
+    def get(self, repo: str, workflow_name: str) -> Optional[WorkflowIndexEntry]:
+        """
+        Look up a workflow.
+
+        Args:
+            repo (str): The name of the GitHub repository.
+            workflow_name (str): The name of the workflow.
+
+        Returns: Optional[WorkflowIndexEntry]: The entry of the workflow, or None if it is not indexed.
+        """
+        return self.repos.get(repo, {}).get(workflow_name)
+
+    def workflows(self, repo: str) -> List[str]:
+        """
+        List the workflows of a repository in name order.
+
+        Args: repo (str): The name of the GitHub repository.
+
+        Returns: List[str]: The workflow names. Empty if the repository is not indexed.
+        """
+        if repo not in self.repos:
+            return []
+        if repo not in self.sorted_workflows:
+            self.sorted_workflows[repo] = sorted(self.repos[repo])
+
+        return self.sorted_workflows[repo]
+
+    def repositories(self) -> List[str]:
+        """
+        List the indexed repositories in name order.
+
+        Returns: List[str]: The repository names.
+        """
+        if self.sorted_repos is None:
+            self.sorted_repos = sorted(self.repos)
+
+        return self.sorted_repos
+
+    def search(self, prefix: str, repo: Optional[str] = None) -> List[str]:
+        """
+        Find the repositories, or the workflows of a repository, whose name starts with a prefix.
+
+        Args:
+            prefix (str): The name prefix.
+            repo (Optional[str]): If set, workflows of this repository are searched instead of repositories.
+
+        Returns: List[str]: The matching names in name order.
+        """
+        names = self.repositories() if repo is None else self.workflows(repo=repo)
+        start = bisect.bisect_left(names, prefix)
+        end = bisect.bisect_left(names, prefix + "\uffff", lo=start)
+
+        return names[start:end]
+
+    def to_map(self) -> dict:
+        """
+        Convert the index into a mapping of repositories to their workflows.
+
+        Returns: dict: Each repository name mapped to its workflow names, both in name order.
+        """
+        return {repo: list(self.workflows(repo=repo)) for repo in self.repositories()}
+
+    @classmethod
+    def build(cls, manifest: Optional[dict] = None, blob_names: Optional[List[str]] = None) -> "WorkflowIndex":
+        """
+        Build an index from a latest run manifest and stored blob names.
+
+        Args:
+            manifest (Optional[dict]): Manifest entries keyed by workflow blob name.
+            blob_names (Optional[List[str]]): Blob names of workflow histories.
+
+        Returns: WorkflowIndex: The index.
+        """
+        index = cls()
+        index.add_manifest(manifest=manifest or {})
+        index.add_blob_names(names=blob_names or [])
+
+        return index
@@ -0,0 +1,39 @@
+# Import dependencies
+from typing import Optional
+
+# Blob holding the latest run of every workflow, written by the scraper
+MANIFEST_FILENAME = "manifests/latest_runs.json"
+
+def build_manifest_entry(
+    repo: str,
+    workflow_name: str,
+    active_status: Optional[str],
+    runs: list,
+    properties: Optional[dict] = None,
+    run_count: Optional[int] = None
+) -> dict:
+    """
+    Build the manifest entry of a workflow from its run history.
+
+    Args:
+        repo (str): The name of the GitHub repository.
+        workflow_name (str): The name of the workflow.
+        active_status (Optional[str]): The state of the workflow (e.g. "active").
+        runs (list): The stored run records of the workflow, newest first.
+        properties (Optional[dict]): Properties of the uploaded workflow blob (`etag`, `last_modified`).
+        run_count (Optional[int]): Total number of stored runs, if `runs` is not the complete history.
+
+    Returns: dict: The latest run, active state, run count and blob properties of the workflow.
+    """
+    properties = properties or {}
+    last_modified = properties.get("last_modified")
+
+    return {
+        "repo": repo,
+        "workflow_name": workflow_name,
+        "active_status": active_status,
+        "latest_run": runs[0] if runs else None,
+        "run_count": len(runs) if run_count is None else run_count,
+        "last_modified": last_modified.isoformat() if hasattr(last_modified, "isoformat") else last_modified,
+        "etag": properties.get("etag")
+    }
@@ -0,0 +1,92 @@
+# Import dependencies
+from dataclasses import dataclass
+from typing import Any, Optional
+import sys
+
+def intern(value: Optional[str]) -> Optional[str]:
+    """
+    Intern a repeated string value so equal values share a single object.
+
+    Args: value (Optional[str]): The value to intern.
+
+    Returns: Optional[str]: The interned string, or the value unchanged if it is not a string.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
+class WorkflowRun:
+    """
+    A compact, typed record of a single GitHub Actions workflow run.
+
+    Records use `__slots__` instead of a per-instance dict, and low-cardinality string
+    fields (repository, workflow name, states) are interned so that records of the same
+    workflow share their string objects. Records serialise to the same JSON objects as
+    the dictionaries previously produced by `GitHubClient.aggregate_workflow_data`, with
+    keys in the same order.
+
+    Attributes:
+        repo (str): The name of the GitHub repository.
+        workflow_name (str): The name of the workflow.
+        active_status (Optional[str]): The state of the workflow (e.g. "active").
+        status (Optional[str]): The status of the run (e.g. "completed").
+        conclusion (Optional[str]): The conclusion of the run (e.g. "success").
+        created_at (Optional[str]): ISO 8601 creation timestamp.
+        updated_at (Optional[str]): ISO 8601 last update timestamp.
+        run_number (Optional[int]): The run number within the workflow.
+        html_url (Optional[str]): Link to the run on GitHub.
+        duration_seconds (Optional[float]): Duration of the run in seconds.
+    """
+    repo: str
+    workflow_name: str
+    active_status: Optional[str] = None
+    status: Optional[str] = None
+    conclusion: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    run_number: Optional[int] = None
+    html_url: Optional[str] = None
+    duration_seconds: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        """
+        Intern the low-cardinality string fields of the record.
+        """
+        self.repo = intern(self.repo)
+        self.workflow_name = intern(self.workflow_name)
+        self.active_status = intern(self.active_status)
+        self.status = intern(self.status)
+        self.conclusion = intern(self.conclusion)
+
+    def __getitem__(self, key: str) -> Any:
+        """
+        Allow dictionary-style access to record fields.
+
+        Args: key (str): The field name to retrieve.
+
+        Returns: Any: The value of the requested field.
+
+        Raises: KeyError: If the requested key is not a field of the record.
+        """
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(f"{key} not found in WorkflowRun")
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WorkflowRun":
+        """
+        Build a record from a JSON object, ignoring unknown keys.
+
+        Args: data (dict): A run record as stored in blob storage.
+
+        Returns: WorkflowRun: The typed record.
+        """
+        return cls(**{field: data.get(field) for field in cls.__slots__})
+
+    def to_dict(self) -> dict:
+        """
+        Convert the record into a JSON serialisable dictionary.
+
+        Returns: dict: The record fields, in declaration order.
+        """
+        return {field: getattr(self, field) for field in self.__slots__}
@@ -1,5 +1,6 @@
 # Import dependencies
 from frontend.functions.data_functions import collect_latest_workflow_runs
+from azure.core.exceptions import ResourceNotFoundError
 from unittest.mock import patch, MagicMock
 from behave import given, when, then
 import pandas as pd
@@ -33,18 +34,22 @@ def when_call_collect_latest_workflow_runs(context):
     Calls the function under test, patching BlobClient so it returns
     the mock workflow files and workflow run data from the feature file.
     """
-    with patch("frontend.functions.data_functions.BlobClient") as MockBlobClient:
+    with patch("frontend.functions.data_functions.BlobClient") as MockBlobClient, \
+            patch("frontend.functions.data_functions.CachedBlobClient", side_effect=lambda client: client):
         mock_client_instance = MagicMock()
         MockBlobClient.return_value = mock_client_instance
 
+        # Simulate a store without a latest run manifest
+        mock_client_instance.read_blob_to_dict.side_effect = ResourceNotFoundError("manifest missing")
+
         # Return filenames from the feature file
         mock_client_instance.list_blob_filenames.return_value = context.mock_files
 
-        # Return the workflow run data for each file
-        def mock_read_blob_to_dict(container, input_filename):
-            return context.mock_workflow_data[input_filename]
+        # Return the workflow run data for each file, in input order
+        def mock_read_blobs_to_dicts(container, input_filenames):
+            return [context.mock_workflow_data[input_filename] for input_filename in input_filenames]
 
-        mock_client_instance.read_blob_to_dict.side_effect = mock_read_blob_to_dict
+        mock_client_instance.read_blobs_to_dicts.side_effect = mock_read_blobs_to_dicts
 
         # Call the function under test
         context.result = collect_latest_workflow_runs()
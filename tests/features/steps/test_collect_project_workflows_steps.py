@@ -27,7 +27,8 @@ def when_call_collect_project_workflows(context):
     external storage dependency.
     """
     # Patch BlobClient used inside data_functions
-    with patch("frontend.functions.data_functions.BlobClient") as MockBlobClient:
+    with patch("frontend.functions.data_functions.BlobClient") as MockBlobClient, \
+            patch("frontend.functions.data_functions.CachedBlobClient", side_effect=lambda client: client):
         # Mock instance returned when BlobClient is instantiated
         mock_client_instance = MockBlobClient.return_value
         # Return the workflow filenames from the feature file
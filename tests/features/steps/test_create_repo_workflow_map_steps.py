@@ -1,6 +1,7 @@
 # Import dependencies
 from frontend.functions.data_functions import create_repo_workflow_map
 from behave import given, when, then
+from azure.core.exceptions import ResourceNotFoundError
 from unittest.mock import patch
 
 @given("the following workflow filenames are available")
@@ -22,14 +23,17 @@ def when_call_create_repo_workflow_map(context):
     WHEN step:
     Calls the `create_repo_workflow_map()` function under test.
 
-    Uses `unittest.mock.patch` to replace the dependency `collect_project_workflows`
-    with a mock that returns the filenames provided in the feature file. This
+    Uses `unittest.mock.patch` to replace the blob client with a mock that lists
+    the filenames provided in the feature file, without a manifest. This
     ensures the test does not rely on external storage.
     """
     # Patch the dependency inside the module under test
-    with patch("frontend.functions.data_functions.collect_project_workflows") as mock_collect:
-        # Mock returns the filenames we provided in the feature file
-        mock_collect.return_value = context.mock_workflow_files
+    with patch("frontend.functions.data_functions.create_blob_client") as mock_create_blob_client:
+        # Mock lists the filenames we provided in the feature file as workflow blobs
+        mock_instance = mock_create_blob_client.return_value
+        mock_instance.read_blob_to_dict.side_effect = ResourceNotFoundError("missing")
+        mock_instance.list_blob_filenames.side_effect = lambda container_name, directory_path: \
+            [f"workflows/{file}" for file in context.mock_workflow_files] if directory_path == "workflows" else []
 
         # Call the actual function and store the result in the context
         context.result = create_repo_workflow_map()
@@ -1,9 +1,11 @@
 # Import dependencies
-from backend.functions.data.github_client import GitHubClient
+from backend.functions.data.github_client import GitHubClient, NotModified
+from backend.functions.data.rate_limiter import RateLimiter
 from unittest.mock import patch, MagicMock
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import pytest
 import requests
+import time
 
 # Patch the configure_logging function to return a mock logger during initialization
 @patch("backend.functions.data.github_client.configure_logging")
@@ -30,31 +32,32 @@ def test_init_sets_expected_attributes(mock_logger):
     assert client.HEADERS == {"Authorization": "token test-token"}
 
 
-# Patch requests.get to simulate GitHub API responses
-@patch("backend.functions.data.github_client.requests.get")
-def test_list_repository_workflows_returns_expected_data(mock_get):
+def test_list_repository_workflows_returns_expected_data():
     """
     Test that list_repository_workflows returns workflows from GitHub API.
     """
-    # Create a mock response object to simulate requests.get response
-    mock_response = MagicMock()
+    # Create a mock session and response object to simulate the session.get response
+    mock_session = MagicMock()
+    mock_response = MagicMock(headers={})
 
     # Set the mock response JSON to return a sample workflow
     mock_response.json.return_value = {"workflows": [{"id": 1, "name": "CI"}]}
+    mock_response.links = {}
 
-    # Make requests.get return the mock response
-    mock_get.return_value = mock_response
+    # Make session.get return the mock response
+    mock_session.get.return_value = mock_response
 
-    # Instantiate the GitHubClient
-    client = GitHubClient(GITHUB_TOKEN="abc123")
+    # Instantiate the GitHubClient with the mock session
+    client = GitHubClient(GITHUB_TOKEN="abc123", session=mock_session)
 
     # Call list_repository_workflows with a test repository
     result = client.list_repository_workflows("repo-one")
 
-    # Assert that requests.get was called with the correct URL and headers
-    mock_get.assert_called_once_with(
+    # Assert that session.get was called with the correct URL and headers
+    mock_session.get.assert_called_once_with(
         "https://api.github.com/repos/powellrhys/repo-one/actions/workflows",
         headers=client.HEADERS,
+        params={"per_page": 100},
         timeout=30
     )
 
@@ -65,46 +68,73 @@ def test_list_repository_workflows_returns_expected_data(mock_get):
     assert result == [{"id": 1, "name": "CI"}]
 
 
-# Patch requests.get to simulate HTTP errors
-@patch("backend.functions.data.github_client.requests.get")
-def test_list_repository_workflows_raises_for_status_error(mock_get):
+def test_list_repository_workflows_raises_for_status_error():
     """
     Test that HTTP errors from the GitHub API are raised properly.
     """
-    # Create a mock response object
-    mock_response = MagicMock()
+    # Create a mock session and response object
+    mock_session = MagicMock()
+    mock_response = MagicMock(headers={})
 
     # Simulate an HTTP error when raise_for_status is called
     mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("Bad Request")
 
-    # Make requests.get return the mock response
-    mock_get.return_value = mock_response
+    # Make session.get return the mock response
+    mock_session.get.return_value = mock_response
 
     # Instantiate the GitHubClient
-    client = GitHubClient(GITHUB_TOKEN="abc123")
+    client = GitHubClient(GITHUB_TOKEN="abc123", session=mock_session)
 
     # Assert that calling list_repository_workflows raises the HTTPError
     with pytest.raises(requests.exceptions.HTTPError):
         client.list_repository_workflows("repo-one")
 
 
-# Patch requests.get for workflow metadata fetching
-@patch("backend.functions.data.github_client.requests.get")
-def test_collect_workflow_metadata_returns_expected_data(mock_get):
+def test_list_repository_workflows_reuses_cached_listing_on_304():
+    """
+    Test that list_repository_workflows caches the listing with its validators, sends them
+    back as `If-None-Match` and returns the cached listing on a 304 response.
+    """
+    # Create a 200 response carrying validators followed by a 304 response
+    ok_response = MagicMock(status_code=200, headers={"ETag": '"wf1"'})
+    ok_response.json.return_value = {"workflows": [{"id": 1, "name": "CI", "state": "active"}]}
+    ok_response.links = {}
+    not_modified_response = MagicMock(status_code=304, headers={})
+
+    mock_session = MagicMock()
+    mock_session.get.side_effect = [ok_response, not_modified_response]
+
+    # Instantiate GitHubClient with an empty validator cache
+    etag_cache = {}
+    client = GitHubClient(GITHUB_TOKEN="token", session=mock_session, etag_cache=etag_cache)
+
+    # First scrape lists workflows and caches them with their validators
+    assert client.list_repository_workflows("repoX") == [{"id": 1, "name": "CI", "state": "active"}]
+    assert etag_cache[client.workflows_cache_key("repoX")]["etag"] == '"wf1"'
+
+    # Second scrape sends validators and returns the cached listing on 304
+    assert client.list_repository_workflows("repoX") == [{"id": 1, "name": "CI", "state": "active"}]
+    assert mock_session.get.call_args.kwargs["headers"]["If-None-Match"] == '"wf1"'
+    assert mock_session.get.call_count == 2
+
+
+def test_collect_workflow_metadata_returns_expected_data():
     """
     Test that collect_workflow_metadata retrieves workflow runs correctly.
     """
-    # Create a mock response for the GET request
-    mock_response = MagicMock()
+    # Create a mock session and response for the GET request
+    mock_session = MagicMock()
+    mock_response = MagicMock(headers={})
 
     # Set the JSON response to return workflow_runs data
     mock_response.json.return_value = {"workflow_runs": [{"run_number": 10}]}
+    mock_response.links = {}
 
-    # Make requests.get return the mock response
-    mock_get.return_value = mock_response
+    # Make session.get return the mock response
+    mock_session.get.return_value = mock_response
 
     # Instantiate GitHubClient
-    client = GitHubClient(GITHUB_TOKEN="token123")
+    client = GitHubClient(GITHUB_TOKEN="token123", session=mock_session)
 
     # Define a sample workflow object with an ID
     workflow = {"id": 111}
@@ -112,10 +142,12 @@ def test_collect_workflow_metadata_returns_expected_data(mock_get):
     # Call collect_workflow_metadata with a test repo and workflow
     result = client.collect_workflow_metadata("repoX", workflow)
 
-    # Assert that requests.get was called with the correct runs endpoint
-    mock_get.assert_called_once_with(
+    # Assert that session.get was called with the correct runs endpoint
+    mock_session.get.assert_called_once_with(
         "https://api.github.com/repos/powellrhys/repoX/actions/workflows/111/runs",
-        headers=client.HEADERS
+        headers=client.HEADERS,
+        params={"per_page": 100},
+        timeout=30
     )
 
     # Assert that raise_for_status was called to ensure error handling
@@ -125,29 +157,270 @@ def test_collect_workflow_metadata_returns_expected_data(mock_get):
     assert result == [{"run_number": 10}]
 
 
-# Patch requests.get for error handling in metadata fetch
-@patch("backend.functions.data.github_client.requests.get")
-def test_collect_workflow_metadata_raises_for_status_error(mock_get):
+def test_collect_workflow_metadata_raises_for_status_error():
     """
     Test that collect_workflow_metadata raises an HTTPError for failed requests.
     """
-    # Create a mock response object
-    mock_response = MagicMock()
+    # Create a mock session and response object
+    mock_session = MagicMock()
+    mock_response = MagicMock(headers={})
 
     # Simulate HTTP error on raise_for_status
     mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("Not Found")
 
-    # Make requests.get return the mock response
-    mock_get.return_value = mock_response
+    # Make session.get return the mock response
+    mock_session.get.return_value = mock_response
 
     # Instantiate GitHubClient
-    client = GitHubClient(GITHUB_TOKEN="test")
+    client = GitHubClient(GITHUB_TOKEN="test", session=mock_session)
 
     # Verify that HTTPError is raised when calling collect_workflow_metadata
     with pytest.raises(requests.exceptions.HTTPError):
         client.collect_workflow_metadata("repoY", {"id": 999})
 
 
+def test_iter_workflow_run_pages_follows_link_header_and_respects_max_runs():
+    """
+    Test that iter_workflow_run_pages follows `Link: rel="next"` urls page by page
+    and stops once the maximum history depth is reached.
+    """
+    # Create two mock pages linked through the Link header
+    first_page = MagicMock(headers={})
+    first_page.json.return_value = {"workflow_runs": [{"run_number": 3}, {"run_number": 2}]}
+    first_page.links = {"next": {"url": "https://api.github.com/next-page"}}
+
+    second_page = MagicMock(headers={})
+    second_page.json.return_value = {"workflow_runs": [{"run_number": 1}, {"run_number": 0}]}
+    second_page.links = {"next": {"url": "https://api.github.com/unreachable-page"}}
+
+    # Make session.get return the pages in order
+    mock_session = MagicMock()
+    mock_session.get.side_effect = [first_page, second_page]
+
+    # Instantiate GitHubClient with a small page size
+    client = GitHubClient(GITHUB_TOKEN="token", session=mock_session, per_page=2)
+
+    # Collect pages with a maximum depth of three runs
+    pages = list(client.iter_workflow_run_pages("repoX", {"id": 7}, max_runs=3))
+
+    # Assert pages are yielded individually and trimmed to the maximum depth
+    assert pages == [[{"run_number": 3}, {"run_number": 2}], [{"run_number": 1}]]
+
+    # Assert the next page was requested from the Link header without repeating parameters
+    assert mock_session.get.call_count == 2
+    assert mock_session.get.call_args_list[1].args[0] == "https://api.github.com/next-page"
+    assert mock_session.get.call_args_list[1].kwargs["params"] is None
+
+
+def test_iter_workflow_run_pages_sends_conditional_requests():
+    """
+    Test that iter_workflow_run_pages stores ETag validators on a 200 response, sends them
+    back as `If-None-Match` and raises NotModified on a 304 response.
+    """
+    # Create a 200 response carrying validators followed by a 304 response
+    ok_response = MagicMock(status_code=200, headers={"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2025"})
+    ok_response.json.return_value = {"workflow_runs": [{"run_number": 1}]}
+    ok_response.links = {}
+    not_modified_response = MagicMock(status_code=304, headers={})
+
+    mock_session = MagicMock()
+    mock_session.get.side_effect = [ok_response, not_modified_response]
+
+    # Instantiate GitHubClient with an empty validator cache
+    etag_cache = {}
+    client = GitHubClient(GITHUB_TOKEN="token", session=mock_session, etag_cache=etag_cache)
+    workflow = {"id": 5, "state": "active"}
+
+    # First scrape returns runs and caches validators
+    assert list(client.iter_workflow_run_pages("repoX", workflow)) == [[{"run_number": 1}]]
+    cache_key = client.workflow_runs_cache_key("repoX", workflow)
+    assert etag_cache[cache_key] == {"etag": '"abc"', "last_modified": "Mon, 01 Jan 2025"}
+
+    # Second scrape sends validators and short-circuits on 304
+    with pytest.raises(NotModified):
+        list(client.iter_workflow_run_pages("repoX", workflow))
+    headers = mock_session.get.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"abc"'
+    assert headers["If-Modified-Since"] == "Mon, 01 Jan 2025"
+
+    # Forgetting validators removes the cache entry
+    client.forget_validators("repoX", workflow)
+    assert cache_key not in etag_cache
+
+
+@patch("backend.functions.data.rate_limiter.time")
+def test_request_retries_rate_limited_responses(mock_time):
+    """
+    Test that requests rejected by a secondary rate limit wait for `Retry-After`
+    and are retried, and that usage is reported by the rate limiter.
+    """
+    # Simulate a clock that advances when the limiter sleeps
+    clock = {"now": 1000.0}
+    mock_time.time.side_effect = lambda: clock["now"]
+    mock_time.monotonic.side_effect = lambda: clock["now"]
+    mock_time.sleep.side_effect = lambda seconds: clock.update(now=clock["now"] + seconds)
+
+    # Create a secondary rate limit response followed by a successful response
+    limited = MagicMock(status_code=403, headers={"Retry-After": "30"})
+    ok = MagicMock(status_code=200, headers={"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4990",
+                                             "X-RateLimit-Reset": "9999999999"})
+
+    mock_session = MagicMock()
+    mock_session.get.side_effect = [limited, ok]
+
+    # Execute request through the client
+    client = GitHubClient(GITHUB_TOKEN="token", session=mock_session)
+    result = client.request(url="https://api.github.com/x", headers=client.HEADERS)
+
+    # Assert the request was retried after waiting for the secondary limit
+    assert result is ok
+    assert mock_session.get.call_count == 2
+    mock_time.sleep.assert_called_once_with(30)
+
+    # Assert usage is reported
+    summary = client.rate_limiter.summary()
+    assert summary["requests"] == 2
+    assert summary["throttled"] == 1
+    assert summary["quota_used"] == 1
+    assert summary["quota_remaining"] == 4990
+
+
+def test_rate_limiter_paces_requests_when_quota_runs_low():
+    """
+    Test that the rate limiter lowers its refill rate to spread a low remaining quota
+    over the reset window, and pauses once only the reserve is left.
+    """
+    limiter = RateLimiter(max_rate=10, reserve=50)
+    reset_at = int(time.time()) + 1000
+
+    # A healthy quota keeps the maximum rate
+    limiter.update(MagicMock(status_code=200, headers={"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4000",
+                                                       "X-RateLimit-Reset": str(reset_at)}))
+    assert limiter.rate == 10
+
+    # A low quota is spread over the remaining window
+    limiter.update(MagicMock(status_code=200, headers={"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "550",
+                                                       "X-RateLimit-Reset": str(reset_at)}))
+    assert limiter.rate == pytest.approx(0.5, rel=0.05)
+
+    # An exhausted quota pauses requests against its resource until the reset
+    limiter.update(MagicMock(status_code=200, headers={"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "50",
+                                                       "X-RateLimit-Reset": str(reset_at)}))
+    assert limiter.quotas["core"].blocked_until == reset_at + 1
+
+
+@patch("backend.functions.data.rate_limiter.time")
+def test_request_backs_off_secondary_limits_without_retry_after(mock_time):
+    """
+    Test that a secondary rate limit 403 without `Retry-After`, with primary quota left,
+    is retried after GitHub's advised minute rather than failing the request.
+    """
+    # Simulate a clock that advances when the limiter sleeps
+    clock = {"now": 1000.0}
+    mock_time.time.side_effect = lambda: clock["now"]
+    mock_time.monotonic.side_effect = lambda: clock["now"]
+    mock_time.sleep.side_effect = lambda seconds: clock.update(now=clock["now"] + seconds)
+
+    # Create a secondary rate limit response followed by a successful response
+    limited = MagicMock(status_code=403, headers={"X-RateLimit-Remaining": "4000"},
+                        text='{"message": "You have exceeded a secondary rate limit."}')
+    forbidden = MagicMock(status_code=403, headers={"X-RateLimit-Remaining": "4000"}, text='{"message": "Forbidden"}')
+    mock_session = MagicMock()
+    mock_session.get.side_effect = [limited, MagicMock(status_code=200, headers={})]
+
+    # Execute request through the client
+    client = GitHubClient(GITHUB_TOKEN="token", session=mock_session)
+    assert client.request(url="https://api.github.com/x", headers=client.HEADERS).status_code == 200
+
+    # Assert the request waited a minute, and other 403 responses are not treated as rate limits
+    mock_time.sleep.assert_called_once_with(60)
+    assert client.rate_limiter.is_rate_limited(resp=MagicMock(status_code=429, headers={}))
+    assert not client.rate_limiter.is_rate_limited(resp=forbidden)
+
+
+def test_rate_limiter_tracks_quota_per_resource():
+    """
+    Test that REST and GraphQL quotas are tracked separately, so an exhausted GraphQL quota
+    does not pause REST requests and each resource keeps its own reset window.
+    """
+    limiter = RateLimiter(max_rate=10, reserve=50)
+    reset_at = int(time.time()) + 1000
+
+    # Exhaust the GraphQL quota while the REST quota is healthy
+    limiter.update(MagicMock(status_code=200, headers={"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4000",
+                                                       "X-RateLimit-Reset": str(reset_at + 500),
+                                                       "X-RateLimit-Resource": "core"}))
+    limiter.update(MagicMock(status_code=200, headers={"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "10",
+                                                       "X-RateLimit-Reset": str(reset_at),
+                                                       "X-RateLimit-Resource": "graphql"}))
+
+    # Verify only GraphQL requests are paused, and each resource keeps its window
+    assert limiter.quotas["graphql"].blocked_until == reset_at + 1
+    assert limiter.quotas["core"].blocked_until == 0.0
+    assert limiter.quotas["core"].reset_at == reset_at + 500
+    limiter.acquire(resource="core")
+
+    summary = limiter.summary()
+    assert summary["resources"] == {"core": 4000, "graphql": 10}
+    assert summary["quota_remaining"] == 10
+
+
+def test_discover_repositories_enumerates_pages_and_applies_filters():
+    """
+    Test that discover_repositories requests every page of the owner's repositories and
+    skips archived, stale and filtered repositories.
+    """
+    # Define repository pages, the first page linking to the last page
+    pages = {
+        None: [{"name": "app-one", "pushed_at": "2025-06-01T00:00:00Z"},
+               {"name": "old-archive", "archived": True, "pushed_at": "2025-06-01T00:00:00Z"}],
+        2: [{"name": "app-two", "pushed_at": "2025-06-01T00:00:00Z"},
+            {"name": "app-stale", "pushed_at": "2020-01-01T00:00:00Z"}],
+        3: [{"name": "sandbox", "pushed_at": "2025-06-01T00:00:00Z"},
+            {"name": "app-private-notes", "pushed_at": "2025-06-01T00:00:00Z"}],
+    }
+
+    def mock_get(url, headers, params, timeout):
+        resp = MagicMock(status_code=200, headers={})
+        resp.json.return_value = pages[params.get("page")]
+        resp.links = {"last": {"url": f"{url}?per_page=100&page=3"}} if "page" not in params else {}
+        return resp
+
+    mock_session = MagicMock()
+    mock_session.get.side_effect = mock_get
+
+    # Discover repositories matching "app-*" except private ones, pushed in 2025
+    client = GitHubClient(GITHUB_TOKEN="token", owner="someone", session=mock_session)
+    result = client.discover_repositories(include=["app-*"], exclude=["*-private-*"],
+                                          pushed_since=datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+    # Assert only active, matching repositories are returned
+    assert result == ["app-one", "app-two"]
+
+    # Assert every page of the user endpoint was requested
+    assert mock_session.get.call_count == 3
+    assert mock_session.get.call_args_list[0].args[0] == "https://api.github.com/users/someone/repos"
+
+
+def test_create_session_mounts_pooled_retrying_adapter():
+    """
+    Test that create_session mounts an HTTPAdapter with the requested pool size and retry policy.
+    """
+    # Build a session with custom pool and retry settings
+    session = GitHubClient.create_session(pool_maxsize=25, max_retries=4, backoff_factor=0.1)
+
+    # Collect the adapter used for https traffic
+    adapter = session.get_adapter("https://api.github.com")
+
+    # Assert pool size is applied
+    assert adapter._pool_maxsize == 25
+
+    # Assert retry policy covers transient server errors with backoff
+    assert adapter.max_retries.total == 4
+    assert adapter.max_retries.backoff_factor == 0.1
+    assert {500, 502, 503, 504}.issubset(adapter.max_retries.status_forcelist)
+
+
 # Patch configure_logging for workflow_duration tests
 @patch("backend.functions.data.github_client.configure_logging")
 def test_workflow_duration_returns_correct_seconds(mock_logger):
@@ -245,3 +518,58 @@ def test_aggregate_workflow_data_returns_expected_structure(mock_logger):
     # Verify that workflow_duration was called and its value used
     assert result[0]["duration_seconds"] == 42
     client.workflow_duration.assert_called_once_with(run=runs[0])
+
+
+# Patch configure_logging for batched duration tests
+@patch("backend.functions.data.github_client.configure_logging")
+def test_workflow_durations_matches_per_run_path(mock_logger):
+    """
+    Test that workflow_durations returns the same durations as workflow_duration and
+    logs invalid rows through the per-run path.
+    """
+    # Create a mock logger instance
+    mock_logger_instance = MagicMock()
+    mock_logger.return_value = mock_logger_instance
+
+    # Instantiate GitHubClient
+    client = GitHubClient(GITHUB_TOKEN="token", session=MagicMock())
+
+    # Define valid, fallback and invalid runs
+    runs = [
+        {"run_number": 1, "run_started_at": "2025-01-01T12:00:30Z", "created_at": "2025-01-01T12:00:00Z",
+         "updated_at": "2025-01-01T12:05:00Z"},
+        {"run_number": 2, "created_at": "2025-01-01T12:00:00+00:00", "updated_at": "2025-01-01T12:00:42+00:00"},
+        {"run_number": 3, "created_at": "bad-timestamp", "updated_at": None},
+    ]
+
+    # Calculate durations with the batched path
+    result = client.workflow_durations(runs)
+
+    # Assert durations match the per-run path
+    assert result == [270.0, 42.0, None]
+    assert mock_logger_instance.warning.call_count == 1
+    assert result == [client.workflow_duration(run) for run in runs]
+
+
+# Patch configure_logging for batched duration tests
+@patch("backend.functions.data.github_client.configure_logging")
+def test_workflow_durations_falls_back_only_for_unparsed_runs(mock_logger):
+    """
+    Test that workflow_durations parses UTC and offset timestamps as whole columns, and only
+    runs with missing or invalid timestamps go through the per-run path.
+    """
+    # Instantiate GitHubClient with the per-run path spied on
+    client = GitHubClient(GITHUB_TOKEN="token", session=MagicMock())
+    client.workflow_duration = MagicMock(wraps=client.workflow_duration)
+
+    # Define UTC, offset and invalid runs
+    runs = [
+        {"run_number": 1, "created_at": "2025-01-01T12:00:00Z", "updated_at": "2025-01-01T12:01:00Z"},
+        {"run_number": 2, "created_at": "2025-01-01T13:00:00+01:00", "updated_at": "2025-01-01T12:00:30Z"},
+        {"run_number": 3, "created_at": "2025-01-01T12:00:00Z", "updated_at": "not-a-timestamp"},
+    ]
+
+    # Assert only the invalid run fell back to the per-run path
+    assert client.workflow_durations(runs) == [60.0, 30.0, None]
+    client.workflow_duration.assert_called_once_with(run=runs[2])
+    assert client.workflow_durations([]) == []
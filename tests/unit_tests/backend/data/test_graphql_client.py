@@ -0,0 +1,153 @@
+# Import dependencies
+from backend.functions.data.graphql_client import GraphQLGitHubClient
+from backend.functions.data.github_client import GitHubClient
+from unittest.mock import MagicMock
+import pytest
+import requests
+
+def graphql_response(data: dict) -> MagicMock:
+    """
+    Build a mock GraphQL response returning the given data object.
+    """
+    resp = MagicMock(status_code=200, headers={})
+    resp.json.return_value = {"data": data}
+    return resp
+
+
+def test_normalised_runs_aggregate_to_rest_records():
+    """
+    Test that a GraphQL workflow run, once normalised, is aggregated into exactly the
+    same record as the equivalent REST API workflow run.
+    """
+    # Define the same run as returned by the REST and GraphQL APIs
+    rest_run = {
+        "status": "completed",
+        "conclusion": "success",
+        "created_at": "2025-01-01T12:00:00Z",
+        "updated_at": "2025-01-01T12:05:00Z",
+        "run_started_at": "2025-01-01T12:00:00Z",
+        "run_number": 7,
+        "html_url": "https://github.com/powellrhys/repo/actions/runs/1",
+        "id": 1,
+        "event": "push"
+    }
+    graphql_node = {
+        "runNumber": 7,
+        "createdAt": "2025-01-01T12:00:00Z",
+        "updatedAt": "2025-01-01T12:05:00Z",
+        "url": "https://github.com/powellrhys/repo/actions/runs/1",
+        "checkSuite": {"status": "COMPLETED", "conclusion": "SUCCESS"}
+    }
+
+    # Aggregate both runs
+    rest_records = GitHubClient(GITHUB_TOKEN="token", session=MagicMock()) \
+        .aggregate_workflow_data("repo", "build", [rest_run], "active")
+    graphql_records = GraphQLGitHubClient(GITHUB_TOKEN="token", session=MagicMock()) \
+        .aggregate_workflow_data("repo", "build", [GraphQLGitHubClient.normalise_workflow_run(graphql_node)], "active")
+
+    # Assert the records are identical
+    assert graphql_records == rest_records
+
+
+def test_list_repository_workflows_batches_runs_and_follows_cursors():
+    """
+    Test that listing workflows prefetches the runs of every workflow in one batched
+    GraphQL query, and that further pages are requested with the workflow's cursor.
+    """
+    # Define the REST workflow listing response
+    workflows_response = MagicMock(status_code=200, headers={}, links={})
+    workflows_response.json.return_value = {"workflows": [{"id": 1, "node_id": "W1", "name": "build"},
+                                                          {"id": 2, "node_id": "W2", "name": "deploy"}]}
+
+    # Define the batched first page and the continuation page of the first workflow
+    def run_node(number):
+        return {"runNumber": number, "createdAt": "2025-01-01T00:00:00Z", "updatedAt": "2025-01-01T00:01:00Z",
+                "url": f"url{number}", "checkSuite": {"status": "COMPLETED", "conclusion": "SUCCESS"}}
+
+    batch_response = graphql_response({
+        "w0": {"runs": {"nodes": [run_node(3)], "pageInfo": {"hasNextPage": True, "endCursor": "C1"}}},
+        "w1": {"runs": {"nodes": [run_node(9)], "pageInfo": {"hasNextPage": False, "endCursor": None}}},
+    })
+    next_page_response = graphql_response({
+        "w0": {"runs": {"nodes": [run_node(2)], "pageInfo": {"hasNextPage": False, "endCursor": None}}}
+    })
+
+    mock_session = MagicMock()
+    mock_session.get.return_value = workflows_response
+    mock_session.post.side_effect = [batch_response, next_page_response]
+
+    # List workflows, then iterate the runs of both workflows
+    client = GraphQLGitHubClient(GITHUB_TOKEN="token", session=mock_session)
+    workflows = client.list_repository_workflows("repo")
+    build_pages = list(client.iter_workflow_run_pages("repo", workflows[0]))
+    deploy_pages = list(client.iter_workflow_run_pages("repo", workflows[1]))
+
+    # Assert both workflows were fetched in one query, with one continuation query
+    assert mock_session.post.call_count == 2
+    first_variables = mock_session.post.call_args_list[0].kwargs["json"]["variables"]
+    assert (first_variables["id0"], first_variables["id1"]) == ("W1", "W2")
+    second_variables = mock_session.post.call_args_list[1].kwargs["json"]["variables"]
+    assert (second_variables["id0"], second_variables["after0"]) == ("W1", "C1")
+
+    # Assert runs are yielded page by page in REST shape
+    assert [[run["run_number"] for run in page] for page in build_pages] == [[3], [2]]
+    assert [[run["run_number"] for run in page] for page in deploy_pages] == [[9]]
+    assert build_pages[0][0]["status"] == "completed"
+
+
+def test_unused_prefetched_pages_are_dropped_when_the_repository_is_listed_again():
+    """
+    Test that first pages prefetched for a repository are used once, and that pages left
+    unused are dropped by the next listing of the repository rather than served stale.
+    """
+    # Define two workflow listings, where the second workflow is gone from the second one
+    build = {"id": 1, "node_id": "W1", "name": "build"}
+    deploy = {"id": 2, "node_id": "W2", "name": "deploy"}
+    listings = []
+    for workflows in ([build, deploy], [build]):
+        listing = MagicMock(status_code=200, headers={}, links={})
+        listing.json.return_value = {"workflows": workflows}
+        listings.append(listing)
+
+    # Define batched first pages, and a fresh page of the second workflow
+    def runs_response(*numbers):
+        return graphql_response({
+            f"w{i}": {"runs": {"nodes": [{"runNumber": number, "createdAt": "2025-01-01T00:00:00Z"}],
+                               "pageInfo": {"hasNextPage": False}}}
+            for i, number in enumerate(numbers)
+        })
+
+    mock_session = MagicMock()
+    mock_session.get.side_effect = listings
+    mock_session.post.side_effect = [runs_response(1, 2), runs_response(3), runs_response(4)]
+
+    # Scrape the first workflow from each listing, leaving the second workflow's first page unused
+    client = GraphQLGitHubClient(GITHUB_TOKEN="token", session=mock_session)
+    pages = []
+    for _ in listings:
+        workflows = client.list_repository_workflows("repo")
+        pages.append(list(client.iter_workflow_run_pages("repo", workflows[0])))
+
+    # Assert each prefetched page was used once and the unused page was dropped
+    assert [[[run["run_number"] for run in page] for page in wf_pages] for wf_pages in pages] == [[[1]], [[3]]]
+    assert client.prefetched == {}
+
+    # Assert the second workflow is then requested afresh
+    assert [run["run_number"] for run in next(client.iter_workflow_run_pages("repo", deploy))] == [4]
+    assert mock_session.post.call_count == 3
+
+
+def test_graphql_raises_on_query_errors():
+    """
+    Test that GraphQL errors returned with a 200 status are raised as HTTP errors.
+    """
+    # Define a response carrying GraphQL errors
+    error_response = MagicMock(status_code=200, headers={})
+    error_response.json.return_value = {"errors": [{"message": "Bad query"}]}
+    mock_session = MagicMock()
+    mock_session.post.return_value = error_response
+
+    # Assert the error is raised
+    client = GraphQLGitHubClient(GITHUB_TOKEN="token", session=mock_session)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.graphql(query="query { viewer { login } }", variables={})
@@ -1,8 +1,30 @@
 # Import dependencies
 from backend.functions.orchestration.workflow_scrapper import WorkflowScrapper
+from azure.core.exceptions import ResourceNotFoundError
+from backend.functions.data import NotModified
 from unittest.mock import patch, MagicMock
+from shared import WorkflowRun
+import requests
+import pytest
+import time
 import json
 
+def stored_blobs(blobs: dict) -> MagicMock:
+    """
+    Build a `read_blob_to_dict` mock serving stored blobs by name.
+
+    Args: blobs (dict): Blob content keyed by blob name. Missing blobs raise ResourceNotFoundError.
+
+    Returns: MagicMock: The mocked method.
+    """
+    def read_blob_to_dict(container, input_filename):
+        if input_filename not in blobs:
+            raise ResourceNotFoundError(input_filename)
+        return blobs[input_filename]
+
+    return MagicMock(side_effect=read_blob_to_dict)
+
+
 @patch("backend.functions.orchestration.workflow_scrapper.configure_logging")
 @patch("backend.functions.orchestration.workflow_scrapper.Variables")
 def test_init_creates_expected_attributes(mock_vars, mock_logger):
@@ -47,9 +69,9 @@ def test_run_processes_all_repositories(mock_vars, mock_logger, mock_github):
     Test that the `run` method processes all repositories and workflows successfully.
 
     Verifies that:
-    - GitHubClient is initialized for each repository with the correct token.
+    - A single GitHubClient is initialized with the correct token and shared across repositories.
     - All expected logging calls are made.
-    - export_dict_to_blob is invoked once per workflow.
+    - export_dict_to_blob is invoked once per workflow, plus once for the latest run manifest.
     """
 
     # Create fake logger and environment variable objects
@@ -67,9 +89,9 @@ def test_run_processes_all_repositories(mock_vars, mock_logger, mock_github):
         {"name": "deploy"}
     ]
 
-    mock_client_instance.collect_workflow_metadata.side_effect = [
-        [{"run_started_at": "2025-01-01T12:00:00Z", "conclusion": "success"}],
-        [{"run_started_at": "2025-01-02T13:00:00Z", "conclusion": "failure"}]
+    mock_client_instance.iter_workflow_run_pages.side_effect = [
+        iter([[{"run_started_at": "2025-01-01T12:00:00Z", "conclusion": "success"}]]),
+        iter([[{"run_started_at": "2025-01-02T13:00:00Z", "conclusion": "failure"}]])
     ]
 
     mock_client_instance.aggregate_workflow_data.side_effect = [
@@ -79,7 +101,8 @@ def test_run_processes_all_repositories(mock_vars, mock_logger, mock_github):
 
     # Create an instance of WorkflowScrapper with fake repos
     scrapper = WorkflowScrapper(REPOS=["repo1"])
-    scrapper.export_dict_to_blob = MagicMock()
+    scrapper.read_blob_to_dict = stored_blobs({})
+    scrapper.export_dict_to_blob = MagicMock(return_value={"etag": '"0x1"', "last_modified": None})
 
     # Execute the workflow run
     scrapper.run()
@@ -89,10 +112,11 @@ def test_run_processes_all_repositories(mock_vars, mock_logger, mock_github):
     mock_logger_instance.info.assert_any_call("1/1 - Collecting workflow data for repo: repo1... \n")
 
     # Verify GitHubClient instantiated once with token
-    mock_github.assert_called_once_with(GITHUB_TOKEN="fake-token")
+    mock_github.assert_called_once_with(GITHUB_TOKEN="fake-token", owner="powellrhys", pool_maxsize=10,
+                                        etag_cache=None)
 
-    # Verify each workflow’s data export was performed
-    assert scrapper.export_dict_to_blob.call_count == 2
+    # Verify each workflow’s data export and the manifest export were performed
+    assert scrapper.export_dict_to_blob.call_count == 3
     scrapper.export_dict_to_blob.assert_any_call(
         data=[{"name": "build", "duration": 120}],
         container="project-monitoring",
@@ -104,6 +128,20 @@ def test_run_processes_all_repositories(mock_vars, mock_logger, mock_github):
         output_filename="workflows/repo1_deploy.json"
     )
 
+    # Verify the manifest records the latest run and blob properties of each workflow
+    manifest = scrapper.export_dict_to_blob.call_args_list[-1].kwargs
+    assert manifest["output_filename"] == "manifests/latest_runs.json"
+    assert manifest["data"]["workflows/repo1_build.json"] == {
+        "repo": "repo1",
+        "workflow_name": "build",
+        "active_status": None,
+        "latest_run": {"name": "build", "duration": 120},
+        "run_count": 1,
+        "last_modified": None,
+        "etag": '"0x1"'
+    }
+    assert set(manifest["data"]) == {"workflows/repo1_build.json", "workflows/repo1_deploy.json"}
+
 @patch("backend.functions.orchestration.workflow_scrapper.GitHubClient")
 @patch("backend.functions.orchestration.workflow_scrapper.configure_logging")
 @patch("backend.functions.orchestration.workflow_scrapper.Variables")
@@ -123,7 +161,7 @@ def test_run_handles_json_decode_error(mock_vars, mock_logger, mock_github):
 
     mock_client_instance = MagicMock()
     mock_client_instance.list_repository_workflows.return_value = [{"name": "deploy"}]
-    mock_client_instance.collect_workflow_metadata.return_value = [{"run_started_at": "x", "conclusion": "y"}]
+    mock_client_instance.iter_workflow_run_pages.return_value = iter([[{"run_started_at": "x", "conclusion": "y"}]])
     mock_client_instance.aggregate_workflow_data.side_effect = json.JSONDecodeError("Bad JSON", "data", 0)
     mock_github.return_value = mock_client_instance
 
@@ -140,3 +178,482 @@ def test_run_handles_json_decode_error(mock_vars, mock_logger, mock_github):
 
     # Confirm export was never called after error
     scrapper.export_dict_to_blob.assert_not_called()
+
+
+@patch("backend.functions.orchestration.workflow_scrapper.GitHubClient")
+@patch("backend.functions.orchestration.workflow_scrapper.configure_logging")
+@patch("backend.functions.orchestration.workflow_scrapper.Variables")
+def test_run_concurrent_matches_sequential_output(mock_vars, mock_logger, mock_github):
+    """
+    Test that running with multiple workers exports the same blobs as the sequential path.
+
+    Verifies that:
+    - Every repository and workflow is processed when max_workers > 1.
+    - export_dict_to_blob receives identical data and filenames in both modes.
+    """
+
+    # Configure fake logger, variables, and GitHub client mocks
+    mock_logger.return_value = MagicMock()
+    mock_vars.return_value.GITHUB_TOKEN = "token"
+
+    mock_client_instance = MagicMock()
+    mock_client_instance.list_repository_workflows.side_effect = \
+        lambda repo: [{"name": f"{repo}-build"}, {"name": f"{repo}-deploy"}]
+    mock_client_instance.iter_workflow_run_pages.side_effect = \
+        lambda **kwargs: iter([[{"run_started_at": "2025-01-01T12:00:00Z", "conclusion": "success"}]])
+    mock_client_instance.aggregate_workflow_data.side_effect = \
+        lambda repo, wf_name, workflow_runs, state: [{"repo": repo, "workflow_name": wf_name}]
+    mock_github.return_value = mock_client_instance
+
+    # Collect exported blobs for sequential and concurrent runs
+    exports = {}
+    for max_workers in [1, 4]:
+        scrapper = WorkflowScrapper(REPOS=["repo1", "repo2", "repo3"], max_workers=max_workers)
+        scrapper.read_blob_to_dict = stored_blobs({})
+        scrapper.export_dict_to_blob = MagicMock(return_value={"etag": '"0x1"', "last_modified": None})
+        scrapper.run()
+        exports[max_workers] = sorted(
+            (call.kwargs["output_filename"], json.dumps(call.kwargs["data"], sort_keys=True))
+            for call in scrapper.export_dict_to_blob.call_args_list
+        )
+
+    # Confirm every workflow and the manifest were exported and outputs match
+    assert len(exports[1]) == 7
+    assert exports[1] == exports[4]
+
+
+@patch("backend.functions.orchestration.workflow_scrapper.GitHubClient")
+@patch("backend.functions.orchestration.workflow_scrapper.configure_logging")
+@patch("backend.functions.orchestration.workflow_scrapper.Variables")
+def test_run_incremental_merges_new_runs_into_history(mock_vars, mock_logger, mock_github):
+    """
+    Test that incremental mode requests runs from the stored high-water mark, stops at
+    known runs and merges the new runs into the existing history.
+
+    Verifies that:
+    - Runs are requested with the newest stored `created_at`.
+    - The high-water mark run is refreshed and older runs are not duplicated.
+    - The merged history is exported newest first.
+    """
+
+    # Configure fake logger and variables
+    mock_logger.return_value = MagicMock()
+    mock_vars.return_value.GITHUB_TOKEN = "token"
+
+    # Simulate a page holding one new run, the refreshed high-water mark run and an older known run
+    mock_client_instance = MagicMock()
+    mock_client_instance.list_repository_workflows.return_value = [{"name": "build", "state": "active"}]
+    mock_client_instance.iter_workflow_run_pages.return_value = iter([[
+        {"run_number": 3, "run_started_at": "2025-01-03T00:00:00Z", "conclusion": "success"},
+        {"run_number": 2, "run_started_at": "2025-01-02T00:00:00Z", "conclusion": "failure"},
+        {"run_number": 1, "run_started_at": "2025-01-01T00:00:00Z", "conclusion": "success"},
+    ]])
+    mock_client_instance.aggregate_workflow_data.side_effect = \
+        lambda repo, wf_name, workflow_runs, state: [
+            WorkflowRun(repo=repo, workflow_name=wf_name, run_number=run["run_number"], conclusion=run["conclusion"])
+            for run in workflow_runs
+        ]
+    mock_github.return_value = mock_client_instance
+
+    # Simulate stored history where run 2 was still in progress
+    scrapper = WorkflowScrapper(REPOS=["repo1"], incremental=True)
+    scrapper.read_blob_to_dict = stored_blobs({})
+    scrapper.read_blob_to_runs = MagicMock(return_value=[
+        WorkflowRun(repo="repo1", workflow_name="build", run_number=2, conclusion=None,
+                    created_at="2025-01-02T00:00:00Z"),
+        WorkflowRun(repo="repo1", workflow_name="build", run_number=1, conclusion="success",
+                    created_at="2025-01-01T00:00:00Z"),
+    ])
+    scrapper.export_dict_to_blob = MagicMock()
+
+    # Execute the workflow run
+    scrapper.run()
+
+    # Verify runs were requested from the high-water mark
+    assert mock_client_instance.iter_workflow_run_pages.call_args.kwargs["created_since"] == "2025-01-02T00:00:00Z"
+
+    # Verify the merged history is exported without duplicates
+    scrapper.export_dict_to_blob.assert_any_call(
+        data=[
+            WorkflowRun(repo="repo1", workflow_name="build", run_number=3, conclusion="success"),
+            WorkflowRun(repo="repo1", workflow_name="build", run_number=2, conclusion="failure"),
+            WorkflowRun(repo="repo1", workflow_name="build", run_number=1, conclusion="success",
+                        created_at="2025-01-01T00:00:00Z"),
+        ],
+        container="project-monitoring",
+        output_filename="workflows/repo1_build.json"
+    )
+
+
+@patch("backend.functions.orchestration.workflow_scrapper.GitHubClient")
+@patch("backend.functions.orchestration.workflow_scrapper.configure_logging")
+@patch("backend.functions.orchestration.workflow_scrapper.Variables")
+def test_run_incremental_refreshes_incomplete_runs_below_high_water_mark(mock_vars, mock_logger, mock_github):
+    """
+    Test that incremental mode requests runs from the earliest stored run that was still in
+    progress, updates it in place once completed and counts it in the workflow rollup.
+    """
+
+    # Configure fake logger and variables
+    mock_logger.return_value = MagicMock()
+    mock_vars.return_value.GITHUB_TOKEN = "token"
+
+    # Simulate a page holding a new run, the high-water mark run, the now completed run 2 and a known run
+    mock_client_instance = MagicMock()
+    mock_client_instance.list_repository_workflows.return_value = [{"name": "build", "state": "active"}]
+    mock_client_instance.iter_workflow_run_pages.return_value = iter([[
+        {"run_number": 4, "created_at": "2025-01-04T00:00:00Z", "run_started_at": "2025-01-04T00:00:00Z",
+         "status": "completed", "conclusion": "success"},
+        {"run_number": 3, "created_at": "2025-01-03T00:00:00Z", "run_started_at": "2025-01-03T00:00:00Z",
+         "status": "completed", "conclusion": "success"},
+        {"run_number": 2, "created_at": "2025-01-02T00:00:00Z", "run_started_at": "2025-01-02T00:00:00Z",
+         "status": "completed", "conclusion": "success"},
+        {"run_number": 1, "created_at": "2025-01-01T00:00:00Z", "run_started_at": "2025-01-01T00:00:00Z",
+         "status": "completed", "conclusion": "success"},
+    ]])
+    mock_client_instance.aggregate_workflow_data.side_effect = \
+        lambda repo, wf_name, workflow_runs, state: [
+            WorkflowRun(repo=repo, workflow_name=wf_name, run_number=run["run_number"], status=run["status"],
+                        conclusion="success", created_at=run["created_at"], duration_seconds=60.0)
+            for run in workflow_runs
+        ]
+    mock_github.return_value = mock_client_instance
+
+    # Simulate stored history and rollup where run 2 was still in progress below the high-water mark
+    stored_runs = [
+        WorkflowRun(repo="repo1", workflow_name="build", run_number=run_number, status=status,
+                    conclusion="success" if status == "completed" else None,
+                    created_at=f"2025-01-0{run_number}T00:00:00Z", duration_seconds=60.0)
+        for run_number, status in ((3, "completed"), (2, "in_progress"), (1, "completed"))
+    ]
+    blobs = {}
+    scrapper = WorkflowScrapper(REPOS=["repo1"], incremental=True, rollups=True)
+    scrapper.read_blob_to_dict = stored_blobs(blobs)
+    scrapper.read_blob_to_runs = MagicMock(return_value=stored_runs)
+    scrapper.list_blob_filenames = MagicMock(side_effect=lambda container_name, directory_path:
+                                             [name for name in blobs if name.startswith(directory_path)])
+    scrapper.export_dict_to_blob = MagicMock(side_effect=lambda data, container, output_filename:
+                                             blobs.__setitem__(output_filename, data))
+    scrapper.rollup_store.update_workflow_rollup(repo="repo1", workflow="build", runs=stored_runs)
+    assert blobs["rollups/workflows/repo1/build.json"]["pending"] == [2]
+
+    # Execute the workflow run
+    scrapper.run()
+
+    # Verify runs were requested from the incomplete run, and run 2 was updated in place
+    assert mock_client_instance.iter_workflow_run_pages.call_args.kwargs["created_since"] == "2025-01-02T00:00:00Z"
+    assert [(run.run_number, run.status) for run in blobs["workflows/repo1_build.json"]] == [
+        (4, "completed"), (3, "completed"), (2, "completed"), (1, "completed")
+    ]
+    assert blobs["workflows/repo1_build.json"][3] is stored_runs[2]
+
+    # Verify the completed run left the pending runs of the rollup and was counted
+    rollup = blobs["rollups/workflows/repo1/build.json"]
+    assert rollup["pending"] == []
+    assert rollup["weekly"]["2024-12-30"]["runs"] == 4
+
+
+@patch("backend.functions.orchestration.workflow_scrapper.GitHubClient")
+@patch("backend.functions.orchestration.workflow_scrapper.configure_logging")
+@patch("backend.functions.orchestration.workflow_scrapper.Variables")
+def test_run_skips_not_modified_workflows_and_persists_etag_cache(mock_vars, mock_logger, mock_github):
+    """
+    Test that a 304 Not Modified response skips the aggregate and upload path for a
+    workflow, and that the validator cache is loaded and persisted around the scrape.
+    """
+
+    # Configure fake logger and variables
+    mock_logger.return_value = MagicMock()
+    mock_vars.return_value.GITHUB_TOKEN = "token"
+
+    # Simulate a workflow whose runs are unchanged
+    mock_client_instance = MagicMock()
+    mock_client_instance.list_repository_workflows.return_value = [{"name": "build"}]
+    mock_client_instance.iter_workflow_run_pages.side_effect = NotModified("url")
+    mock_github.return_value = mock_client_instance
+
+    # Simulate a stored validator cache and a manifest already recording the workflow
+    scrapper = WorkflowScrapper(REPOS=["repo1"], use_etag_cache=True)
+    scrapper.read_blob_to_dict = stored_blobs({
+        "cache/etags.json": {"key": {"etag": "abc"}},
+        "manifests/latest_runs.json": {"workflows/repo1_build.json": {"run_count": 1}}
+    })
+    scrapper.export_dict_to_blob = MagicMock()
+
+    # Execute the workflow run
+    scrapper.run()
+
+    # Verify the cached validators were handed to the client
+    assert mock_github.call_args.kwargs["etag_cache"] == {"key": {"etag": "abc"}}
+
+    # Verify nothing was aggregated and only the validator cache was exported
+    mock_client_instance.aggregate_workflow_data.assert_not_called()
+    scrapper.export_dict_to_blob.assert_called_once_with(
+        data={"key": {"etag": "abc"}},
+        container="project-monitoring",
+        output_filename="cache/etags.json"
+    )
+
+
+@patch("backend.functions.orchestration.workflow_scrapper.GitHubClient")
+@patch("backend.functions.orchestration.workflow_scrapper.configure_logging")
+@patch("backend.functions.orchestration.workflow_scrapper.Variables")
+def test_run_discovers_repositories_when_none_configured(mock_vars, mock_logger, mock_github):
+    """
+    Test that repositories are discovered with the configured filters when no REPOS are given,
+    and that every discovered repository is processed.
+    """
+
+    # Configure fake logger, variables and discovered repositories
+    mock_logger_instance = MagicMock()
+    mock_logger.return_value = mock_logger_instance
+    mock_vars.return_value.GITHUB_TOKEN = "token"
+
+    mock_client_instance = MagicMock()
+    mock_client_instance.discover_repositories.return_value = ["repo-a", "repo-b"]
+    mock_client_instance.list_repository_workflows.return_value = []
+    mock_github.return_value = mock_client_instance
+
+    # Execute the workflow run with discovery filters
+    scrapper = WorkflowScrapper(owner="someone", discovery={"include": ["repo-*"]})
+    scrapper.run()
+
+    # Verify discovery used the owner and filters
+    assert mock_github.call_args.kwargs["owner"] == "someone"
+    mock_client_instance.discover_repositories.assert_called_once_with(max_workers=1, include=["repo-*"])
+
+    # Verify every discovered repository was processed
+    mock_logger_instance.info.assert_any_call("2/2 - Collecting workflow data for repo: repo-b... \n")
+    assert mock_client_instance.list_repository_workflows.call_count == 2
+
+
+@patch("backend.functions.orchestration.workflow_scrapper.GitHubClient")
+@patch("backend.functions.orchestration.workflow_scrapper.configure_logging")
+@patch("backend.functions.orchestration.workflow_scrapper.Variables")
+def test_run_backfills_manifest_for_unchanged_workflows(mock_vars, mock_logger, mock_github):
+    """
+    Test that a workflow skipped as unchanged, but missing from the manifest, is recorded
+    from its stored run history, while other manifest entries are preserved.
+    """
+
+    # Configure fake logger, variables and an unchanged workflow
+    mock_logger.return_value = MagicMock()
+    mock_vars.return_value.GITHUB_TOKEN = "token"
+
+    mock_client_instance = MagicMock()
+    mock_client_instance.list_repository_workflows.return_value = [{"name": "build", "state": "active"}]
+    mock_client_instance.iter_workflow_run_pages.side_effect = NotModified("url")
+    mock_github.return_value = mock_client_instance
+
+    # Simulate a manifest recording another workflow, and the stored history of the unchanged one
+    scrapper = WorkflowScrapper(REPOS=["repo1"], use_etag_cache=True)
+    scrapper.read_blob_to_dict = stored_blobs({
+        "manifests/latest_runs.json": {"workflows/repo2_test.json": {"run_count": 4}},
+        "workflows/repo1_build.json": [{"run_number": 2}, {"run_number": 1}]
+    })
+    scrapper.export_dict_to_blob = MagicMock()
+
+    # Execute the workflow run
+    scrapper.run()
+
+    # Verify the manifest was exported with the backfilled and the preserved entry
+    scrapper.export_dict_to_blob.assert_any_call(
+        data={
+            "workflows/repo2_test.json": {"run_count": 4},
+            "workflows/repo1_build.json": {
+                "repo": "repo1",
+                "workflow_name": "build",
+                "active_status": "active",
+                "latest_run": {"run_number": 2},
+                "run_count": 2,
+                "last_modified": None,
+                "etag": None
+            }
+        },
+        container="project-monitoring",
+        output_filename="manifests/latest_runs.json"
+    )
+
+
+@patch("backend.functions.orchestration.workflow_scrapper.GitHubClient")
+@patch("backend.functions.orchestration.workflow_scrapper.configure_logging")
+@patch("backend.functions.orchestration.workflow_scrapper.Variables")
+def test_run_exports_columnar_copy(mock_vars, mock_logger, mock_github):
+    """
+    Test that columnar mode also exports every run history as Parquet.
+    """
+
+    # Configure fake logger, variables and a workflow with one run
+    mock_logger.return_value = MagicMock()
+    mock_vars.return_value.GITHUB_TOKEN = "token"
+
+    mock_client_instance = MagicMock()
+    mock_client_instance.list_repository_workflows.return_value = [{"name": "build"}]
+    mock_client_instance.iter_workflow_run_pages.return_value = iter([[{"run_started_at": "x", "conclusion": "y"}]])
+    mock_client_instance.aggregate_workflow_data.return_value = [WorkflowRun(repo="repo1", workflow_name="build")]
+    mock_github.return_value = mock_client_instance
+
+    scrapper = WorkflowScrapper(REPOS=["repo1"], columnar=True)
+    scrapper.read_blob_to_dict = stored_blobs({})
+    scrapper.export_dict_to_blob = MagicMock()
+    scrapper.export_runs_to_parquet = MagicMock()
+
+    # Execute the workflow run
+    scrapper.run()
+
+    # Verify the columnar copy was exported next to the JSON history
+    scrapper.export_runs_to_parquet.assert_called_once_with(
+        runs=[WorkflowRun(repo="repo1", workflow_name="build")],
+        container="project-monitoring",
+        output_filename="columnar/repo1_build.parquet"
+    )
+
+
+@patch("backend.functions.orchestration.workflow_scrapper.GitHubClient")
+@patch("backend.functions.orchestration.workflow_scrapper.configure_logging")
+@patch("backend.functions.orchestration.workflow_scrapper.Variables")
+def test_run_partitioned_rewrites_only_current_partition(mock_vars, mock_logger, mock_github):
+    """
+    Test that partitioned mode reads the high-water mark from the newest partition, only
+    rewrites the partition holding new runs and carries the manifest run count forward.
+    """
+
+    # Configure fake logger, variables and a page holding a new run and the high-water mark run
+    mock_logger.return_value = MagicMock()
+    mock_vars.return_value.GITHUB_TOKEN = "token"
+
+    mock_client_instance = MagicMock()
+    mock_client_instance.list_repository_workflows.return_value = [{"name": "build", "state": "active"}]
+    mock_client_instance.iter_workflow_run_pages.return_value = iter([[
+        {"run_number": 3, "run_started_at": "2025-02-02T00:00:00Z", "conclusion": "success"},
+        {"run_number": 2, "run_started_at": "2025-02-01T00:00:00Z", "conclusion": "success"},
+    ]])
+    mock_client_instance.aggregate_workflow_data.side_effect = \
+        lambda repo, wf_name, workflow_runs, state: [
+            WorkflowRun(repo=repo, workflow_name=wf_name, run_number=run["run_number"],
+                        created_at=run["run_started_at"], conclusion=run["conclusion"])
+            for run in workflow_runs
+        ]
+    mock_github.return_value = mock_client_instance
+
+    # Simulate two stored partitions and a manifest entry
+    run_2 = {"repo": "repo1", "workflow_name": "build", "run_number": 2, "conclusion": "success",
+             "created_at": "2025-02-01T00:00:00Z"}
+    run_1 = {"repo": "repo1", "workflow_name": "build", "run_number": 1, "conclusion": "success",
+             "created_at": "2025-01-01T00:00:00Z"}
+    blobs = {
+        "runs/repo1/build/2025-01.json": [run_1],
+        "runs/repo1/build/2025-02.json": [run_2],
+        "manifests/latest_runs.json": {"workflows/repo1_build.json": {"run_count": 2}},
+    }
+    scrapper = WorkflowScrapper(REPOS=["repo1"], incremental=True, partition_format="json")
+    scrapper.read_blob_to_dict = stored_blobs(blobs)
+    scrapper.list_blob_filenames = MagicMock(side_effect=lambda container_name, directory_path: [
+        name for name in blobs if name.startswith(directory_path)
+    ])
+    scrapper.export_dict_to_blob = MagicMock()
+
+    # Execute the workflow run
+    scrapper.run()
+
+    # Verify runs were requested from the newest stored run
+    assert mock_client_instance.iter_workflow_run_pages.call_args.kwargs["created_since"] == "2025-02-01T00:00:00Z"
+
+    # Verify only the current partition and the manifest were uploaded
+    uploaded = [call.kwargs["output_filename"] for call in scrapper.export_dict_to_blob.call_args_list]
+    assert uploaded == ["runs/repo1/build/2025-02.json", "manifests/latest_runs.json"]
+    assert [run["run_number"] for run in scrapper.export_dict_to_blob.call_args_list[0].kwargs["data"]] == [3, 2]
+
+    # Verify the manifest counts the complete history
+    assert scrapper.manifest["workflows/repo1_build.json"]["run_count"] == 3
+
+
+@patch("backend.functions.orchestration.workflow_scrapper.GitHubClient")
+@patch("backend.functions.orchestration.workflow_scrapper.configure_logging")
+@patch("backend.functions.orchestration.workflow_scrapper.Variables")
+def test_run_updates_workflow_and_repository_rollups(mock_vars, mock_logger, mock_github):
+    """
+    Test that rollup mode counts the runs of every workflow in its rollup, and rebuilds the
+    rollup of each repository once it is scraped, even if a later repository aborts the scrape.
+    """
+
+    # Configure fake logger, variables and one run per workflow
+    mock_logger.return_value = MagicMock()
+    mock_vars.return_value.GITHUB_TOKEN = "token"
+
+    mock_client_instance = MagicMock()
+
+    def list_repository_workflows(repo):
+        if repo == "repo2":
+            raise RuntimeError("Unexpected error")
+        return [{"name": "build"}, {"name": "deploy"}]
+
+    mock_client_instance.list_repository_workflows.side_effect = list_repository_workflows
+    mock_client_instance.iter_workflow_run_pages.side_effect = lambda **kwargs: iter([[
+        {"run_number": 1, "run_started_at": "2025-01-06T00:00:00Z", "conclusion": "success"},
+    ]])
+    mock_client_instance.aggregate_workflow_data.side_effect = \
+        lambda repo, wf_name, workflow_runs, state: [
+            WorkflowRun(repo=repo, workflow_name=wf_name, run_number=run["run_number"], status="completed",
+                        created_at=run["run_started_at"], conclusion=run["conclusion"], duration_seconds=60.0)
+            for run in workflow_runs
+        ]
+    mock_github.return_value = mock_client_instance
+
+    blobs = {}
+    scrapper = WorkflowScrapper(REPOS=["repo1", "repo2"], rollups=True)
+    scrapper.read_blob_to_dict = stored_blobs(blobs)
+    scrapper.list_blob_filenames = MagicMock(side_effect=lambda container_name, directory_path:
+                                             [name for name in blobs if name.startswith(directory_path)])
+    scrapper.export_dict_to_blob = MagicMock(side_effect=lambda data, container, output_filename:
+                                             blobs.__setitem__(output_filename, data))
+
+    # Execute the workflow run, aborted by the second repository
+    with pytest.raises(RuntimeError):
+        scrapper.run()
+
+    # Verify workflow rollups and the repository rollup were written
+    assert blobs["rollups/workflows/repo1/build.json"]["daily"]["2025-01-06"]["runs"] == 1
+    assert blobs["rollups/workflows/repo1/deploy.json"]["last_run_number"] == 1
+    assert blobs["rollups/repos/repo1.json"]["weekly"]["2025-01-06"]["runs"] == 2
+    assert blobs["rollups/repos/repo1.json"]["weekly"]["2025-01-06"]["success_rate"] == 1.0
+
+
+@patch("backend.functions.orchestration.workflow_scrapper.GitHubClient")
+@patch("backend.functions.orchestration.workflow_scrapper.configure_logging")
+@patch("backend.functions.orchestration.workflow_scrapper.Variables")
+def test_run_concurrent_failure_cancels_queued_workflows(mock_vars, mock_logger, mock_github):
+    """
+    Test that a failed workflow cancels the workflows still queued behind it without
+    aborting the scrape, so the manifest is still published.
+    """
+
+    # Configure fake logger, variables and six workflows, the first of which fails
+    mock_logger.return_value = MagicMock()
+    mock_vars.return_value.GITHUB_TOKEN = "token"
+
+    def iter_workflow_run_pages(workflow, **kwargs):
+        if workflow["name"] == "wf1":
+            raise requests.exceptions.ConnectionError("connection reset")
+        time.sleep(0.2)
+        return iter([[{"run_started_at": "2025-01-01T12:00:00Z", "conclusion": "success"}]])
+
+    mock_client_instance = MagicMock()
+    mock_client_instance.list_repository_workflows.return_value = [{"name": f"wf{i}"} for i in range(1, 7)]
+    mock_client_instance.iter_workflow_run_pages.side_effect = iter_workflow_run_pages
+    mock_client_instance.aggregate_workflow_data.side_effect = \
+        lambda repo, wf_name, workflow_runs, state: [{"repo": repo, "workflow_name": wf_name}]
+    mock_github.return_value = mock_client_instance
+
+    scrapper = WorkflowScrapper(REPOS=["repo1"], max_workers=2)
+    scrapper.read_blob_to_dict = stored_blobs({})
+    scrapper.export_dict_to_blob = MagicMock(return_value={"etag": '"0x1"', "last_modified": None})
+
+    # Execute the workflow run
+    scrapper.run()
+
+    # Verify queued workflows were skipped and the manifest was still published
+    uploaded = [call.kwargs["output_filename"] for call in scrapper.export_dict_to_blob.call_args_list]
+    assert uploaded[-1] == "manifests/latest_runs.json"
+    assert "workflows/repo1_wf1.json" not in uploaded
+    assert len(uploaded) < 6
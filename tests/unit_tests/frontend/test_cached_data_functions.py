@@ -0,0 +1,67 @@
+# Import dependencies
+from frontend.functions.cached_data_functions import (
+    cached_repo_workflow_map,
+    cached_workflow_runs,
+    get_repo_workflow_map,
+    get_workflow_runs
+)
+from unittest.mock import patch
+import pandas as pd
+import pytest
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """
+    Clear cached results so every test starts cold.
+    """
+    cached_repo_workflow_map.clear()
+    cached_workflow_runs.clear()
+    yield
+    cached_repo_workflow_map.clear()
+    cached_workflow_runs.clear()
+
+
+@patch("frontend.functions.cached_data_functions.create_repo_workflow_map")
+@patch("frontend.functions.cached_data_functions.create_blob_client")
+def test_results_are_cached_until_a_blob_etag_changes(mock_create_blob_client, mock_create_map):
+    """
+    Test that cached results are reused while the listed ETags are unchanged, and
+    recomputed as soon as a workflow blob changes.
+    """
+    # Arrange: a listing holding one workflow blob and an unrelated blob
+    listing = [{"name": "workflows/repo1_build.json", "etag": '"v1"'}, {"name": "cache/etags.json", "etag": '"v1"'}]
+    mock_create_blob_client.return_value.list_blob_properties.return_value = listing
+    mock_create_map.return_value = {"repo1": ["build"]}
+
+    # Act & Assert: reruns are served from the cache, including after unrelated writes
+    assert get_repo_workflow_map() == {"repo1": ["build"]}
+    listing[1]["etag"] = '"v2"'
+    assert get_repo_workflow_map() == {"repo1": ["build"]}
+    assert mock_create_map.call_count == 1
+
+    # Act & Assert: a new scrape invalidates the cached result
+    listing[0]["etag"] = '"v2"'
+    get_repo_workflow_map()
+    assert mock_create_map.call_count == 2
+
+
+@patch("frontend.functions.cached_data_functions.load_workflow_runs")
+@patch("frontend.functions.cached_data_functions.create_blob_client")
+def test_workflow_runs_are_keyed_on_their_own_blobs(mock_create_blob_client, mock_load):
+    """
+    Test that a workflow's cached runs only depend on the blobs of that workflow.
+    """
+    # Arrange: partitions of two workflows
+    listing = [{"name": "runs/repo1/build/2025-01.json", "etag": '"v1"'},
+               {"name": "runs/repo1/test/2025-01.json", "etag": '"v1"'}]
+    mock_create_blob_client.return_value.list_blob_properties.return_value = listing
+    mock_load.return_value = pd.DataFrame({"run_number": [1]})
+
+    # Act: read one workflow, then change the other workflow and read again
+    get_workflow_runs(repo="repo1", workflow="build", limit=30)
+    listing[1]["etag"] = '"v2"'
+    result = get_workflow_runs(repo="repo1", workflow="build", limit=30)
+
+    # Assert: the history was loaded once
+    assert result["run_number"].tolist() == [1]
+    mock_load.assert_called_once_with(repo="repo1", workflow="build", limit=30)
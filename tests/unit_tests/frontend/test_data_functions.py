@@ -4,13 +4,18 @@ from frontend.functions.data_functions import (
     transform_workflow_overview_df,
     collect_latest_workflow_runs,
     collect_project_workflows,
-    create_repo_workflow_map
+    create_repo_workflow_map,
+    create_workflow_index,
+    load_rollup_trend,
+    load_workflow_runs
 )
+from azure.core.exceptions import ResourceNotFoundError
 from unittest.mock import patch, MagicMock
 import pandas as pd
 
+@patch("frontend.functions.data_functions.CachedBlobClient", side_effect=lambda client: client)
 @patch("frontend.functions.data_functions.BlobClient")
-def test_collect_project_workflows(mock_blob_client):
+def test_collect_project_workflows(mock_blob_client, mock_cached_blob_client):
     """
     Test that `collect_project_workflows` correctly retrieves workflow filenames
     from blob storage and extracts only the JSON filenames (without directory paths).
@@ -39,38 +44,43 @@ def test_collect_project_workflows(mock_blob_client):
     mock_blob_client.assert_called_once_with(source="frontend")
 
     # Verify list_blob_filenames called with correct parameters
-    mock_instance.list_blob_filenames.assert_called_once_with(
+    mock_instance.list_blob_filenames.assert_any_call(
         container_name="project-monitoring",
         directory_path="workflows"
     )
 
 
-@patch("frontend.functions.data_functions.collect_project_workflows")
-def test_create_repo_workflow_map(mock_collect):
+@patch("frontend.functions.data_functions.create_blob_client")
+def test_create_repo_workflow_map(mock_create_blob_client):
     """
     Test that `create_repo_workflow_map` correctly groups workflow files
     by their repository names and extracts workflow names.
 
     Steps:
-    - Mock the output of `collect_project_workflows` to return sample JSON filenames.
+    - Mock the blob listing to return sample workflow blob names, without a manifest.
     - Call the function and confirm it returns a dictionary mapping repos to workflows.
     - Assert correctness of grouping and order.
     """
-    # Arrange: simulate collected workflow filenames
-    mock_collect.return_value = [
-        "repo1_build.json",
-        "repo1_test.json",
-        "repo2_deploy.json",
-        "repo3_cleanup.json",
-        "repo3_report.json",
-    ]
+    # Arrange: simulate stored workflow blobs, one repository holding a prefix of another's name
+    mock_instance = mock_create_blob_client.return_value
+    mock_instance.read_blob_to_dict.side_effect = ResourceNotFoundError("missing")
+    mock_instance.list_blob_filenames.side_effect = lambda container_name, directory_path: {
+        "workflows": [
+            "workflows/repo1_test.json",
+            "workflows/repo1_build.json",
+            "workflows/repo2_deploy.json",
+            "workflows/repo3_cleanup.json",
+            "workflows/repo3_report.json",
+        ],
+        "runs/": ["runs/repo1/lint/2025-01.json", "runs/repo1/ci%2Fcd/2025-01.json"],
+    }[directory_path]
 
     # Act: execute function
     result = create_repo_workflow_map()
 
-    # Expected mapping of repos → list of workflows
+    # Expected mapping of repos → list of workflows, with encoded partitioned names decoded
     expected = {
-        "repo1": ["build", "test"],
+        "repo1": ["build", "ci/cd", "lint", "test"],
         "repo2": ["deploy"],
         "repo3": ["cleanup", "report"],
     }
@@ -78,12 +88,41 @@ def test_create_repo_workflow_map(mock_collect):
     # Assert the resulting mapping is correct
     assert result == expected
 
-    # Ensure the mocked helper function was called once
-    mock_collect.assert_called_once()
 
+@patch("frontend.functions.data_functions.create_blob_client")
+def test_create_workflow_index_uses_manifest_names(mock_create_blob_client):
+    """
+    Test that repositories and workflows containing underscores are attributed from the
+    manifest, and that blobs of known repositories split at the repository name.
+    """
+    # Arrange: a manifest entry for one workflow of a repository with underscores
+    mock_instance = mock_create_blob_client.return_value
+    mock_instance.read_blob_to_dict.return_value = {
+        "workflows/fantasy_premier_league_build_and_deploy.json": {
+            "repo": "fantasy_premier_league", "workflow_name": "build_and_deploy", "latest_run": {"run_number": 3}
+        }
+    }
+    mock_instance.list_blob_filenames.side_effect = lambda container_name, directory_path: {
+        "workflows": ["workflows/fantasy_premier_league_build_and_deploy.json",
+                      "workflows/fantasy_premier_league_unit_tests.json"],
+        "runs/": [],
+    }[directory_path]
+
+    # Act: build the index
+    index = create_workflow_index()
+
+    # Assert: names are split correctly and the latest run is recorded
+    assert index.to_map() == {"fantasy_premier_league": ["build_and_deploy", "unit_tests"]}
+    assert index.get(repo="fantasy_premier_league", workflow_name="build_and_deploy").latest_run == {"run_number": 3}
+    assert index.get(repo="fantasy_premier_league", workflow_name="unit_tests").blob_name == \
+        "workflows/fantasy_premier_league_unit_tests.json"
+    assert index.search(prefix="fantasy") == ["fantasy_premier_league"]
+    assert index.search(prefix="unit", repo="fantasy_premier_league") == ["unit_tests"]
 
+
+@patch("frontend.functions.data_functions.CachedBlobClient", side_effect=lambda client: client)
 @patch("frontend.functions.data_functions.BlobClient")
-def test_collect_latest_workflow_runs(mock_blob_client):
+def test_collect_latest_workflow_runs(mock_blob_client, mock_cached_blob_client, caplog):
     """
     Test that `collect_latest_workflow_runs` correctly reads the latest workflow
     run data from blob storage and compiles it into a DataFrame.
@@ -94,19 +133,22 @@ def test_collect_latest_workflow_runs(mock_blob_client):
     - Validate that the returned DataFrame has the expected columns and data.
     - Confirm the correct BlobClient usage and function call counts.
     """
-    # Arrange: setup BlobClient mock and expected return data
+    # Arrange: setup BlobClient mock and expected return data, without a manifest
     mock_instance = MagicMock()
+    mock_instance.read_blob_to_dict.side_effect = ResourceNotFoundError("manifest missing")
 
     # Simulate a list of workflow run file names
     mock_instance.list_blob_filenames.return_value = [
         "workflows/repo1_build.json",
         "workflows/repo2_test.json",
+        "workflows/repo3_lint.json",
     ]
 
-    # Simulate each file returning a list of run details
-    mock_instance.read_blob_to_dict.side_effect = [
+    # Simulate each file returning a list of run details, and one unreadable file
+    mock_instance.read_blobs_to_dicts.return_value = [
         [{"name": "repo1_build", "status": "success", "duration": 120}],
         [{"name": "repo2_test", "status": "failed", "duration": 90}],
+        ValueError("corrupt blob"),
     ]
 
     mock_blob_client.return_value = mock_instance
@@ -118,10 +160,12 @@ def test_collect_latest_workflow_runs(mock_blob_client):
     assert isinstance(result, pd.DataFrame)
     assert set(result.columns) == {"name", "status", "duration"}
 
-    # Verify DataFrame content
+    # Verify DataFrame content, and that the unreadable file is reported
     assert len(result) == 2
     assert result.iloc[0]["name"] == "repo1_build"
     assert result.iloc[1]["status"] == "failed"
+    assert result.attrs["skipped_workflows"] == ["workflows/repo3_lint.json"]
+    assert "workflows/repo3_lint.json: ValueError('corrupt blob')" in caplog.text
 
     # Verify BlobClient interaction correctness
     mock_blob_client.assert_any_call(source="frontend")
@@ -129,7 +173,141 @@ def test_collect_latest_workflow_runs(mock_blob_client):
         container_name="project-monitoring",
         directory_path="workflows"
     )
-    assert mock_instance.read_blob_to_dict.call_count == 2
+    mock_instance.read_blobs_to_dicts.assert_called_once_with(
+        container="project-monitoring",
+        input_filenames=["workflows/repo1_build.json", "workflows/repo2_test.json", "workflows/repo3_lint.json"]
+    )
+
+@patch("frontend.functions.data_functions.CachedBlobClient", side_effect=lambda client: client)
+@patch("frontend.functions.data_functions.BlobClient")
+def test_collect_latest_workflow_runs_reads_manifest(mock_blob_client, mock_cached_blob_client):
+    """
+    Test that `collect_latest_workflow_runs` builds the DataFrame from the latest run
+    manifest in a single read, without listing or downloading workflow files.
+    """
+    # Arrange: simulate a manifest with two workflows
+    mock_instance = MagicMock()
+    mock_instance.read_blob_to_dict.return_value = {
+        "workflows/repo1_build.json": {"latest_run": {"repo": "repo1", "status": "completed"}, "run_count": 5},
+        "workflows/repo2_test.json": {"latest_run": {"repo": "repo2", "status": "queued"}, "run_count": 1},
+    }
+    mock_blob_client.return_value = mock_instance
+
+    # Act: execute function under test
+    result = collect_latest_workflow_runs()
+
+    # Assert: one row per manifest entry, read from the manifest blob only
+    assert result.to_dict(orient="records") == [
+        {"repo": "repo1", "status": "completed"},
+        {"repo": "repo2", "status": "queued"},
+    ]
+    mock_instance.read_blob_to_dict.assert_called_once_with(
+        container="project-monitoring", input_filename="manifests/latest_runs.json"
+    )
+    mock_instance.list_blob_filenames.assert_not_called()
+    mock_instance.read_blobs_to_dicts.assert_not_called()
+
+@patch("frontend.functions.data_functions.create_blob_client")
+def test_load_workflow_runs_reads_columnar_copy(mock_create_blob_client):
+    """
+    Test that `load_workflow_runs` reads the columnar copy with column projection.
+    """
+    # Arrange: simulate a columnar copy
+    mock_instance = mock_create_blob_client.return_value
+    mock_instance.read_blob_to_dataframe.return_value = pd.DataFrame({"run_number": [2, 1]})
+
+    # Act: load two columns
+    result = load_workflow_runs(repo="repo1", workflow="build", columns=["run_number", "created_at"])
+
+    # Assert: the columnar blob was read and the JSON history was not
+    assert result["run_number"].tolist() == [2, 1]
+    mock_instance.read_blob_to_dataframe.assert_called_once_with(
+        container="project-monitoring",
+        input_filename="columnar/repo1_build.parquet",
+        columns=["run_number", "created_at"]
+    )
+    mock_instance.read_blobs_to_dicts.assert_not_called()
+
+
+@patch("frontend.functions.data_functions.create_blob_client")
+def test_load_workflow_runs_falls_back_to_json(mock_create_blob_client):
+    """
+    Test that `load_workflow_runs` reads the JSON history and parses its timestamps when
+    no columnar copy exists, and returns None if the history cannot be read.
+    """
+    # Arrange: simulate a missing columnar copy and a JSON history
+    mock_instance = mock_create_blob_client.return_value
+    mock_instance.read_blob_to_dataframe.side_effect = ResourceNotFoundError("missing")
+    mock_instance.read_blobs_to_dicts.return_value = [[{"run_number": 1, "created_at": "2025-01-01T00:00:00Z"}]]
+
+    # Act: load the history
+    result = load_workflow_runs(repo="repo1", workflow="build")
+
+    # Assert: timestamps are parsed from the JSON history
+    assert result["created_at"].iloc[0] == pd.Timestamp("2025-01-01T00:00:00Z")
+    mock_instance.read_blobs_to_dicts.assert_called_once_with(
+        container="project-monitoring", input_filenames=["workflows/repo1_build.json"]
+    )
+
+    # Assert: unreadable histories return None
+    mock_instance.read_blobs_to_dicts.return_value = [ValueError("corrupt")]
+    assert load_workflow_runs(repo="repo1", workflow="build") is None
+
+
+@patch("frontend.functions.data_functions.create_blob_client")
+def test_load_workflow_runs_reads_most_recent_partitions(mock_create_blob_client):
+    """
+    Test that `load_workflow_runs` reads partitioned histories newest first, only
+    fetching the partitions needed for the requested number of runs.
+    """
+    # Arrange: simulate two monthly partitions
+    mock_instance = mock_create_blob_client.return_value
+    mock_instance.list_blob_filenames.return_value = ["runs/repo1/build/2025-01.json", "runs/repo1/build/2025-02.json"]
+    mock_instance.read_blob_to_dict.side_effect = lambda container, input_filename: {
+        "runs/repo1/build/2025-02.json": [{"run_number": 3, "created_at": "2025-02-01T00:00:00Z"},
+                                          {"run_number": 2, "created_at": "2025-02-01T00:00:00Z"}],
+        "runs/repo1/build/2025-01.json": [{"run_number": 1, "created_at": "2025-01-01T00:00:00Z"}],
+    }[input_filename]
+
+    # Act: load the two most recent runs
+    result = load_workflow_runs(repo="repo1", workflow="build", limit=2)
+
+    # Assert: only the newest partition was read and no other format was tried
+    assert result["run_number"].tolist() == [3, 2]
+    assert result["created_at"].iloc[0] == pd.Timestamp("2025-02-01T00:00:00Z")
+    mock_instance.read_blob_to_dict.assert_called_once_with(
+        container="project-monitoring", input_filename="runs/repo1/build/2025-02.json"
+    )
+    mock_instance.read_blob_to_dataframe.assert_not_called()
+
+
+@patch("frontend.functions.data_functions.create_blob_client")
+def test_load_rollup_trend(mock_create_blob_client):
+    """
+    Test that `load_rollup_trend` reads one rollup blob into a DataFrame of periods, and
+    returns None if no rollup has been written.
+    """
+    # Arrange: simulate a weekly workflow rollup
+    mock_instance = mock_create_blob_client.return_value
+    mock_instance.read_blob_to_dict.return_value = {"weekly": {"2025-01-06": {
+        "runs": 4, "conclusions": {"success": 4}, "durations": {"206": 4},
+        "success_rate": 1.0, "failure_rate": 0.0, "p50": 60.0, "p90": 60.0, "p99": 60.0
+    }}}
+
+    # Act: load the weekly trend
+    result = load_rollup_trend(repo="repo1", workflow="build", granularity="weekly")
+
+    # Assert: only the rollup blob was read, without histogram counts
+    mock_instance.read_blob_to_dict.assert_called_once_with(
+        container="project-monitoring", input_filename="rollups/workflows/repo1/build.json"
+    )
+    assert list(result.columns) == ["period", "runs", "success_rate", "failure_rate", "p50", "p90", "p99"]
+    assert result["period"].iloc[0] == pd.Timestamp("2025-01-06T00:00:00Z")
+
+    # Assert: missing rollups load as None
+    mock_instance.read_blob_to_dict.side_effect = ResourceNotFoundError("missing")
+    assert load_rollup_trend(repo="repo1") is None
+
 
 def test_transform_workflow_overview_df():
     """
@@ -204,3 +382,30 @@ def test_transform_workflow_overview_df():
 
     # Ensure sorting order by repo and recency
     assert result.iloc[0]["repo"] <= result.iloc[1]["repo"]
+
+
+def test_transform_workflow_overview_df_handles_missing_values():
+    """
+    Test that `transform_workflow_overview_df` leaves missing durations empty, flags
+    missing states inactive, and parses GitHub and offset timestamps alike.
+    """
+    # Arrange input test data, mixing GitHub `Z` and offset timestamps
+    df_input = pd.DataFrame([
+        {"repo": "repo1", "workflow_name": "build", "updated_at": "2025-01-01T00:00:00Z", "status": "success",
+         "html_url": "url1", "duration_seconds": 61.7, "active_status": " Active "},
+        {"repo": "repo1", "workflow_name": "test", "updated_at": "2025-01-02T00:00:00+00:00", "status": "failure",
+         "html_url": "url2", "duration_seconds": None, "active_status": None},
+    ])
+
+    # Act - execute function
+    result = transform_workflow_overview_df(df_input).set_index("workflow_name")
+
+    # Verify durations and status flags
+    assert result.loc["build", "duration"] == "1m 1s"
+    assert pd.isna(result.loc["test", "duration"])
+    assert result.loc["build", "status_flag"] == "🟢 Active"
+    assert result.loc["test", "status_flag"] == "🔴 Inactive"
+
+    # Verify timestamps are parsed as UTC, oldest run first within the repo
+    assert str(result["updated_at"].dt.tz) == "UTC"
+    assert list(result.index) == ["build", "test"]
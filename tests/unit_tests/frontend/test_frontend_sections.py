@@ -0,0 +1,38 @@
+# Import dependencies
+from pathlib import Path
+import importlib
+import pytest
+import ast
+
+# Directory of the page sections, imported by Streamlit with `frontend` on the path
+SECTIONS_DIRECTORY = Path(__file__).parents[3] / "frontend" / "pages" / "frontend_sections"
+
+# Project packages imported by the sections, and the modules they resolve to
+PROJECT_PACKAGES = {"shared": "shared", "functions": "frontend.functions"}
+
+@pytest.mark.parametrize("section", sorted(path.name for path in SECTIONS_DIRECTORY.glob("workflow_*.py")))
+def test_section_project_imports_resolve(section):
+    """
+    Test that every name a page section imports from the project packages exists, without
+    requiring the optional frontend dependencies.
+    """
+    tree = ast.parse((SECTIONS_DIRECTORY / section).read_text())
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ImportFrom) or node.module.split(".")[0] not in PROJECT_PACKAGES:
+            continue
+
+        package, _, submodule = node.module.partition(".")
+        module = importlib.import_module(".".join(filter(None, [PROJECT_PACKAGES[package], submodule])))
+        for alias in node.names:
+            assert hasattr(module, alias.name), f"{section} imports missing name {node.module}.{alias.name}"
+
+
+@pytest.mark.parametrize("section", sorted(path.stem for path in SECTIONS_DIRECTORY.glob("workflow_*.py")))
+def test_sections_import(section, monkeypatch):
+    """
+    Test that every page section imports as Streamlit imports it.
+    """
+    pytest.importorskip("streamlit_components")
+    monkeypatch.syspath_prepend(str(SECTIONS_DIRECTORY.parents[1]))
+
+    importlib.import_module(f"frontend.pages.frontend_sections.{section}")
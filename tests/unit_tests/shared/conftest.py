@@ -0,0 +1,31 @@
+# Import dependencies
+from azure.core.exceptions import ResourceNotFoundError
+from unittest.mock import MagicMock
+import pytest
+
+@pytest.fixture
+def make_client():
+    """
+    Provide a factory of blob clients storing JSON blobs in memory.
+
+    Returns: Callable[[dict], MagicMock]: Builds a mocked client over blob content keyed by blob name,
+        which uploads update.
+    """
+    def build(blobs: dict) -> MagicMock:
+        def read_blob_to_dict(container, input_filename):
+            if input_filename not in blobs:
+                raise ResourceNotFoundError(input_filename)
+            return blobs[input_filename]
+
+        def export_dict_to_blob(data, container, output_filename):
+            blobs[output_filename] = data
+            return {"etag": f'"{output_filename}"'}
+
+        client = MagicMock()
+        client.list_blob_filenames.side_effect = \
+            lambda container_name, directory_path: [name for name in blobs if name.startswith(directory_path)]
+        client.read_blob_to_dict.side_effect = read_blob_to_dict
+        client.export_dict_to_blob.side_effect = export_dict_to_blob
+        return client
+
+    return build
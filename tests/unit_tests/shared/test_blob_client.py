@@ -1,8 +1,22 @@
 # Import dependencies
 from shared.functions.blob_client import BlobClient
+from shared.models import WorkflowRun
+from azure.core.exceptions import ResourceNotModifiedError
 from unittest.mock import patch, MagicMock
+import hashlib
 import pytest
 import json
+import gzip
+
+@pytest.fixture(autouse=True)
+def reset_service_clients():
+    """
+    Forget shared service clients so every test builds its own mocked client.
+    """
+    BlobClient.service_clients.clear()
+    yield
+    BlobClient.service_clients.clear()
+
 
 @patch("shared.functions.blob_client.Variables")
 @patch("shared.functions.blob_client.BlobServiceClient")
@@ -42,7 +56,8 @@ def test_list_blob_filenames_returns_expected_list(mock_blob_service, mock_vars)
     assert result == ["folder/blob1.json", "folder/blob2.json"]
 
     # Verify: Ensure Azure SDK methods were called correctly.
-    mock_blob_service.from_connection_string.assert_called_once_with("fake-connection")
+    mock_blob_service.from_connection_string.assert_called_once()
+    assert mock_blob_service.from_connection_string.call_args.args == ("fake-connection",)
     mock_blob_client_instance.get_container_client.assert_called_once_with("test-container")
     mock_container_client.list_blobs.assert_called_once_with(name_starts_with="folder/")
 
@@ -66,14 +81,15 @@ def test_export_dict_to_blob_uploads_json(mock_blob_service, mock_vars):
     mock_service_client.get_blob_client.return_value = mock_blob_client
     mock_blob_service.from_connection_string.return_value = mock_service_client
 
-    client = BlobClient(source="backend")
+    client = BlobClient(source="backend", json_codec="json")
     sample_data = [{"key": "value"}]
 
     # Exercise: Execute the function that uploads the data to Azure Blob Storage.
     client.export_dict_to_blob(sample_data, "container1", "output.json")
 
     # Verify: The BlobServiceClient was initialized with the expected connection string.
-    mock_blob_service.from_connection_string.assert_called_once_with("conn-string")
+    mock_blob_service.from_connection_string.assert_called_once()
+    assert mock_blob_service.from_connection_string.call_args.args == ("conn-string",)
 
     # Verify: The correct blob was targeted for upload.
     mock_service_client.get_blob_client.assert_called_once_with(
@@ -81,8 +97,38 @@ def test_export_dict_to_blob_uploads_json(mock_blob_service, mock_vars):
     )
 
     # Verify: The uploaded content matches the serialized JSON string.
-    uploaded_json = json.dumps(sample_data)
-    mock_blob_client.upload_blob.assert_called_once_with(uploaded_json, overwrite=True)
+    uploaded_json = json.dumps(sample_data).encode()
+    mock_blob_client.upload_blob.assert_called_once_with(
+        uploaded_json, overwrite=True,
+        metadata={"content_sha256": hashlib.sha256(uploaded_json).hexdigest()}
+    )
+
+
+@patch("shared.functions.blob_client.Variables")
+@patch("shared.functions.blob_client.BlobServiceClient")
+def test_export_dict_to_blob_serializes_workflow_run_records(mock_blob_service, mock_vars):
+    """
+    Test that `export_dict_to_blob` serializes WorkflowRun records to the same JSON
+    as the equivalent dictionaries.
+    """
+
+    # Setup: Create mocks for configuration and Azure Blob clients.
+    mock_vars.return_value.blob_storage_connection_string = "conn-string"
+    mock_blob_client = MagicMock()
+    mock_blob_service.from_connection_string.return_value.get_blob_client.return_value = mock_blob_client
+
+    client = BlobClient(source="backend", json_codec="json")
+    record = WorkflowRun(repo="repo1", workflow_name="build", status="completed", run_number=1)
+
+    # Exercise: Upload a list of typed records.
+    client.export_dict_to_blob([record], "container1", "output.json")
+
+    # Verify: The uploaded content matches the serialized dictionaries.
+    uploaded_json = json.dumps([record.to_dict()]).encode()
+    mock_blob_client.upload_blob.assert_called_once_with(
+        uploaded_json, overwrite=True,
+        metadata={"content_sha256": hashlib.sha256(uploaded_json).hexdigest()}
+    )
 
 
 @patch("shared.functions.blob_client.Variables")
@@ -121,7 +167,8 @@ def test_read_blob_to_dict_downloads_and_parses_json(mock_blob_service, mock_var
     assert result == fake_data
 
     # Verify: The expected Azure client methods were called.
-    mock_blob_service.from_connection_string.assert_called_once_with("fake-string")
+    mock_blob_service.from_connection_string.assert_called_once()
+    assert mock_blob_service.from_connection_string.call_args.args == ("fake-string",)
     mock_service_client.get_blob_client.assert_called_once_with(
         container="test-container", blob="file.json"
     )
@@ -155,3 +202,172 @@ def test_read_blob_to_dict_raises_jsondecodeerror_on_invalid_json(mock_blob_serv
     # Exercise & Verify: Expect json.JSONDecodeError to be raised when parsing invalid data.
     with pytest.raises(json.JSONDecodeError):
         client.read_blob_to_dict(container="test-container", input_filename="bad.json")
+
+
+@patch("shared.functions.blob_client.Variables")
+@patch("shared.functions.blob_client.BlobServiceClient")
+def test_service_client_is_shared_across_instances_and_calls(mock_blob_service, mock_vars):
+    """
+    Test that a single BlobServiceClient is created lazily per connection string and reused
+    by every BlobClient instance and call.
+    """
+
+    # Setup: Two clients with the same connection string
+    mock_vars.return_value.blob_storage_connection_string = "conn-string"
+    first, second = BlobClient(source="backend", pool_maxsize=32), BlobClient(source="backend")
+
+    # Verify: No client is created before first use
+    mock_blob_service.from_connection_string.assert_not_called()
+
+    # Exercise: Read and write through both instances
+    first.export_dict_to_blob([{"key": "value"}], "container1", "output.json")
+    second.list_blob_filenames(container_name="container1")
+    second.export_dict_to_blob([{"key": "value"}], "container1", "output.json")
+
+    # Verify: One service client was created with a sized connection pool
+    mock_blob_service.from_connection_string.assert_called_once()
+    transport = mock_blob_service.from_connection_string.call_args.kwargs["transport"]
+    assert transport.session.get_adapter("https://account.blob.core.windows.net")._pool_maxsize == 32
+    assert first.blob_service_client is second.blob_service_client
+
+
+@patch("shared.functions.blob_client.Variables")
+@patch("shared.functions.blob_client.BlobServiceClient")
+def test_read_blobs_to_dicts_preserves_order_and_reports_errors(mock_blob_service, mock_vars):
+    """
+    Test that `read_blobs_to_dicts` reads blobs concurrently, returns results in input
+    order and returns the exception of a failed blob without aborting the batch.
+    """
+
+    # Setup: Blobs whose content is their own name, one of which holds invalid JSON
+    mock_vars.return_value.blob_storage_connection_string = "conn-string"
+
+    def get_blob_client(container, blob):
+        blob_client = MagicMock()
+        content = b"not-json" if blob == "bad.json" else json.dumps([blob]).encode()
+        blob_client.download_blob.return_value.readall.return_value = content
+        return blob_client
+
+    mock_blob_service.from_connection_string.return_value.get_blob_client.side_effect = get_blob_client
+    client = BlobClient(source="backend")
+    filenames = [f"file{i}.json" for i in range(10)] + ["bad.json", "last.json"]
+
+    # Exercise: Read all blobs in one batch
+    results = client.read_blobs_to_dicts(container="container1", input_filenames=filenames, max_workers=4)
+
+    # Verify: Results follow input order and the failure is reported in place
+    assert results[:10] == [[f"file{i}.json"] for i in range(10)]
+    assert isinstance(results[10], json.JSONDecodeError)
+    assert results[11] == ["last.json"]
+
+
+@patch("shared.functions.blob_client.Variables")
+@patch("shared.functions.blob_client.BlobServiceClient")
+def test_read_blob_bytes_skips_download_when_etag_matches(mock_blob_service, mock_vars):
+    """
+    Test that `read_blob_bytes` downloads conditionally on a known ETag, returning no
+    content when the blob is unchanged.
+    """
+
+    # Setup: A blob that responds 304 Not Modified to conditional downloads
+    mock_vars.return_value.blob_storage_connection_string = "conn-string"
+    mock_blob_client = MagicMock()
+    mock_blob_client.download_blob.side_effect = ResourceNotModifiedError("not modified")
+    mock_blob_service.from_connection_string.return_value.get_blob_client.return_value = mock_blob_client
+
+    # Exercise: Read the blob with its current ETag
+    content, etag = BlobClient(source="backend").read_blob_bytes(container="c", input_filename="a.json", etag='"v1"')
+
+    # Verify: No content is returned and the request was conditional
+    assert (content, etag) == (None, '"v1"')
+    assert mock_blob_client.download_blob.call_args.kwargs["etag"] == '"v1"'
+
+
+@patch("shared.functions.blob_client.Variables")
+@patch("shared.functions.blob_client.BlobServiceClient")
+def test_export_dict_to_blob_compresses_and_reads_back_transparently(mock_blob_service, mock_vars):
+    """
+    Test that gzip encoded uploads set the content properties, and that both compressed
+    and legacy uncompressed blobs are decoded transparently on read.
+    """
+
+    # Setup: A blob client that keeps the last uploaded content
+    mock_vars.return_value.blob_storage_connection_string = "conn-string"
+    mock_blob_client = MagicMock()
+    mock_blob_service.from_connection_string.return_value.get_blob_client.return_value = mock_blob_client
+    client = BlobClient(source="backend", encoding="gzip")
+    data = [{"repo": "repo1", "workflow_name": "build"}] * 50
+
+    # Exercise: Upload compressed data
+    client.export_dict_to_blob(data, "container1", "output.json")
+
+    # Verify: Content is gzip encoded and the blob properties describe it
+    uploaded = mock_blob_client.upload_blob.call_args.args[0]
+    content_settings = mock_blob_client.upload_blob.call_args.kwargs["content_settings"]
+    assert json.loads(gzip.decompress(uploaded)) == data
+    assert len(uploaded) < len(json.dumps(data)) / 10
+    assert (content_settings.content_encoding, content_settings.content_type) == ("gzip", "application/json")
+
+    # Verify: Compressed and uncompressed blobs read back to the same data
+    for content in [uploaded, json.dumps(data).encode()]:
+        mock_blob_client.download_blob.return_value.readall.return_value = content
+        assert client.read_blob_to_dict(container="container1", input_filename="output.json") == data
+
+
+def test_blob_client_rejects_unknown_encodings():
+    """
+    Test that an unsupported encoding is rejected when the client is created.
+    """
+    with pytest.raises(ValueError, match="Unsupported blob encoding"):
+        BlobClient(source="backend", encoding="brotli")
+
+
+@patch("shared.functions.blob_client.Variables")
+@patch("shared.functions.blob_client.BlobServiceClient")
+def test_export_dict_to_blob_skips_unchanged_content(mock_blob_service, mock_vars):
+    """
+    Test that uploads are skipped when the stored blob holds the same content and encoding,
+    returning the stored blob properties and counting the bytes saved.
+    """
+    # Setup: a stored blob whose metadata records the hash of the data
+    mock_vars.return_value.blob_storage_connection_string = "conn-string"
+    mock_blob_client = MagicMock()
+    mock_blob_service.from_connection_string.return_value.get_blob_client.return_value = mock_blob_client
+
+    uploaded_json = json.dumps([{"key": "value"}]).encode()
+    stored = mock_blob_client.get_blob_properties.return_value
+    stored.metadata = {"content_sha256": hashlib.sha256(uploaded_json).hexdigest()}
+    stored.content_settings.content_encoding = None
+
+    client = BlobClient(source="backend", json_codec="json")
+
+    # Exercise & Verify: unchanged content is not uploaded
+    properties = client.export_dict_to_blob([{"key": "value"}], "container1", "output.json")
+    assert properties == {"etag": stored.etag, "last_modified": stored.last_modified}
+    mock_blob_client.upload_blob.assert_not_called()
+
+    # Exercise & Verify: changed content, or a different encoding, is uploaded
+    client.export_dict_to_blob([{"key": "other"}], "container1", "output.json")
+    BlobClient(source="backend", encoding="gzip").export_dict_to_blob([{"key": "value"}], "container1", "output.json")
+    assert mock_blob_client.upload_blob.call_count == 2
+
+    # Verify: uploads and skipped bytes are reported
+    assert client.upload_summary() == {"uploaded": 1, "skipped": 1, "bytes_uploaded": len(uploaded_json),
+                                       "bytes_saved": len(uploaded_json)}
+
+
+@patch("shared.functions.blob_client.Variables")
+def test_migrate_blobs_rewrites_readable_blobs(mock_vars):
+    """
+    Test that `migrate_blobs` rewrites every readable blob with the configured encoding,
+    skipping blobs that fail to read.
+    """
+    client = BlobClient(source="backend", encoding="gzip")
+    client.list_blob_filenames = MagicMock(return_value=["workflows/a.json", "workflows/b.json"])
+    client.read_blobs_to_dicts = MagicMock(return_value=[[{"run_number": 1}], ValueError("corrupt")])
+    client.export_dict_to_blob = MagicMock()
+
+    assert client.migrate_blobs(container_name="project-monitoring", directory_path="workflows") == 1
+    client.export_dict_to_blob.assert_called_once_with(
+        data=[{"run_number": 1}], container="project-monitoring", output_filename="workflows/a.json"
+    )
@@ -0,0 +1,228 @@
+# Import dependencies
+from shared.functions.cached_blob_client import CachedBlobClient, BlobCache
+from shared.functions.blob_listing import diff_listings
+from unittest.mock import patch, MagicMock
+import pytest
+import json
+import gzip
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """
+    Forget shared caches so every test starts from its own cache directory.
+    """
+    CachedBlobClient.caches.clear()
+    CachedBlobClient.listing_cache.clear()
+    yield
+    CachedBlobClient.caches.clear()
+    CachedBlobClient.listing_cache.clear()
+
+
+def make_inner_client(blobs: dict) -> MagicMock:
+    """
+    Build a wrapped blob client serving blob bytes with an ETag per version.
+
+    Args: blobs (dict): Tuples of blob content and ETag, keyed by blob name.
+
+    Returns: MagicMock: The mocked client.
+    """
+    def read_blob_bytes(container, input_filename, etag=None):
+        content, current_etag = blobs[input_filename]
+        return (None, etag) if etag == current_etag else (content, current_etag)
+
+    client = MagicMock()
+    client.read_blob_bytes.side_effect = read_blob_bytes
+    return client
+
+
+@patch("shared.functions.cached_blob_client.time")
+def test_fresh_entries_are_served_without_requests(mock_time, tmp_path):
+    """
+    Test that a blob read within the staleness window is served from disk.
+    """
+    mock_time.time.return_value = 1000.0
+    inner = make_inner_client({"a.json": (b'{"a": 1}', '"v1"')})
+    client = CachedBlobClient(client=inner, cache_dir=str(tmp_path), max_age=60)
+
+    # Read the same blob twice within the window
+    assert client.read_blob_to_dict(container="c", input_filename="a.json") == {"a": 1}
+    mock_time.time.return_value = 1030.0
+    assert client.read_blob_to_dict(container="c", input_filename="a.json") == {"a": 1}
+
+    # Verify one download and one hit
+    assert inner.read_blob_bytes.call_count == 1
+    assert client.summary()["hits"] == 1
+    assert client.summary()["misses"] == 1
+
+
+@patch("shared.functions.cached_blob_client.time")
+def test_stale_entries_are_revalidated_with_etag(mock_time, tmp_path):
+    """
+    Test that stale entries are revalidated with their ETag, and only downloaded again
+    once the blob changed.
+    """
+    mock_time.time.return_value = 1000.0
+    blobs = {"a.json": (b'{"a": 1}', '"v1"')}
+    inner = make_inner_client(blobs)
+    client = CachedBlobClient(client=inner, cache_dir=str(tmp_path), max_age=0)
+    client.read_blob_to_dict(container="c", input_filename="a.json")
+
+    # Revalidate an unchanged blob
+    mock_time.time.return_value = 1001.0
+    assert client.read_blob_to_dict(container="c", input_filename="a.json") == {"a": 1}
+    inner.read_blob_bytes.assert_called_with(container="c", input_filename="a.json", etag='"v1"')
+
+    # Revalidate a changed blob
+    blobs["a.json"] = (b'{"a": 2}', '"v2"')
+    mock_time.time.return_value = 1002.0
+    assert client.read_blob_to_dict(container="c", input_filename="a.json") == {"a": 2}
+
+    summary = client.summary()
+    assert (summary["hits"], summary["misses"], summary["revalidations"]) == (1, 2, 2)
+    assert (summary["entries"], summary["bytes"]) == (1, len(b'{"a": 2}'))
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    """
+    Test that the least recently used blob is evicted once the cache exceeds its size bound.
+    """
+    inner = make_inner_client({name: (b"x" * 40, f'"{name}"') for name in ["a", "b", "c"]})
+    client = CachedBlobClient(client=inner, cache_dir=str(tmp_path), max_bytes=100)
+
+    # Fill the cache, touching "a" so "b" becomes least recently used
+    client.read_blob_bytes(container="c", input_filename="a")
+    client.read_blob_bytes(container="c", input_filename="b")
+    client.read_blob_bytes(container="c", input_filename="a")
+    client.read_blob_bytes(container="c", input_filename="c")
+
+    # Verify "b" was evicted and "a" is still served from disk
+    assert client.summary()["evictions"] == 1
+    assert client.cache.get(key="c/b") is None
+    assert client.cache.get(key="c/a")[0] == b"x" * 40
+
+
+def test_cache_survives_process_restarts(tmp_path):
+    """
+    Test that a new cache indexes the entries stored on disk by a previous one.
+    """
+    BlobCache(cache_dir=str(tmp_path)).put(key="c/a.json", content=b"[1]", etag='"v1"')
+
+    cache = BlobCache(cache_dir=str(tmp_path))
+    content, meta = cache.get(key="c/a.json")
+
+    assert content == b"[1]"
+    assert meta["etag"] == '"v1"'
+
+
+def test_writes_invalidate_cached_entries(tmp_path):
+    """
+    Test that exporting through the cached client writes through and invalidates the cached blob.
+    """
+    inner = make_inner_client({"a.json": (json.dumps([1]).encode(), '"v1"')})
+    client = CachedBlobClient(client=inner, cache_dir=str(tmp_path))
+    client.read_blob_to_dict(container="c", input_filename="a.json")
+
+    client.export_dict_to_blob(data=[2], container="c", output_filename="a.json")
+
+    inner.export_dict_to_blob.assert_called_once_with(data=[2], container="c", output_filename="a.json")
+    assert client.cache.get(key="c/a.json") is None
+
+
+def test_compressed_blobs_are_cached_encoded_and_decoded_on_read(tmp_path):
+    """
+    Test that gzip encoded blobs are cached as stored and decoded when read.
+    """
+    content = gzip.compress(json.dumps([1, 2]).encode())
+    inner = make_inner_client({"a.json": (content, '"v1"')})
+    client = CachedBlobClient(client=inner, cache_dir=str(tmp_path))
+
+    assert client.read_blob_to_dict(container="c", input_filename="a.json") == [1, 2]
+    assert client.cache.get(key="c/a.json")[0] == content
+
+
+def test_batch_reads_are_served_through_the_cache(tmp_path):
+    """
+    Test that batch reads go through the cache, in input order, reporting a missing blob in place.
+    """
+    inner = make_inner_client({"a.json": (b"[1]", '"v1"'), "b.json": (b"[2]", '"v1"')})
+    client = CachedBlobClient(client=inner, cache_dir=str(tmp_path))
+    client.read_blob_to_dict(container="c", input_filename="a.json")
+
+    results = client.read_blobs_to_dicts(container="c", input_filenames=["b.json", "missing.json", "a.json"])
+
+    # Verify the cached blob was not downloaded again
+    assert results[0] == [2] and results[2] == [1]
+    assert isinstance(results[1], KeyError)
+    assert inner.read_blob_bytes.call_count == 3
+
+
+@patch("shared.functions.blob_listing.time")
+def test_listings_are_served_from_shared_snapshots(mock_time, tmp_path):
+    """
+    Test that listings within the TTL are served from a snapshot shared by every instance,
+    including listings of longer prefixes, and that writes and expiry force a new listing.
+    """
+    mock_time.time.return_value = 1000.0
+    inner = MagicMock()
+    inner.list_blob_properties.return_value = [
+        {"name": "runs/repo1/build/2025-01.json", "size": 10, "last_modified": None, "etag": '"v1"'},
+        {"name": "runs/repo2/test/2025-01.json", "size": 20, "last_modified": None, "etag": '"v1"'},
+    ]
+
+    # List the prefix from two instances, and a longer prefix it covers
+    first = CachedBlobClient(client=inner, cache_dir=str(tmp_path), listing_ttl=30)
+    second = CachedBlobClient(client=inner, cache_dir=str(tmp_path), listing_ttl=30)
+    assert first.list_blob_filenames(container_name="c", directory_path="runs/") == \
+        ["runs/repo1/build/2025-01.json", "runs/repo2/test/2025-01.json"]
+    assert second.list_blob_filenames(container_name="c", directory_path="runs/repo1/") == \
+        ["runs/repo1/build/2025-01.json"]
+    assert inner.list_blob_properties.call_count == 1
+
+    # Verify writes under the prefix invalidate the snapshot
+    first.export_dict_to_blob(data=[], container="c", output_filename="runs/repo1/build/2025-02.json")
+    first.list_blob_filenames(container_name="c", directory_path="runs/")
+    assert inner.list_blob_properties.call_count == 2
+
+    # Verify expired snapshots are listed again
+    mock_time.time.return_value = 1031.0
+    first.list_blob_filenames(container_name="c", directory_path="runs/")
+    assert inner.list_blob_properties.call_count == 3
+    assert first.summary()["listing_hits"] == 1
+
+
+def test_fresh_entries_are_revalidated_when_the_listing_shows_a_new_etag(tmp_path):
+    """
+    Test that a cached entry within the staleness window is revalidated when a listing
+    snapshot reports another ETag, so reads keyed on that listing never return older content.
+    """
+    blobs = {"a.json": (b'{"a": 1}', '"e1"')}
+    inner = make_inner_client(blobs)
+    inner.list_blob_properties.side_effect = lambda container_name, directory_path: [
+        {"name": name, "size": len(content), "last_modified": None, "etag": etag}
+        for name, (content, etag) in blobs.items()
+    ]
+    client = CachedBlobClient(client=inner, cache_dir=str(tmp_path), max_age=60)
+
+    # Cache the first version, then overwrite the blob as a scrape would
+    assert client.read_blob_to_dict(container="c", input_filename="a.json") == {"a": 1}
+    blobs["a.json"] = (b'{"a": 2}', '"e2"')
+
+    # Verify the entry is still served while no listing shows the change
+    assert client.read_blob_to_dict(container="c", input_filename="a.json") == {"a": 1}
+
+    # Verify the new version is read once the listing shows its ETag
+    assert client.list_blob_properties(container_name="c", directory_path="")[0]["etag"] == '"e2"'
+    assert client.read_blob_to_dict(container="c", input_filename="a.json") == {"a": 2}
+    assert client.read_blob_bytes(container="c", input_filename="a.json")[1] == '"e2"'
+    assert inner.read_blob_bytes.call_count == 2
+
+
+def test_diff_listings_detects_changes_by_etag():
+    """
+    Test that snapshot diffs report added, removed and changed blobs from their ETags.
+    """
+    previous = [{"name": "a.json", "etag": '"v1"'}, {"name": "b.json", "etag": '"v1"'}]
+    current = [{"name": "a.json", "etag": '"v2"'}, {"name": "c.json", "etag": '"v1"'}]
+
+    assert diff_listings(previous=previous, current=current) == \
+        {"added": ["c.json"], "removed": ["b.json"], "changed": ["a.json"]}
@@ -0,0 +1,55 @@
+# Import dependencies
+from shared.functions.columnar import runs_to_parquet, parquet_to_dataframe, columnar_blob_name
+from shared.models import WorkflowRun
+import pandas as pd
+
+def make_runs() -> list:
+    """
+    Build a small run history mixing typed records, dictionaries and missing values.
+
+    Returns: list: Run records, newest first.
+    """
+    return [
+        WorkflowRun(repo="repo1", workflow_name="build", active_status="active", status="completed",
+                    conclusion="success", created_at="2025-01-02T00:00:00Z", updated_at="2025-01-02T00:05:00Z",
+                    run_number=2, html_url="https://github.com/powellrhys/repo1/actions/runs/2",
+                    duration_seconds=300.0),
+        {"repo": "repo1", "workflow_name": "build", "active_status": "active", "status": "in_progress",
+         "conclusion": None, "created_at": "2025-01-01T00:00:00Z", "updated_at": None, "run_number": 1,
+         "html_url": "https://github.com/powellrhys/repo1/actions/runs/1", "duration_seconds": None},
+    ]
+
+
+def test_parquet_round_trip_produces_typed_columns():
+    """
+    Test that a run history written to Parquet reads back with categorical, UTC timestamp
+    and integer columns, and the same values.
+    """
+    df = parquet_to_dataframe(content=runs_to_parquet(runs=make_runs()))
+
+    # Verify column types
+    assert isinstance(df["repo"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["conclusion"].dtype, pd.CategoricalDtype)
+    assert str(df["created_at"].dtype).startswith("datetime64") and str(df["created_at"].dt.tz) == "UTC"
+    assert str(df["run_number"].dtype) == "Int64"
+
+    # Verify values, including missing ones
+    assert df["run_number"].tolist() == [2, 1]
+    assert df["created_at"].iloc[0] == pd.Timestamp("2025-01-02T00:00:00Z")
+    assert pd.isna(df["updated_at"].iloc[1]) and pd.isna(df["conclusion"].iloc[1])
+
+
+def test_parquet_read_projects_columns():
+    """
+    Test that only the requested columns are read.
+    """
+    df = parquet_to_dataframe(content=runs_to_parquet(runs=make_runs()), columns=["created_at", "duration_seconds"])
+
+    assert list(df.columns) == ["created_at", "duration_seconds"]
+
+
+def test_columnar_blob_name():
+    """
+    Test that columnar copies are stored apart from the JSON workflow histories.
+    """
+    assert columnar_blob_name(repo="repo1", workflow_name="build") == "columnar/repo1_build.parquet"
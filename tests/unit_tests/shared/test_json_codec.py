@@ -0,0 +1,68 @@
+# Import dependencies
+from shared.functions.json_codec import JSON_CODECS, check_codec, encode_json, decode_json, decode_runs
+from shared.models import WorkflowRun
+import pytest
+import json
+
+def installed_codecs() -> list:
+    """
+    List the JSON codecs whose package is installed.
+
+    Returns: list: The installed codec names.
+    """
+    codecs = []
+    for codec in JSON_CODECS:
+        try:
+            check_codec(codec=codec)
+            codecs.append(codec)
+        except ValueError:
+            pass
+
+    return codecs
+
+
+@pytest.mark.parametrize("codec", installed_codecs())
+def test_codecs_round_trip_to_the_same_values(codec):
+    """
+    Test that every codec serializes typed records and dictionaries to the same JSON values
+    as the stdlib, and decodes them back.
+    """
+    data = [WorkflowRun(repo="repo1", workflow_name="build", run_number=1, duration_seconds=12.5),
+            {"repo": "répo", "nested": {"a": [1, None, True]}}]
+
+    content = encode_json(data=data, codec=codec, default=lambda obj: obj.to_dict())
+
+    expected = json.loads(json.dumps(data, default=lambda obj: obj.to_dict()))
+    assert json.loads(content) == expected
+    assert decode_json(content=content, codec=codec) == expected
+
+
+@pytest.mark.parametrize("codec", installed_codecs())
+def test_decode_runs_builds_typed_records(codec):
+    """
+    Test that run histories decode into typed records, ignoring unknown keys and tolerating
+    records with missing fields.
+    """
+    content = b'[{"repo": "repo1", "workflow_name": "build", "run_number": 2, "extra": 1}, {"run_number": 1}]'
+
+    runs = decode_runs(content=content, codec=codec)
+
+    assert runs[0] == WorkflowRun(repo="repo1", workflow_name="build", run_number=2)
+    assert runs[1].run_number == 1 and runs[1].repo is None
+
+
+@pytest.mark.parametrize("codec", installed_codecs())
+def test_invalid_json_raises_json_decode_error(codec):
+    """
+    Test that every codec reports invalid JSON as a `json.JSONDecodeError`.
+    """
+    with pytest.raises(json.JSONDecodeError):
+        decode_json(content=b"{invalid-json}", codec=codec)
+
+
+def test_unknown_codec_is_rejected():
+    """
+    Test that unknown codecs are rejected.
+    """
+    with pytest.raises(ValueError, match="Unsupported JSON codec"):
+        check_codec(codec="ujson")
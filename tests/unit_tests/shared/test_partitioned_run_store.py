@@ -0,0 +1,109 @@
+# Import dependencies
+from shared.functions.partitioned_run_store import PartitionedRunStore
+from unittest.mock import MagicMock
+from shared.models import WorkflowRun
+import pytest
+
+def make_run(run_number: int, created_at: str) -> dict:
+    """
+    Build a stored run dictionary.
+
+    Args:
+        run_number (int): The run number.
+        created_at (str): ISO 8601 creation timestamp.
+
+    Returns: dict: The run dictionary.
+    """
+    return {"repo": "repo1", "workflow_name": "build", "run_number": run_number, "created_at": created_at}
+
+
+def test_write_runs_only_rewrites_partitions_holding_new_runs(make_client):
+    """
+    Test that runs are merged into their monthly partition, and older partitions are left untouched.
+    """
+    blobs = {
+        "runs/repo1/build/2025-01.json": [make_run(1, "2025-01-05T00:00:00Z")],
+        "runs/repo1/build/2025-02.json": [make_run(2, "2025-02-01T00:00:00Z")],
+    }
+    client = make_client(blobs=blobs)
+    store = PartitionedRunStore(client=client)
+
+    # Write a new run and a refreshed copy of a stored one
+    result = store.write_runs(repo="repo1", workflow="build", runs=[
+        WorkflowRun(repo="repo1", workflow_name="build", run_number=3, created_at="2025-02-03T00:00:00Z"),
+        make_run(2, "2025-02-01T00:00:00Z"),
+    ])
+
+    # Verify only the current partition was rewritten, newest first
+    assert result["written"] == ["runs/repo1/build/2025-02.json"]
+    assert result["added"] == 1
+    assert [run["run_number"] for run in blobs["runs/repo1/build/2025-02.json"]] == [3, 2]
+    client.export_dict_to_blob.assert_called_once()
+
+    # Verify unchanged partitions are not rewritten
+    result = store.write_runs(repo="repo1", workflow="build", runs=[make_run(1, "2025-01-05T00:00:00Z")])
+    assert result == {"written": [], "added": 0, "properties": None}
+
+
+def test_read_runs_fetches_only_needed_partitions(make_client):
+    """
+    Test that limited reads stop at the newest partitions, and time range reads skip
+    partitions outside the range.
+    """
+    blobs = {
+        "runs/repo1/build/2024-12.json": [make_run(1, "2024-12-30T00:00:00Z")],
+        "runs/repo1/build/2025-01.json": [make_run(3, "2025-01-20T00:00:00Z"), make_run(2, "2025-01-02T00:00:00Z")],
+        "runs/repo1/build/2025-02.json": [make_run(4, "2025-02-01T00:00:00Z")],
+    }
+    client = make_client(blobs=blobs)
+    store = PartitionedRunStore(client=client)
+
+    # Read the two most recent runs
+    runs = store.read_runs(repo="repo1", workflow="build", limit=2)
+    assert [run["run_number"] for run in runs] == [4, 3]
+    assert [call.kwargs["input_filename"] for call in client.read_blob_to_dict.call_args_list] == \
+        ["runs/repo1/build/2025-02.json", "runs/repo1/build/2025-01.json"]
+
+    # Read a time range spanning a partition boundary
+    client.read_blob_to_dict.reset_mock()
+    runs = store.read_runs(repo="repo1", workflow="build", since="2024-12-15T00:00:00Z", until="2025-01-10T00:00:00Z")
+    assert [run["run_number"] for run in runs] == [2, 1]
+    assert "runs/repo1/build/2025-02.json" not in \
+        [call.kwargs["input_filename"] for call in client.read_blob_to_dict.call_args_list]
+
+
+def test_list_workflows_and_missing_histories(make_client):
+    """
+    Test that partitioned workflows are listed, and workflows without partitions read as empty.
+    """
+    store = PartitionedRunStore(client=make_client(blobs={
+        "runs/repo1/build/2025-01.json": [make_run(1, "2025-01-05T00:00:00Z")],
+        "runs/repo2/deploy/2025-01.json": [],
+    }))
+
+    assert store.list_workflows() == [("repo1", "build"), ("repo2", "deploy")]
+    assert store.read_runs(repo="repo1", workflow="test") == []
+    assert store.read_dataframe(repo="repo1", workflow="test") is None
+
+
+def test_workflow_names_with_slashes_are_encoded_in_partition_names(make_client):
+    """
+    Test that workflow names holding "/" or "%" are stored under a single encoded path
+    segment, and decoded when the workflows are listed.
+    """
+    blobs = {}
+    store = PartitionedRunStore(client=make_client(blobs=blobs))
+
+    store.write_runs(repo="repo1", workflow="ci/cd 100%", runs=[make_run(1, "2025-01-05T00:00:00Z")])
+
+    assert list(blobs) == ["runs/repo1/ci%2Fcd 100%25/2025-01.json"]
+    assert store.list_workflows() == [("repo1", "ci/cd 100%")]
+    assert [run["run_number"] for run in store.read_runs(repo="repo1", workflow="ci/cd 100%")] == [1]
+
+
+def test_unsupported_partition_format():
+    """
+    Test that unknown partition formats are rejected.
+    """
+    with pytest.raises(ValueError):
+        PartitionedRunStore(client=MagicMock(), partition_format="csv")
@@ -0,0 +1,110 @@
+# Import dependencies
+from shared.functions.run_rollups import RollupStore, histogram_percentile, duration_bin, period_start
+from shared.models import WorkflowRun
+import pytest
+
+def make_run(run_number: int, created_at: str, conclusion: str = "success", status: str = "completed",
+             duration_seconds: float = 60.0) -> WorkflowRun:
+    """
+    Build a run record.
+
+    Args:
+        run_number (int): The run number.
+        created_at (str): ISO 8601 creation timestamp.
+        conclusion (str): The conclusion of the run.
+        status (str): The status of the run.
+        duration_seconds (float): Duration of the run in seconds.
+
+    Returns: WorkflowRun: The run record.
+    """
+    return WorkflowRun(repo="repo1", workflow_name="build", run_number=run_number, created_at=created_at,
+                       conclusion=conclusion, status=status, duration_seconds=duration_seconds)
+
+
+def test_histogram_percentiles_are_within_accuracy():
+    """
+    Test that percentiles estimated from the duration histogram are within 1% of the exact values.
+    """
+    durations = [float(seconds) for seconds in range(1, 1001)]
+    histogram = {}
+    for seconds in durations:
+        histogram[duration_bin(seconds=seconds)] = histogram.get(duration_bin(seconds=seconds), 0) + 1
+
+    for percentile, exact in [(0.5, 500.0), (0.9, 900.0), (0.99, 990.0)]:
+        assert histogram_percentile(histogram=histogram, percentile=percentile) == pytest.approx(exact, rel=0.015)
+    assert histogram_percentile(histogram={}, percentile=0.5) is None
+
+
+def test_period_start_groups_weeks_from_monday():
+    """
+    Test that runs are grouped into days and ISO weeks starting on Monday.
+    """
+    assert period_start(created_at="2025-01-08T23:00:00Z", granularity="daily") == "2025-01-08"
+    assert period_start(created_at="2025-01-08T23:00:00Z", granularity="weekly") == "2025-01-06"
+
+
+def test_workflow_rollups_count_only_new_and_completed_runs(make_client):
+    """
+    Test that workflow rollups are updated from new runs only, runs in progress are counted
+    once they complete, and repository rollups are rebuilt as the sum of their workflow rollups.
+    """
+    blobs = {}
+    store = RollupStore(client=make_client(blobs=blobs))
+
+    # Count an initial history holding a run in progress
+    store.update_workflow_rollup(repo="repo1", workflow="build", runs=[
+        make_run(3, "2025-01-07T00:00:00Z", conclusion=None, status="in_progress"),
+        make_run(2, "2025-01-06T12:00:00Z", conclusion="failure", duration_seconds=30.0),
+        make_run(1, "2025-01-06T00:00:00Z"),
+    ])
+    rollup = blobs["rollups/workflows/repo1/build.json"]
+    assert rollup["last_run_number"] == 3
+    assert rollup["pending"] == [3]
+    assert rollup["daily"]["2025-01-06"]["runs"] == 2
+    assert rollup["daily"]["2025-01-06"]["success_rate"] == 0.5
+
+    # Re-scrape the history with the pending run completed and a new run
+    store.update_workflow_rollup(repo="repo1", workflow="build", runs=[
+        make_run(4, "2025-01-08T00:00:00Z"),
+        make_run(3, "2025-01-07T00:00:00Z"),
+        make_run(2, "2025-01-06T12:00:00Z", conclusion="failure", duration_seconds=30.0),
+    ])
+    rollup = blobs["rollups/workflows/repo1/build.json"]
+    assert rollup["pending"] == []
+    assert list(rollup["daily"]) == ["2025-01-06", "2025-01-07", "2025-01-08"]
+    assert rollup["weekly"]["2025-01-06"]["runs"] == 4
+    assert rollup["weekly"]["2025-01-06"]["failure_rate"] == 0.25
+    assert rollup["weekly"]["2025-01-06"]["p50"] == pytest.approx(60.0, rel=0.015)
+
+    # Verify unchanged histories are not uploaded again
+    uploads = store.client.export_dict_to_blob.call_count
+    store.update_workflow_rollup(repo="repo1", workflow="build", runs=[make_run(4, "2025-01-08T00:00:00Z")])
+    assert store.client.export_dict_to_blob.call_count == uploads
+
+    # Verify the repository trend sums the stored workflow rollups
+    store.update_workflow_rollup(repo="repo1", workflow="deploy", runs=[make_run(1, "2025-01-13T00:00:00Z")])
+    store.rebuild_repo_rollup(repo="repo1")
+    trend = store.read_trend(repo="repo1", granularity="weekly")
+    assert trend == [{"period": "2025-01-06", "runs": 4, "success_rate": 0.75, "failure_rate": 0.25,
+                      "p50": pytest.approx(60.0, rel=0.015), "p90": pytest.approx(60.0, rel=0.015),
+                      "p99": pytest.approx(60.0, rel=0.015)},
+                     {"period": "2025-01-13", "runs": 1, "success_rate": 1.0, "failure_rate": 0.0,
+                      "p50": pytest.approx(60.0, rel=0.015), "p90": pytest.approx(60.0, rel=0.015),
+                      "p99": pytest.approx(60.0, rel=0.015)}]
+
+
+def test_missing_rollups_are_built_from_the_full_history(make_client):
+    """
+    Test that a workflow without a rollup is counted from its complete history, and unknown
+    granularities are rejected.
+    """
+    blobs = {}
+    store = RollupStore(client=make_client(blobs=blobs))
+
+    store.update_workflow_rollup(repo="repo1", workflow="build", runs=[make_run(2, "2025-01-07T00:00:00Z")],
+                                 read_history=lambda: [make_run(2, "2025-01-07T00:00:00Z"),
+                                                       make_run(1, "2025-01-01T00:00:00Z")])
+    assert [row["runs"] for row in store.read_trend(repo="repo1", workflow="build")] == [1, 1]
+
+    with pytest.raises(ValueError):
+        store.read_trend(repo="repo1", granularity="monthly")
@@ -0,0 +1,65 @@
+# Import dependencies
+from shared.functions.run_schema import apply_run_schema, build_runs_dataframe, run_dtypes, to_utc_datetime
+from shared.functions import run_schema
+from shared.models import WorkflowRun
+from unittest.mock import patch
+import pandas as pd
+import pytest
+
+def test_build_runs_dataframe_types_every_column():
+    """
+    Test that runs are built into a DataFrame with categorical, datetime, nullable integer
+    and string columns, keeping missing values missing.
+    """
+    df = build_runs_dataframe(runs=[
+        WorkflowRun(repo="repo1", workflow_name="build", active_status="active", status="completed",
+                    conclusion="success", created_at="2025-01-01T00:00:00Z", updated_at="2025-01-01T00:02:00Z",
+                    run_number=2, html_url="https://github.com/powellrhys/repo1/actions/runs/2",
+                    duration_seconds=120.0),
+        {"repo": "repo1", "workflow_name": "build", "created_at": "2025-01-01T00:00:00+00:00", "run_number": None},
+    ])
+
+    # Verify every column holds its schema dtype
+    assert df.dtypes.to_dict() == run_dtypes()
+
+    # Verify values and missing values
+    assert list(df["repo"].cat.categories) == ["repo1"]
+    assert df["created_at"].iloc[1] == pd.Timestamp("2025-01-01T00:00:00Z")
+    assert df["run_number"].iloc[0] == 2
+    assert pd.isna(df["run_number"].iloc[1])
+    assert pd.isna(df["updated_at"].iloc[1])
+
+
+def test_apply_run_schema_keeps_typed_and_unknown_columns():
+    """
+    Test that projected DataFrames are typed without adding columns, and columns outside
+    the schema are left untouched.
+    """
+    df = build_runs_dataframe(runs=[{"repo": "repo1", "duration_seconds": 5}], columns=["repo", "duration_seconds"])
+    assert list(df.columns) == ["repo", "duration_seconds"]
+    assert isinstance(df["repo"].dtype, pd.CategoricalDtype)
+
+    # Verify categories already set are kept, and extra columns are not cast
+    df["label"] = ["a"]
+    typed = apply_run_schema(df=df.copy())
+    assert typed["repo"].dtype == df["repo"].dtype
+    assert typed["label"].dtype == df["label"].dtype
+
+
+@pytest.mark.parametrize("arrow", [True, False])
+def test_to_utc_datetime_parses_github_and_other_timestamps(arrow):
+    """
+    Test that GitHub and offset timestamps are parsed, with or without pyarrow, missing values
+    become NaT and invalid values are coerced or raised.
+    """
+    timestamps = pd.Series(["2025-01-01T12:00:00Z", None, "2025-01-01T13:00:00+01:00", "bad"], dtype=object)
+
+    with patch("shared.functions.run_schema.pyarrow", run_schema.pyarrow if arrow else None):
+        parsed = to_utc_datetime(timestamps=timestamps, errors="coerce")
+        with pytest.raises(ValueError):
+            to_utc_datetime(timestamps=timestamps)
+
+    # Verify values, missing values and the UTC dtype
+    assert parsed.iloc[0] == parsed.iloc[2] == pd.Timestamp("2025-01-01T12:00:00Z")
+    assert parsed.iloc[1:4:2].isna().all()
+    assert parsed.dtype == pd.DatetimeTZDtype(unit="us", tz="UTC")
@@ -0,0 +1,65 @@
+# Import dependencies
+from shared.models import WorkflowRun
+import pytest
+
+def test_workflow_run_round_trips_stored_records():
+    """
+    Test that `from_dict` and `to_dict` round trip a stored run record, keeping the
+    key order of the records produced by `aggregate_workflow_data`.
+    """
+
+    # Simulate a stored run record
+    stored = {
+        "repo": "repo1",
+        "workflow_name": "build",
+        "active_status": "active",
+        "status": "completed",
+        "conclusion": "success",
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": "2025-01-01T00:01:00Z",
+        "run_number": 7,
+        "html_url": "https://github.com/powellrhys/repo1/actions/runs/7",
+        "duration_seconds": 60.0
+    }
+
+    record = WorkflowRun.from_dict(stored)
+
+    # Verify the record converts back to an identical dictionary
+    assert record.to_dict() == stored
+    assert list(record.to_dict()) == list(stored)
+
+
+def test_workflow_run_ignores_unknown_keys_and_fills_missing_fields():
+    """
+    Test that `from_dict` drops unknown keys and defaults missing fields to None.
+    """
+    record = WorkflowRun.from_dict({"repo": "repo1", "workflow_name": "build", "unknown": 1})
+
+    assert record.run_number is None
+    assert "unknown" not in record.to_dict()
+
+
+def test_workflow_run_interns_repeated_strings_and_has_no_instance_dict():
+    """
+    Test that records are slotted and share low-cardinality string objects.
+    """
+    # Build equal strings that are distinct objects
+    first = WorkflowRun(repo="".join(["repo", "1"]), workflow_name="build", conclusion="".join(["succ", "ess"]))
+    second = WorkflowRun(repo="".join(["repo", "1"]), workflow_name="build", conclusion="".join(["succ", "ess"]))
+
+    # Verify strings are shared and records have no __dict__
+    assert first.repo is second.repo
+    assert first.conclusion is second.conclusion
+    assert not hasattr(first, "__dict__")
+
+
+def test_workflow_run_supports_dictionary_style_access():
+    """
+    Test that record fields can be read with subscripts, and unknown keys raise KeyError.
+    """
+    record = WorkflowRun(repo="repo1", workflow_name="build", run_number=3)
+
+    assert record["run_number"] == 3
+
+    with pytest.raises(KeyError, match="missing not found in WorkflowRun"):
+        record["missing"]